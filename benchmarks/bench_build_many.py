@@ -0,0 +1,46 @@
+"""
+Benchmark of `build_many` over a process pool.
+
+Builds a batch of distinct template snippets with 1, 2, 4, and 8
+workers and reports templates per second. Snippets differ in their
+literal text, and the shared caches are cleared before every run.
+
+Usage
+-----
+    $ python -m benchmarks.bench_build_many
+"""
+
+import os
+import time
+
+from textfsmgen.core import STATEMENT_CACHE
+from textfsmgen.core import TEMPLATE_BUILD_CACHE
+from textfsmgen.core import build_many
+
+TOTAL = 600
+SNIPPETS = [
+    f"Interface{index}: word(var_intf)  mtu digits(var_mtu)\n"
+    f"  Status {index}: letters(var_status) -> Record\n"
+    f"Title{index}       Price       Genre\n"
+    f"mixed_words(var_title)   number(var_price)   words(var_genre) -> Record"
+    for index in range(TOTAL)
+]
+
+
+def measure(workers):
+    """Print the number of templates built per second."""
+    # Forked workers inherit the caches, so start every run cold.
+    STATEMENT_CACHE.clear()
+    TEMPLATE_BUILD_CACHE.clear()
+    start = time.perf_counter()
+    results = build_many(SNIPPETS, workers=workers)
+    elapsed = time.perf_counter() - start
+    errors = sum(bool(result["error"]) for result in results)
+    print(f"{workers:>2} worker(s){TOTAL / elapsed:>12,.0f} templates/s"
+          f"{errors:>6} error(s)")
+
+
+if __name__ == "__main__":
+    print(f"{TOTAL} snippets, {os.cpu_count()} CPU(s)")
+    for count in (1, 2, 4, 8):
+        measure(count)
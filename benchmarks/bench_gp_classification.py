@@ -0,0 +1,68 @@
+"""
+Micro-benchmark for token classification in `textfsmgen.gp`.
+
+Compares the legacy matching strategy, which formats ``f"{pattern}$"``
+and calls `re.match` with a pattern string on every check, against the
+precompiled `PATTERN_REGISTRY` matchers, and reports the end-to-end
+throughput of `TranslatedPattern.do_factory_create`.
+
+Usage
+-----
+    $ python -m benchmarks.bench_gp_classification
+"""
+
+import re
+import timeit
+
+from textfsmgen.gp import PATTERN_REGISTRY
+from textfsmgen.gp import TranslatedPattern
+
+TOKENS = [
+    "up", "down", "0", "1500", "Gi0/1", "Ethernet1/1", "12:30:01",
+    "1.5", "-", "--", "10%", "(1.1)", "a b", "admin down", "x!y",
+]
+
+PATTERNS = [
+    PATTERN_REGISTRY.get_pattern(name) for name in [
+        "digit", "digits", "number", "letter", "letters", "alphabet_numeric",
+        "word", "punct", "puncts", "puncts_or_phrase", "puncts_or_group",
+        "graph", "mixed_number", "mixed_word", "words", "word_or_group",
+        "mixed_words", "mixed_word_or_group", "non_whitespace",
+        "non_whitespaces", "non_whitespaces_or_phrase", "non_whitespaces_or_group",
+    ]
+]
+
+
+def classify_legacy():
+    """Classify every token by its first matching pattern using `re.match`."""
+    for token in TOKENS:
+        for pattern in PATTERNS:
+            if re.match(f"{pattern}$", token):
+                break
+
+
+def classify_registry():
+    """Classify every token by its first matching pattern using the registry."""
+    for token in TOKENS:
+        for pattern in PATTERNS:
+            if PATTERN_REGISTRY.get_matcher(pattern)(token):
+                break
+
+
+def create_factory():
+    """Create a translated pattern for every token."""
+    for token in TOKENS:
+        TranslatedPattern.do_factory_create(token)
+
+
+def report(label, func, number=2000):
+    """Print classifications per second for `func`."""
+    elapsed = min(timeit.repeat(func, number=number, repeat=3))
+    rate = len(TOKENS) * number / elapsed
+    print(f"{label:<32}{rate:>14,.0f} classifications/s")
+
+
+if __name__ == "__main__":
+    report("re.match(f'{pattern}$')", classify_legacy)
+    report("PATTERN_REGISTRY fullmatch", classify_registry)
+    report("do_factory_create", create_factory)
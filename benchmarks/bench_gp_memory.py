@@ -0,0 +1,44 @@
+"""
+Memory benchmark for `textfsmgen.gp` objects.
+
+Measures, with `tracemalloc`, the number of bytes retained per
+`TranslatedPattern` and `LData` instance when thousands of them are
+alive at once, as happens during tabular and diff template generation.
+
+Usage
+-----
+    $ python -m benchmarks.bench_gp_memory
+"""
+
+import tracemalloc
+
+from textfsmgen.gp import LData
+from textfsmgen.gp import TranslatedPattern
+
+TOKENS = ["up", "down", "0", "1500", "Gi0/1", "1.5", "-", "admin down"]
+TOTAL = 20000
+
+
+def measure(label, factory):
+    """Print the bytes retained per instance created by `factory`."""
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    instances = [factory(index) for index in range(TOTAL)]
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = snapshot.compare_to(baseline, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    print(f"{label:<24}{size / len(instances):>10,.1f} bytes/instance")
+
+
+if __name__ == "__main__":
+    measure(
+        "TranslatedPattern",
+        lambda index: TranslatedPattern.do_factory_create(TOKENS[index % len(TOKENS)]),
+    )
+    measure(
+        "TranslatedPattern (x3)",
+        lambda index: TranslatedPattern.do_factory_create(*TOKENS[index % 4:index % 4 + 3]),
+    )
+    measure("LData", lambda index: LData(f"  line {index % 10}  "))
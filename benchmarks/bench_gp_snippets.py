@@ -0,0 +1,42 @@
+"""
+Throughput benchmark for `textfsmgen.gp` snippet generation.
+
+Measures how many regex patterns and template snippets per second are
+produced from already classified `TranslatedPattern` nodes, with and
+without the lessen flag, which resolves `actual_name`, `lessen_name`,
+and `lessen_pattern` for every call.
+
+Usage
+-----
+    $ python -m benchmarks.bench_gp_snippets
+"""
+
+import time
+
+from textfsmgen.gp import TranslatedPattern
+
+TOKENS = [
+    "up", "admin down", "0", "1500", "Gi0/1", "1.5", "-", "- -",
+    "a, b-c", "TenGigabitEthernet1/0/1 is up", "xé", "10%",
+]
+TOTAL = 200000
+
+
+def measure(label, func):
+    """Print the number of calls of `func` completed per second."""
+    nodes = [TranslatedPattern.do_factory_create(token) for token in TOKENS]
+    start = time.perf_counter()
+    for index in range(TOTAL):
+        func(nodes[index % len(nodes)])
+    elapsed = time.perf_counter() - start
+    print(f"{label:<36}{TOTAL / elapsed:>12,.0f} calls/s")
+
+
+if __name__ == "__main__":
+    measure("get_regex_pattern", lambda node: node.get_regex_pattern())
+    measure("get_regex_pattern(is_lessen)",
+            lambda node: node.get_regex_pattern(is_lessen=True))
+    measure("get_template_snippet(var)",
+            lambda node: node.get_template_snippet(var="v0"))
+    measure("get_template_snippet(var, is_lessen)",
+            lambda node: node.get_template_snippet(var="v0", is_lessen=True))
@@ -0,0 +1,52 @@
+"""
+Benchmark of failed-then-retried pattern generation.
+
+A recommendation between two translated patterns whose class pair is not
+implemented raises `NotImplementRecommendedRTPattern`; the caller then
+retries by classifying both values together, as the diff and category
+fallbacks do. The benchmark compares raising through genericlib, which
+creates a new exception class per raise, with raising through
+`RUNTIME_ERROR_REGISTRY`, which reuses one class per name.
+
+Usage
+-----
+    $ python -m benchmarks.bench_runtime_errors
+"""
+
+import time
+
+from textfsmgen.deps import genericlib_raise_runtime_error
+from textfsmgen.exceptions import RuntimeException
+from textfsmgen.gp import TranslatedPattern
+
+TOTAL = 50000
+
+
+def raise_by_genericlib(name, msg):
+    """Raise the way `RuntimeException` did before the registry existed."""
+    genericlib_raise_runtime_error(obj=name, msg=msg)
+
+
+def generate_with_retry(node1, node2, raise_error):
+    """Fail on an unsupported recommendation, then retry with the factory."""
+    try:
+        if not TranslatedPattern.try_recommend_pattern(node1, node2):
+            raise_error("NotImplementRecommendedRTPattern", "not implemented")
+    except Exception:   # noqa
+        return TranslatedPattern.do_factory_create(node1.data, node2.data)
+
+
+def measure(label, raise_error):
+    """Print the number of failed-then-retried generations per second."""
+    node1 = TranslatedPattern.do_factory_create("ab cd")
+    node2 = TranslatedPattern.do_factory_create("a-1")
+    start = time.perf_counter()
+    for _ in range(TOTAL):
+        generate_with_retry(node1, node2, raise_error)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24}{TOTAL / elapsed:>12,.0f} retries/s")
+
+
+if __name__ == "__main__":
+    measure("genericlib", raise_by_genericlib)
+    measure("registry", RuntimeException.do_raise_runtime_error)
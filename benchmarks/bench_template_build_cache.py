@@ -0,0 +1,52 @@
+"""
+Benchmark of `TemplateBuilder` with the template build cache.
+
+Builds the same template snippets repeatedly with the cache disabled,
+with the in-memory layer, and with only the on-disk layer (a temporary
+directory), and reports builds per second.
+
+Usage
+-----
+    $ python -m benchmarks.bench_template_build_cache
+"""
+
+import tempfile
+import time
+
+from textfsmgen.core import TEMPLATE_BUILD_CACHE
+from textfsmgen.core import TemplateBuilder
+
+SNIPPETS = [
+    "Title                   Price       Genre\n"
+    "mixed_words(var_title)   number(var_price)   words(var_genre) -> Record",
+    "Interface: word(var_intf)  mtu digits(var_mtu)\n"
+    "  Status: letters(var_status) -> Record",
+    "keep__ ^Device ID +Local Intrfce\n"
+    "word(var_device)  mixed_word(var_local) digits(var_hold) -> Record",
+]
+TOTAL = 300
+
+
+def measure(label):
+    """Print the number of builds completed per second."""
+    start = time.perf_counter()
+    for index in range(TOTAL):
+        TemplateBuilder(user_data=SNIPPETS[index % len(SNIPPETS)])
+    elapsed = time.perf_counter() - start
+    print(f"{label:<24}{TOTAL / elapsed:>10,.0f} builds/s")
+
+
+if __name__ == "__main__":
+    TEMPLATE_BUILD_CACHE.disable()
+    measure("no cache")
+
+    TEMPLATE_BUILD_CACHE.enable()
+    measure("memory cache")
+
+    with tempfile.TemporaryDirectory() as dirname:
+        TEMPLATE_BUILD_CACHE.enable_disk(dirname)
+        measure("memory + disk (warm)")
+        TEMPLATE_BUILD_CACHE.disable()
+        measure("disk cache only")
+        TEMPLATE_BUILD_CACHE.disable_disk()
+    print(TEMPLATE_BUILD_CACHE.get_stats())
@@ -0,0 +1,10 @@
+"""
+Unit tests for the `textfsmgen.codegen` module.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/codegen
+    or
+    $ python -m pytest tests/unit/codegen
+"""
@@ -0,0 +1,145 @@
+"""
+Unit tests for the `textfsmgen.codegen.ParserCodeGenerator` class.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/codegen/test_parser_code_generator_class.py
+    or
+    $ python -m pytest tests/unit/codegen/test_parser_code_generator_class.py
+"""
+
+from io import StringIO
+
+import pytest
+from textfsm import TextFSM
+from textfsm import TextFSMError
+
+from textfsmgen.codegen import ParserCodeGenerator
+from textfsmgen.codegen import generate_parser_code
+from textfsmgen.codegen import load_parser_module
+from textfsmgen.core import TemplateBuilder
+from textfsmgen.exceptions import ParserCodeGenError
+
+from tests.unit.core import get_user_data
+from tests.unit.core import get_test_data
+
+OPTIONS_TEMPLATE = r"""
+Value Filldown chassis (\S+)
+Value Required intf (\S+)
+Value List addrs (\S+)
+Value Fillup desc (\w+)
+Value List pairs ((?P<k>\w+)=(?P<v>\d+))
+
+Start
+  ^Chassis ${chassis}
+  ^Interface ${intf} -> Continue.Record
+  ^Interface ${intf}
+  ^  addr ${addrs}
+  ^  kv ${pairs}
+  ^  desc ${desc}
+  ^clearall -> Clearall
+  ^clear -> Clear
+  ^stop -> End
+  ^go -> Other
+
+Other
+  ^back -> Start
+  ^x ${intf} -> Record
+""".lstrip()
+
+OPTIONS_DATA = """
+Chassis A1
+Interface e0
+  addr 1.1.1.1
+  addr 2.2.2.2
+  kv a=1
+  kv b=2
+Interface e1
+  desc uplink
+Interface e2
+clear
+Interface e3
+  addr 3
+Chassis B2
+go
+x e9
+back
+clearall
+Interface e4
+  desc last
+stop
+Interface e5
+""".lstrip()
+
+EOF_TEMPLATE = r"""
+Value name (\w+)
+
+Start
+  ^name ${name}
+  ^done -> EOF
+
+EOF
+""".lstrip()
+
+ERROR_TEMPLATE = r"""
+Value name (\w+)
+
+Start
+  ^name ${name} -> Record
+  ^bad -> Error "unexpected line"
+""".lstrip()
+
+
+def parse_with_textfsm(template, data, eof=True):
+    """Return the rows of the TextFSM interpreter."""
+    return TextFSM(StringIO(template)).ParseTextToDicts(data, eof=eof)
+
+
+def parse_with_module(template, data, eof=True):
+    """Return the rows of the generated parser."""
+    module = load_parser_module(generate_parser_code(template))
+    return module.parse_text_to_dicts(data, eof=eof)
+
+
+class TestParserCodeGenerator:
+    """Test suite for the generated parsers."""
+
+    @pytest.mark.parametrize("eof", [True, False])
+    def test_value_options_and_states(self, eof):
+        """Verify Filldown, Fillup, List, Required, Clear and state changes."""
+        expected = parse_with_textfsm(OPTIONS_TEMPLATE, OPTIONS_DATA, eof=eof)
+        assert parse_with_module(OPTIONS_TEMPLATE, OPTIONS_DATA, eof=eof) == expected
+
+    def test_eof_state(self):
+        """Verify that a declared EOF state suppresses the implicit record."""
+        data = "name a\nname b\ndone\nname c"
+        expected = parse_with_textfsm(EOF_TEMPLATE, data)
+        assert parse_with_module(EOF_TEMPLATE, data) == expected == []
+
+    def test_error_action(self):
+        """Verify that an Error action raises with the TextFSM message."""
+        module = load_parser_module(generate_parser_code(ERROR_TEMPLATE))
+        with pytest.raises(TextFSMError) as expected:
+            parse_with_textfsm(ERROR_TEMPLATE, "name a\nbad")
+        with pytest.raises(module.ParseError) as actual:
+            module.parse_text("name a\nbad")
+        assert str(actual.value) == str(expected.value)
+
+    def test_invalid_template(self):
+        """Verify that an invalid template is reported."""
+        with pytest.raises(ParserCodeGenError):
+            ParserCodeGenerator("Value x (\\d+)\n\nStart\n  ^${y}")
+
+    def test_template_builder(self, tmp_path):
+        """Verify a builder's parser against its test data."""
+        filename = tmp_path / "parser.py"
+        builder = TemplateBuilder(user_data=get_user_data(case="case2"),
+                                  test_data=get_test_data(), filename=str(filename))
+        source = builder.create_python_parser()
+        assert filename.read_text() == source
+
+        module = load_parser_module(source)
+        expected = builder.template_parser.ParseTextToDicts(builder.test_data)
+        assert expected
+        assert module.parse_text_to_dicts(builder.test_data) == expected
@@ -0,0 +1,96 @@
+"""
+Unit tests for the `textfsmgen.codegen.RecordPerLineParser` class.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/codegen/test_record_per_line_parser_class.py
+    or
+    $ python -m pytest tests/unit/codegen/test_record_per_line_parser_class.py
+"""
+
+from io import StringIO
+
+import pytest
+from textfsm import TextFSM
+
+from textfsmgen.codegen import RecordPerLineParser
+from textfsmgen.core import TemplateBuilder
+from textfsmgen.exceptions import ParserCodeGenError
+
+from tests.unit.core import get_user_data
+from tests.unit.core import get_test_data
+
+TABLE_TEMPLATE = r"""
+Value intf (\S+)
+Value status (up|down)
+Value note (\w+)
+Value count (\d+)
+
+Start
+  ^Interface +Status
+  ^TOTAL ${count} -> Record
+  ^${intf} +${status}( +${note})?$$ -> Record
+  ^-+ -> Clear
+  ^${intf} +error -> Record
+""".lstrip()
+
+TABLE_DATA = """
+Interface   Status
+---------   ------
+eth0        up
+eth1        down   spare
+eth2        error
+eth3        unknown
+TOTAL 3
+""".lstrip()
+
+
+def parse_with_textfsm(template, data):
+    """Return the rows of the TextFSM interpreter."""
+    return TextFSM(StringIO(template)).ParseTextToDicts(data)
+
+
+class TestRecordPerLineParser:
+    """Test suite for the single-regex fast path."""
+
+    def test_same_rows_as_textfsm(self):
+        """Verify rows, rule order and optional groups."""
+        parser = RecordPerLineParser(TABLE_TEMPLATE)
+        expected = parse_with_textfsm(TABLE_TEMPLATE, TABLE_DATA)
+        assert parser.parse_text_to_dicts(TABLE_DATA) == expected
+        assert [row["intf"] for row in expected] == ["eth0", "eth1", "eth2", ""]
+
+    @pytest.mark.parametrize(
+        "template",
+        [
+            "Value x (\\d+)\n\nStart\n  ^${x} -> Next\n  ^a -> Other\n\nOther\n  ^b -> Start",
+            "Value Filldown x (\\d+)\n\nStart\n  ^${x} -> Record",
+            "Value x (\\d+)\n\nStart\n  ^${x}",
+            "Value x (\\d+)\n\nStart\n  ^${x} -> Continue.Record",
+            "Value x (\\d+)\n\nStart\n  ^(a)\\1 ${x} -> Record",
+            "Value x (\\d+)\n\nStart\n",
+        ],
+    )
+    def test_unsupported_shape(self, template):
+        """Verify that other template shapes are rejected."""
+        assert RecordPerLineParser.is_supported(template) is False
+        with pytest.raises(ParserCodeGenError):
+            RecordPerLineParser(template)
+
+    def test_template_builder_fast_path(self):
+        """Verify the builder's fast path and its fallback."""
+        builder = TemplateBuilder(user_data=get_user_data(case="case2"),
+                                  test_data=get_test_data())
+        assert builder.fast_parser is not None
+        assert builder.fast_parser_reason == ""
+        expected = builder.template_parser.ParseTextToDicts(builder.test_data)
+        assert builder.parse_text_to_dicts(builder.test_data) == expected
+
+        user_data = "Interface word(var_intf)\n  MTU digits(var_mtu) -> Record"
+        data = "Interface eth0\n  MTU 1500\nInterface eth1\n  MTU 9000"
+        builder = TemplateBuilder(user_data=user_data)
+        assert builder.fast_parser is None
+        assert "without Record" in builder.fast_parser_reason
+        expected = builder.template_parser.ParseTextToDicts(data)
+        assert builder.parse_text_to_dicts(data) == expected
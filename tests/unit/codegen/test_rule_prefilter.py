@@ -0,0 +1,86 @@
+"""
+Unit tests for the rule prefilter of `textfsmgen.codegen`.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/codegen/test_rule_prefilter.py
+    or
+    $ python -m pytest tests/unit/codegen/test_rule_prefilter.py
+"""
+
+import pytest
+
+from textfsmgen.codegen import generate_parser_code
+from textfsmgen.codegen import get_prefilter_report
+from textfsmgen.codegen import get_required_literal
+from textfsmgen.codegen import load_parser_module
+from textfsmgen.core import TemplateBuilder
+
+from tests.unit.core import get_user_data
+from tests.unit.core import get_test_data
+
+TEMPLATE = r"""
+Value intf (\S+)
+Value mtu (\d+)
+
+Start
+  ^Interface ${intf} is (up|down)
+  ^  MTU ${mtu} bytes -> Record
+""".lstrip()
+
+DATA = """
+Interface eth0 is up
+  Hardware is Ethernet
+  MTU 1500 bytes
+Interface eth1 is down
+  MTU 9000 bytes
+""".lstrip()
+
+
+@pytest.mark.parametrize(
+    "regex,expected",
+    [
+        (r"^Interface (?P<intf>\S+) is (up|down)", "Interface "),
+        (r"^\s+MTU (?P<mtu>\d+) bytes", " bytes"),
+        (r"^(?:ip|IP) addr \S+", " addr "),
+        (r"^.*(foo)?bar", "bar"),
+        (r"^a{2}b?c", "a"),
+        (r"^(?i:Interface) \S+", " "),
+        (r"^\S+\s+\d+", ""),
+        (r"^\x24 x", "$ x"),
+    ],
+)
+def test_get_required_literal(regex, expected):
+    """Verify that only mandatory, case-sensitive literals are used."""
+    assert get_required_literal(regex) == expected
+
+
+def test_prefilter_keeps_rows():
+    """Verify that prefiltered and plain parsers give the same rows."""
+    plain = load_parser_module(generate_parser_code(TEMPLATE, prefilter=False))
+    prefiltered = load_parser_module(generate_parser_code(TEMPLATE))
+    assert prefiltered.parse_text(DATA) == plain.parse_text(DATA)
+    assert len(prefiltered.parse_text(DATA)) == 2
+
+
+def test_get_prefilter_report():
+    """Verify the counts of evaluated and skipped rules."""
+    report = get_prefilter_report(TEMPLATE, DATA)
+    assert report["lines_count"] == 5
+    assert report["rows_count"] == 2
+    first, second = report["rules"]
+    # Interface lines stop at the first rule, others try both rules.
+    assert (first["evaluated"], first["skipped"]) == (2, 3)
+    assert (second["evaluated"], second["skipped"]) == (2, 1)
+    assert report["skipped_count"] == 4
+    assert report["skipped_ratio"] == round(4 / 8, 4)
+
+
+def test_template_builder_prefilter_report():
+    """Verify the prefilter report of a builder's test data."""
+    builder = TemplateBuilder(user_data=get_user_data(case="case2"),
+                              test_data=get_test_data())
+    report = builder.get_prefilter_report()
+    assert report["rows_count"] == len(builder.get_test_result())
+    assert report["evaluated_count"] + report["skipped_count"] > 0
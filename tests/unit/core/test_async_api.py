@@ -0,0 +1,85 @@
+"""
+Unit tests for the asyncio API of `textfsmgen.core` and `textfsmgen.verify`.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/core/test_async_api.py
+    or
+    $ python -m pytest tests/unit/core/test_async_api.py
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from textfsmgen.core import abuild_template
+from textfsmgen.core import get_textfsm_template
+from textfsmgen.core import run_in_executor
+from textfsmgen.exceptions import TemplateBuilderInvalidFormat
+from textfsmgen.verify import averify
+
+from tests.unit.core import get_user_data
+from tests.unit.core import get_test_data
+from tests.unit.core import get_expected_result
+
+
+def test_abuild_template():
+    """Verify that abuild_template matches get_textfsm_template."""
+    user_data = get_user_data(case="case2")
+    template = asyncio.run(abuild_template(user_data, author="tester"))
+    assert template == get_textfsm_template(user_data, author="tester")
+
+
+def test_abuild_template_error():
+    """Verify that build errors propagate to the awaiting task."""
+    with pytest.raises(TemplateBuilderInvalidFormat):
+        asyncio.run(abuild_template("no variable here"))
+
+
+def test_averify_concurrently():
+    """Verify many templates concurrently on a bounded executor."""
+    async def main():
+        semaphore = asyncio.Semaphore(2)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            jobs = [
+                averify(get_user_data(case="case2"), get_test_data(),
+                        expected_result=get_expected_result(),
+                        executor=executor, semaphore=semaphore)
+                for _ in range(6)
+            ]
+            return await asyncio.gather(*jobs)
+
+    assert asyncio.run(main()) == [True] * 6
+
+
+def test_run_in_executor_semaphore_and_cancel():
+    """Verify the concurrency limit and that queued jobs can be cancelled."""
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def work():
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+
+    async def main():
+        semaphore = asyncio.Semaphore(2)
+        tasks = [asyncio.create_task(run_in_executor(work, semaphore=semaphore))
+                 for _ in range(6)]
+        await asyncio.sleep(0.01)
+        tasks[-1].cancel()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return results
+
+    results = asyncio.run(main())
+    assert peak[0] == 2
+    assert isinstance(results[-1], asyncio.CancelledError)
+    assert results[:-1] == [None] * 5
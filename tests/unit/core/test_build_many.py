@@ -0,0 +1,44 @@
+"""
+Unit tests for the `textfsmgen.core.build_many` function.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/core/test_build_many.py
+    or
+    $ python -m pytest tests/unit/core/test_build_many.py
+"""
+
+import pytest
+
+from textfsmgen.core import build_many
+from textfsmgen.core import get_textfsm_template
+
+from tests.unit.core import get_user_data
+
+SNIPPETS = [
+    get_user_data(case="case1"),
+    "no variable here",
+    get_user_data(case="case2"),
+    "Interface: word(var_intf)  mtu digits(var_mtu)",
+]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_build_many(workers):
+    """Verify that results keep input order and capture per-item errors."""
+    results = build_many(SNIPPETS, workers=workers, chunksize=1, author="tester")
+    assert len(results) == len(SNIPPETS)
+
+    for snippet, result in zip(SNIPPETS, results):
+        if snippet == "no variable here":
+            assert result["template"] == ""
+            assert result["error"].startswith("TemplateBuilderInvalidFormat:")
+        else:
+            assert result["error"] == ""
+            assert result["template"] == get_textfsm_template(snippet, author="tester")
+
+
+def test_build_many_empty():
+    """Verify that an empty batch returns an empty list."""
+    assert build_many([], workers=4) == []
@@ -0,0 +1,121 @@
+"""
+Unit tests for the `textfsmgen.core.StatementCache` class.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/core/test_statement_cache_class.py
+    or
+    $ python -m pytest tests/unit/core/test_statement_cache_class.py
+"""
+
+import pytest
+
+from textfsmgen.core import REF
+from textfsmgen.core import STATEMENT_CACHE
+from textfsmgen.core import TEMPLATE_BUILD_CACHE
+from textfsmgen.core import StatementCache
+from textfsmgen.core import TemplateBuilder
+
+from tests.unit.core import get_user_data
+
+SHARED_LINES = [
+    "comment__ device prompt",
+    "keep__ ^Device ID +Local Intrfce",
+    "Router#show version",
+]
+
+USER_DATA_LIST = [
+    get_user_data(case="case1"),
+    get_user_data(case="case2"),
+    "\n".join(SHARED_LINES + [
+        "word(var_device)  mixed_word(var_local) digits(var_hold) -> Record",
+    ]),
+    "\n".join(SHARED_LINES + [
+        "Interface: word(var_intf)  mtu digits(var_mtu)",
+        "Status: letters(var_status) -> next.record",
+        "  total cost \\$ number(var_cost) -> Next.Record",
+        "end \\$$",
+        "EOF",
+    ]),
+    "\n".join([
+        "comment___ indented comment",
+        "Interface: word(var_intf)  mtu digits(var_mtu)",
+        "",
+        "  Up time: mixed_words(var_uptime) -> Continue.Record",
+    ]),
+]
+
+
+@pytest.fixture
+def caches():
+    """Reset the shared caches and restore their state afterwards."""
+    build_enabled = TEMPLATE_BUILD_CACHE.enabled
+    statement_enabled = STATEMENT_CACHE.enabled
+    TEMPLATE_BUILD_CACHE.disable()
+    STATEMENT_CACHE.clear()
+    yield STATEMENT_CACHE
+    STATEMENT_CACHE.clear()
+    STATEMENT_CACHE.enabled = statement_enabled
+    TEMPLATE_BUILD_CACHE.enabled = build_enabled
+
+
+def build_all():
+    """Build every snippet and return comparable build results."""
+    result = []
+    for user_data in USER_DATA_LIST:
+        builder = TemplateBuilder(user_data=user_data)
+        result.append((
+            builder.template,
+            builder.statements,
+            [var.value for var in builder.variables],
+        ))
+    return result
+
+
+class TestStatementCacheClass:
+    """Test suite for StatementCache."""
+
+    def test_templates_are_byte_identical(self, caches):
+        """Verify that cold and warm cached builds match uncached builds."""
+        caches.disable()
+        expected_result = build_all()
+
+        caches.enable()
+        assert build_all() == expected_result      # cold
+        assert build_all() == expected_result      # warm
+        stats = caches.get_stats()
+        assert stats["hits"] > stats["misses"]
+
+    def test_shared_lines_are_parsed_once(self, caches):
+        """Verify that lines reused across snippets hit the cache."""
+        TemplateBuilder(user_data=USER_DATA_LIST[2])
+        hits = caches.hits
+        TemplateBuilder(user_data=USER_DATA_LIST[3])
+        assert caches.hits - hits == len(SHARED_LINES)
+
+    def test_variables_are_not_shared(self, caches):
+        """Verify that builders never share variable objects."""
+        builder1 = TemplateBuilder(user_data=USER_DATA_LIST[0])
+        builder2 = TemplateBuilder(user_data=USER_DATA_LIST[0])
+        for var1, var2 in zip(builder1.variables, builder2.variables):
+            assert var1 is not var2
+            assert var1.value == var2.value
+
+    def test_references_are_part_of_the_key(self, caches, monkeypatch):
+        """Verify that an edited keyword is not served from the cache."""
+        user_data = "Interface: word(var_intf)  mtu digits(var_mtu)"
+        assert r"(\d+)" in TemplateBuilder(user_data=user_data).template
+        monkeypatch.setitem(REF, "digits", dict(REF["digits"], pattern="[0-9]+"))
+        assert "([0-9]+)" in TemplateBuilder(user_data=user_data).template
+
+    def test_bounded(self):
+        """Verify that the least recently used line is evicted."""
+        cache = StatementCache(maxsize=2)
+        cache.put("a", "  ^a", [])
+        cache.put("b", "  ^b", [])
+        cache.get("a")
+        cache.put("c", "  ^c", [])
+        assert cache.get("b") is None
+        assert cache.get("a") == ("  ^a", ())
+        assert cache.evictions == 1
@@ -0,0 +1,170 @@
+"""
+Unit tests for the `textfsmgen.core.TemplateBuildCache` class.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/core/test_template_build_cache_class.py
+    or
+    $ python -m pytest tests/unit/core/test_template_build_cache_class.py
+"""
+
+import os
+
+import pytest
+
+from textfsmgen.core import REF
+from textfsmgen.core import TEMPLATE_BUILD_CACHE
+from textfsmgen.core import TemplateBuildCache
+from textfsmgen.core import TemplateBuilder
+
+from tests.unit.core import get_user_data
+
+USER_DATA_LIST = [
+    get_user_data(case="case1"),
+    get_user_data(case="case2"),
+    "Interface: word(var_intf)  mtu digits(var_mtu)\n"
+    "keep__ ^$$\n"
+    "comment__ status line\n"
+    "  Status: letters(var_status) -> Record",
+]
+
+
+@pytest.fixture
+def build_cache(tmp_path):
+    """Provide the shared cache backed by a temporary disk directory."""
+    stats = TEMPLATE_BUILD_CACHE.get_stats()
+    TEMPLATE_BUILD_CACHE.clear()
+    TEMPLATE_BUILD_CACHE.enable_disk(str(tmp_path), max_bytes=1024 * 1024)
+    yield TEMPLATE_BUILD_CACHE
+    TEMPLATE_BUILD_CACHE.disable_disk()
+    TEMPLATE_BUILD_CACHE.clear()
+    if stats["enabled"]:
+        TEMPLATE_BUILD_CACHE.enable(stats["maxsize"])
+    else:
+        TEMPLATE_BUILD_CACHE.disable()
+
+
+def build_without_cache(user_data, **kwargs):
+    """Build a template with both cache layers turned off."""
+    cache = TEMPLATE_BUILD_CACHE
+    enabled, dirname = cache.enabled, cache.disk_dirname
+    cache.enabled, cache.disk_dirname = False, ""
+    try:
+        return TemplateBuilder(user_data=user_data, **kwargs)
+    finally:
+        cache.enabled, cache.disk_dirname = enabled, dirname
+
+
+def assert_same_build(builder, expected_builder):
+    """Assert that two builders hold identical build results."""
+    assert builder.template == expected_builder.template
+    assert builder.bare_template == expected_builder.bare_template
+    assert builder.statements == expected_builder.statements
+    assert [v.value for v in builder.variables] == [v.value for v in expected_builder.variables]
+    assert builder.template_parser is not expected_builder.template_parser
+
+
+class TestTemplateBuildCacheClass:
+    """Test suite for TemplateBuildCache."""
+
+    @pytest.mark.parametrize("user_data", USER_DATA_LIST)
+    def test_memory_hit_is_identical(self, build_cache, user_data):
+        """Verify that a memory hit rebuilds a byte-identical template."""
+        expected_builder = build_without_cache(user_data, author="tester")
+        TemplateBuilder(user_data=user_data, author="tester")
+        builder = TemplateBuilder(user_data=user_data, author="tester")
+        assert build_cache.memory_hits == 1
+        assert_same_build(builder, expected_builder)
+
+    @pytest.mark.parametrize("user_data", USER_DATA_LIST)
+    def test_disk_hit_is_identical(self, build_cache, user_data):
+        """Verify that a disk hit from another process-like state is identical."""
+        expected_builder = build_without_cache(user_data)
+        TemplateBuilder(user_data=user_data)
+
+        build_cache.disable()
+        build_cache.enable()
+        builder = TemplateBuilder(user_data=user_data)
+        assert build_cache.disk_hits == 1
+        assert_same_build(builder, expected_builder)
+
+    def test_comment_is_regenerated(self, build_cache):
+        """Verify that builder options outside user data are not cached."""
+        user_data = USER_DATA_LIST[0]
+        TemplateBuilder(user_data=user_data, author="first")
+        builder = TemplateBuilder(user_data=user_data, company="second")
+        assert build_cache.memory_hits == 1
+        assert "# Company     : second" in builder.template
+        assert "first" not in builder.template
+
+    def test_key_depends_on_versions(self):
+        """Verify that library versions are part of the content address."""
+        cache = TemplateBuildCache()
+        other_cache = TemplateBuildCache()
+        other_cache.LIBRARY_VERSIONS = dict(cache.LIBRARY_VERSIONS, textfsm="0.0.0")
+        assert cache.get_key("abc") == TemplateBuildCache().get_key("abc")
+        assert cache.get_key("abc") != other_cache.get_key("abc")
+        assert cache.get_key("abc") != cache.get_key("abd")
+
+    def test_key_depends_on_references(self, monkeypatch):
+        """Verify that editing a user keyword changes the content address."""
+        cache = TemplateBuildCache()
+        key = cache.get_key("abc")
+        monkeypatch.setitem(REF, "digits", dict(REF["digits"], pattern="[0-9]+"))
+        assert cache.get_key("abc") != key
+        monkeypatch.undo()
+        assert cache.get_key("abc") == key
+
+    def test_key_depends_on_edited_references(self, monkeypatch):
+        """Verify that an in-place edit of a reference entry changes the content address."""
+        cache = TemplateBuildCache()
+        key = cache.get_key("abc")
+        monkeypatch.setitem(REF["digits"], "pattern", "[0-9]+")
+        assert cache.get_key("abc") != key
+        monkeypatch.undo()
+        assert cache.get_key("abc") == key
+        monkeypatch.setitem(REF["datetime"], "format4", r"\d{4}")
+        assert cache.get_key("abc") != key
+
+    def test_edited_reference_is_rebuilt(self, build_cache, monkeypatch):
+        """Verify that a cached build is not served after a keyword edit."""
+        user_data = "Interface: word(var_intf)  mtu digits(var_mtu)"
+        assert r"(\d+)" in TemplateBuilder(user_data=user_data).template
+        monkeypatch.setitem(REF["digits"], "pattern", "[0-9]+")
+        assert "([0-9]+)" in TemplateBuilder(user_data=user_data).template
+
+    def test_memory_layer_is_bounded(self):
+        """Verify that the least recently used memory entry is evicted."""
+        cache = TemplateBuildCache(maxsize=2)
+        cache.put("a", dict(value=1))
+        cache.put("b", dict(value=2))
+        cache.get("a")
+        cache.put("c", dict(value=3))
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == dict(value=1)
+        assert cache.evictions == 1
+
+    def test_disk_layer_is_capped(self, tmp_path):
+        """Verify that the oldest files are evicted past the size cap."""
+        cache = TemplateBuildCache(enabled=False)
+        cache.enable_disk(str(tmp_path), max_bytes=250)
+        for index in range(5):
+            cache.put(f"key{index}", dict(data="x" * 80))
+            filename = cache.get_disk_filename(f"key{index}")
+            os.utime(filename, (index, index))
+
+        cache.put("last", dict(data="x" * 80))
+        names = sorted(os.listdir(tmp_path))
+        assert "last.json" in names
+        assert "key0.json" not in names
+        assert sum(os.path.getsize(tmp_path / name) for name in names) <= 250
+
+    def test_unreadable_disk_entry_is_a_miss(self, tmp_path):
+        """Verify that a corrupt on-disk entry is treated as a miss."""
+        cache = TemplateBuildCache(enabled=False)
+        cache.enable_disk(str(tmp_path))
+        (tmp_path / "bad.json").write_text("{not json", encoding="utf-8")
+        assert cache.get("bad") is None
+        assert cache.misses == 1
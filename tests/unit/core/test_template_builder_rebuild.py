@@ -0,0 +1,69 @@
+"""
+Unit tests for the `textfsmgen.core.TemplateBuilder.rebuild` method.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/core/test_template_builder_rebuild.py
+    or
+    $ python -m pytest tests/unit/core/test_template_builder_rebuild.py
+"""
+
+import pytest
+
+from textfsmgen.core import STATEMENT_CACHE
+from textfsmgen.core import TEMPLATE_BUILD_CACHE
+from textfsmgen.core import TemplateBuilder
+
+from tests.unit.core import get_user_data
+from tests.unit.core import get_test_data
+from tests.unit.core import get_expected_result
+
+
+@pytest.fixture
+def no_shared_caches():
+    """Turn the shared caches off so only the builder's own state is reused."""
+    build_enabled, statement_enabled = TEMPLATE_BUILD_CACHE.enabled, STATEMENT_CACHE.enabled
+    TEMPLATE_BUILD_CACHE.disable()
+    STATEMENT_CACHE.disable()
+    yield
+    TEMPLATE_BUILD_CACHE.enabled, STATEMENT_CACHE.enabled = build_enabled, statement_enabled
+
+
+def test_rebuild_matches_fresh_build(no_shared_caches):
+    """Verify that an incremental rebuild equals a fresh build."""
+    builder = TemplateBuilder(user_data=get_user_data(case="case1"))
+    new_user_data = get_user_data(case="case2")
+    builder.rebuild(user_data=new_user_data)
+
+    expected_builder = TemplateBuilder(user_data=new_user_data)
+    assert builder.template == expected_builder.template
+    assert builder.statements == expected_builder.statements
+    assert [v.value for v in builder.variables] == [v.value for v in expected_builder.variables]
+
+
+def test_rebuild_parses_only_changed_lines(no_shared_caches, monkeypatch):
+    """Verify that unchanged lines are not parsed again."""
+    lines = [f"comment__ line {index}" for index in range(20)]
+    lines.append("mixed_words(var_title)   number(var_price) -> Record")
+    builder = TemplateBuilder(user_data="\n".join(lines))
+
+    parsed = []
+    get_statement_and_variables = TemplateBuilder.get_statement_and_variables
+
+    def spy(line):
+        parsed.append(line)
+        return get_statement_and_variables(line)
+
+    monkeypatch.setattr(TemplateBuilder, "get_statement_and_variables", staticmethod(spy))
+    lines[5] = "comment__ edited line"
+    builder.rebuild(user_data="\n".join(lines))
+    assert parsed == ["comment__ edited line"]
+    assert "  # edited line" in builder.statements
+
+
+def test_rebuild_with_test_data(no_shared_caches):
+    """Verify that rebuild resets verification state and accepts test data."""
+    builder = TemplateBuilder(user_data=get_user_data(case="case1"))
+    builder.rebuild(user_data=get_user_data(case="case2"), test_data=get_test_data())
+    assert builder.verify(expected_result=get_expected_result()) is True
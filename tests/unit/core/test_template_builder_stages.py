@@ -0,0 +1,90 @@
+"""
+Unit tests for the lazy, staged `textfsmgen.core.TemplateBuilder` API.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/core/test_template_builder_stages.py
+    or
+    $ python -m pytest tests/unit/core/test_template_builder_stages.py
+"""
+
+import pytest
+
+from textfsmgen.core import TEXTFSM_PARSER_POOL
+from textfsmgen.core import TemplateBuilder
+from textfsmgen.exceptions import TemplateBuilderError
+from textfsmgen.exceptions import TemplateBuilderInvalidFormat
+
+from tests.unit.core import get_user_data
+from tests.unit.core import get_test_data
+from tests.unit.core import get_expected_result
+
+
+@pytest.fixture
+def compile_spy(monkeypatch):
+    """Record every template compiled through the parser pool."""
+    compiled = []
+    parser = TEXTFSM_PARSER_POOL.parser
+
+    def spy(template):
+        compiled.append(template)
+        return parser(template)
+
+    monkeypatch.setattr(TEXTFSM_PARSER_POOL, "parser", spy)
+    return compiled
+
+
+def test_lazy_builder_runs_stages_on_demand(compile_spy):
+    """Verify that a lazy builder runs only the stages an attribute needs."""
+    builder = TemplateBuilder(user_data=get_user_data(case="case1"), lazy=True)
+    assert builder._stages == set()
+
+    assert len(builder.variables) == 3
+    assert builder._stages == {"prepare"}
+
+    assert builder.bare_template.startswith("Value title")
+    assert builder._stages == {"prepare", "assemble"}
+    assert compile_spy == []
+
+    assert builder.template == TemplateBuilder(user_data=get_user_data(case="case1")).template
+    assert builder._stages == {"prepare", "assemble", "compile"}
+
+
+def test_lazy_builder_defers_errors():
+    """Verify that a lazy builder raises only when a stage needs variables."""
+    builder = TemplateBuilder(user_data="no variable here", lazy=True)
+    assert builder.statements == ["  ^no variable here"]
+    with pytest.raises(TemplateBuilderInvalidFormat):
+        builder.bare_template
+
+
+def test_skip_compile(compile_spy):
+    """Verify that skip_compile returns the assembled template unvalidated."""
+    user_data = "a word(var_x)\nc digits(var_x)"
+    builder = TemplateBuilder(user_data=user_data, skip_compile=True)
+    assert compile_spy == []
+    assert builder.template.endswith("^c ${x}")
+    with pytest.raises(TemplateBuilderError):
+        builder.compile_template()
+
+
+def test_get_test_result_is_cached(monkeypatch):
+    """Verify that the test data is parsed once per template and test data."""
+    builder = TemplateBuilder(user_data=get_user_data(case="case2"),
+                              test_data=get_test_data())
+    calls = []
+    parse_text_to_dicts = TEXTFSM_PARSER_POOL.parse_text_to_dicts
+
+    def spy(template, test_data):
+        calls.append(test_data)
+        return parse_text_to_dicts(template, test_data)
+
+    monkeypatch.setattr(TEXTFSM_PARSER_POOL, "parse_text_to_dicts", spy)
+    assert builder.verify(expected_result=get_expected_result()) is True
+    assert builder.verify(expected_rows_count=len(get_expected_result())) is True
+    assert len(calls) == 1
+
+    builder.test_data = get_test_data().splitlines()[0]
+    builder.verify()
+    assert len(calls) == 2
@@ -0,0 +1,155 @@
+"""
+Unit tests for the `textfsmgen.core.TemplateBuilder.verify_stream` method.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/core/test_template_builder_verify_stream.py
+    or
+    $ python -m pytest tests/unit/core/test_template_builder_verify_stream.py
+"""
+
+from io import StringIO
+
+import pytest
+from textfsm import TextFSM
+
+from textfsmgen.core import TemplateBuilder
+from textfsmgen.core import iter_parsed_chunks
+from textfsmgen.core import iter_text_chunks
+
+USER_DATA = """
+Interface word(var_intf) is letters(var_status)
+  MTU digits(var_mtu) bytes -> Record
+""".strip()
+
+
+def get_capture(count):
+    """Return a capture of `count` interfaces as a generator of lines."""
+    for index in range(count):
+        yield "router# show interfaces\n"
+        yield f"Interface eth{index} is up\n"
+        yield f"  MTU {1500 + index} bytes\n"
+
+
+def get_expected_rows(count):
+    """Return the expected rows of `get_capture` as a generator."""
+    for index in range(count):
+        yield dict(intf=f"eth{index}", status="up", mtu=str(1500 + index))
+
+
+def test_iter_text_chunks():
+    """Verify that chunks start at boundary lines and respect the size cap."""
+    lines = ["# a", "1", "2", "# b", "3"]
+    assert list(iter_text_chunks(lines, boundary="^#")) == ["# a\n1\n2", "# b\n3"]
+    assert list(iter_text_chunks(lines, chunk_lines=2)) == ["# a\n1", "2\n# b", "3"]
+
+
+@pytest.mark.parametrize("chunk_lines", [1, 2, 1000])
+def test_iter_parsed_chunks_matches_whole_text(chunk_lines):
+    """Verify that chunked parsing equals parsing the whole text."""
+    builder = TemplateBuilder(user_data=USER_DATA)
+    text = "".join(get_capture(5))
+    chunks = iter_text_chunks(text.splitlines(), chunk_lines=chunk_lines)
+    rows = [row for batch in iter_parsed_chunks(builder.template, chunks) for row in batch]
+    assert rows == builder.template_parser.ParseTextToDicts(text)
+    assert rows == list(get_expected_rows(5))
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "Value a (\\S+)\n\nStart\n  ^stop -> EOF\n  ^${a} -> Record\n",
+        "Value a (\\S+)\n\nStart\n  ^stop -> EOF\n  ^${a}\n\nEOF\n",
+        "Value a (\\S+)\n\nStart\n  ^stop -> End\n  ^${a}\n",
+    ]
+)
+@pytest.mark.parametrize("chunk_lines", [1, 2, 1000])
+def test_iter_parsed_chunks_stops_like_whole_text(template, chunk_lines):
+    """Verify that End and EOF transitions stop chunked parsing."""
+    text = "1\n2\nstop\n3\n4"
+    chunks = iter_text_chunks(text.splitlines(), chunk_lines=chunk_lines)
+    rows = [row for batch in iter_parsed_chunks(template, chunks) for row in batch]
+    assert rows == TextFSM(StringIO(template)).ParseTextToDicts(text)
+
+
+FILLUP_TEMPLATE = r"""
+Value name (\S+)
+Value Fillup host (\S+)
+Value Fillup site (\S+)
+
+Start
+  ^name ${name} -> Record
+  ^host ${host}
+  ^site ${site}
+""".lstrip()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "name a\nname b\nname c\nhost h1",
+        "name a\nhost h1\nname b\nname c\nsite s1\nname d\nhost h2\nname e",
+        "site s0\nname a\nname b\nhost h1\nname c\nname d\nsite s1\nhost h2",
+    ]
+)
+@pytest.mark.parametrize("chunk_lines", [1, 2, 3, 1000])
+def test_iter_parsed_chunks_fills_up_across_chunks(text, chunk_lines):
+    """Verify that Fillup values reach rows of earlier chunks."""
+    chunks = iter_text_chunks(text.splitlines(), chunk_lines=chunk_lines)
+    rows = [row for batch in iter_parsed_chunks(FILLUP_TEMPLATE, chunks) for row in batch]
+    assert rows == TextFSM(StringIO(FILLUP_TEMPLATE)).ParseTextToDicts(text)
+
+
+def test_verify_stream_with_fillup():
+    """Verify a builder template with a Fillup value across chunk boundaries."""
+    user_data = "name word(var_name) -> record\nhost word(var_host, meta_data_Fillup)"
+    test_data = "name a\nname b\nname c\nhost h1\n"
+    # The implicit EOF record keeps the last host.
+    expected = [dict(name=name, host="h1") for name in ["a", "b", "c", ""]]
+    builder = TemplateBuilder(user_data=user_data, test_data=test_data)
+    assert builder.verify(expected_result=expected) is True
+    report = builder.verify_stream(expected_result=expected, chunk_lines=2)
+    assert report["is_verified"] is True
+    assert report["mismatches_count"] == 0
+
+
+def test_verify_stream_from_file(tmp_path):
+    """Verify a file against a generator of expected rows."""
+    filename = tmp_path / "capture.txt"
+    filename.write_text("".join(get_capture(300)))
+
+    builder = TemplateBuilder(user_data=USER_DATA)
+    report = builder.verify_stream(
+        filename, expected_rows_count=300, expected_result=get_expected_rows(300),
+        boundary=r"^router#",
+    )
+    assert report["is_verified"] is True
+    assert report["lines_count"] == 900
+    assert report["chunks_count"] == 300
+    assert report["rows_count"] == 300
+    assert report["mismatches"] == []
+    assert "expected result are matched" in builder.verified_message
+
+
+def test_verify_stream_reports_first_mismatches():
+    """Verify that mismatches and missing rows are counted and reported."""
+    expected = list(get_expected_rows(12))
+    expected[3]["status"] = "down"
+    builder = TemplateBuilder(user_data=USER_DATA)
+    report = builder.verify_stream(
+        get_capture(10), expected_result=expected, max_mismatches=2,
+    )
+    assert report["is_verified"] is False
+    assert report["mismatches_count"] == 3
+    first, second = report["mismatches"]
+    assert first["index"] == 3 and first["actual"]["status"] == "up"
+    assert second == dict(index=10, expected=expected[10], actual=None)
+    assert "different in 3 row(s)" in builder.verified_message
+
+
+def test_verify_stream_defaults_to_test_data():
+    """Verify that the test data of the builder is the default source."""
+    builder = TemplateBuilder(user_data=USER_DATA, test_data="".join(get_capture(2)))
+    assert builder.verify_stream()["rows_count"] == 2
+    assert TemplateBuilder(user_data=USER_DATA).verify_stream()["is_verified"] is False
@@ -0,0 +1,89 @@
+"""
+Unit tests for the `textfsmgen.core.TextFSMParserPool` class.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/core/test_textfsm_parser_pool_class.py
+    or
+    $ python -m pytest tests/unit/core/test_textfsm_parser_pool_class.py
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from textfsmgen.core import TEXTFSM_PARSER_POOL
+from textfsmgen.core import TemplateBuilder
+from textfsmgen.core import TextFSMParserPool
+
+from tests.unit.core import get_expected_template
+from tests.unit.core import get_test_data
+from tests.unit.core import get_expected_result
+from tests.unit.core import get_user_data
+
+
+class TestTextFSMParserPoolClass:
+    """Test suite for TextFSMParserPool."""
+
+    def test_released_parser_is_reused(self):
+        """Verify that a released parser is handed out again without compiling."""
+        pool = TextFSMParserPool()
+        template = get_expected_template()
+        parser = pool.acquire(template)
+        pool.release(template, parser)
+        assert pool.acquire(template) is parser
+        assert pool.get_stats()["hits"] == 1
+        assert pool.get_stats()["misses"] == 1
+
+    def test_parser_is_reset_between_uses(self):
+        """Verify that records never leak from one use to the next."""
+        pool = TextFSMParserPool()
+        template = get_expected_template()
+        for _ in range(3):
+            rows = pool.parse_text_to_dicts(template, get_test_data())
+            assert rows == get_expected_result()
+        assert pool.get_stats()["misses"] == 1
+
+    def test_concurrent_callers(self):
+        """Verify that concurrent threads never share a parser."""
+        pool = TextFSMParserPool(max_idle=4)
+        template = get_expected_template()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda _: pool.parse_text_to_dicts(template, get_test_data()),
+                range(200),
+            ))
+        assert all(rows == get_expected_result() for rows in results)
+        stats = pool.get_stats()
+        assert stats["hits"] + stats["misses"] == 200
+        assert stats["idle"] <= 4
+
+    def test_eviction_bound(self):
+        """Verify that the least recently used template is evicted."""
+        pool = TextFSMParserPool(maxsize=1)
+        template1 = get_expected_template(case="case1")
+        template2 = get_expected_template(case="case2")
+        pool.parse_text_to_dicts(template1, get_test_data())
+        pool.parse_text_to_dicts(template2, get_test_data())
+        assert len(pool) == 1
+        assert pool.evictions == 1
+        pool.parse_text_to_dicts(template1, get_test_data())
+        assert pool.get_stats()["misses"] == 3
+
+    def test_invalid_template_is_not_pooled(self):
+        """Verify that a template that fails to compile raises and is not pooled."""
+        pool = TextFSMParserPool()
+        with pytest.raises(Exception):
+            pool.acquire("Value x (\\d+\n\nStart\n  ^${x}")
+        assert len(pool) == 0
+
+    def test_template_builder_uses_pool(self):
+        """Verify that builders of one template compile it only once."""
+        TEXTFSM_PARSER_POOL.clear()
+        for _ in range(3):
+            builder = TemplateBuilder(user_data=get_user_data(), test_data=get_test_data())
+            assert builder.verify(expected_result=get_expected_result()) is True
+            assert builder.verify(expected_result=get_expected_result()) is True
+        assert TEXTFSM_PARSER_POOL.get_stats()["misses"] == 1
+        assert builder.template_parser.ParseTextToDicts(get_test_data()) == get_expected_result()
@@ -0,0 +1,89 @@
+"""
+Unit tests for the `textfsmgen.core.VariableTable` class.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/core/test_variable_table_class.py
+    or
+    $ python -m pytest tests/unit/core/test_variable_table_class.py
+"""
+
+import pytest
+
+from textfsmgen.core import TemplateBuilder
+from textfsmgen.core import VariableTable
+from textfsmgen.deps import regexapp_VarCls as VarCls
+from textfsmgen.exceptions import TemplateBuilderError
+
+
+def create_var(name, pattern):
+    """Create a variable with an explicit name and pattern."""
+    return VarCls(name=name, pattern=pattern)
+
+
+class TestVariableTableClass:
+    """Test suite for VariableTable."""
+
+    def test_first_seen_order(self):
+        """Verify that unique variables keep their first-seen order."""
+        table = VariableTable()
+        for name in ["c", "a", "b", "a", "c"]:
+            table.add(create_var(name, r"\d+"))
+        assert [var.name for var in table] == ["c", "a", "b"]
+        assert len(table) == 3
+        assert "a" in table and "d" not in table
+        assert table.conflicts == []
+
+    def test_extends_existing_list(self):
+        """Verify that existing variables are indexed and the list is extended."""
+        variables = [create_var("a", r"\d+")]
+        table = VariableTable(variables)
+        assert table.add(create_var("a", r"\d+")) is False
+        assert table.add(create_var("b", r"\S+")) is True
+        assert [var.name for var in variables] == ["a", "b"]
+
+    def test_conflict_is_recorded(self):
+        """Verify that a name reused with another pattern is a conflict."""
+        table = VariableTable()
+        table.add(create_var("a", r"\d+"), line_number=1)
+        assert table.add(create_var("a", r"\S+"), line_number=3) is False
+        assert len(table) == 1
+        assert table.conflicts == [
+            dict(name="a", pattern=r"\d+", line_number=1,
+                 conflicting_pattern=r"\S+", conflicting_line_number=3)
+        ]
+        message = VariableTable.get_conflicts_message(table.conflicts)
+        assert message.startswith("VariableConflictError: variable 'a'")
+        assert VariableTable.get_conflicts_message([]) == ""
+
+
+class TestTemplateBuilderVariables:
+    """Test suite for the variable table of TemplateBuilder."""
+
+    def test_wide_template(self):
+        """Verify that repeated wide rows declare every column once."""
+        row = "  ".join(f"digits(var_c{index})" for index in range(40))
+        user_data = "\n".join([row] * 20)
+        builder = TemplateBuilder(user_data=user_data)
+        names = [var.name for var in builder.variables]
+        assert names == [f"c{index}" for index in range(40)]
+        assert builder.variable_conflicts == []
+
+    def test_conflict_raises(self):
+        """Verify that a conflict is reported with both line numbers."""
+        user_data = "a word(var_x)\nb digits(var_y)\nc digits(var_x)"
+        with pytest.raises(TemplateBuilderError) as ex:
+            TemplateBuilder(user_data=user_data)
+        assert "variable 'x'" in str(ex.value)
+        assert "(line 1)" in str(ex.value) and "(line 3)" in str(ex.value)
+
+    def test_conflict_in_debug_mode(self):
+        """Verify that debug mode keeps the structured conflicts."""
+        user_data = "a word(var_x)\nc digits(var_x)"
+        builder = TemplateBuilder(user_data=user_data, debug=True)
+        assert builder.template == ""
+        assert builder.bad_template.startswith("# VariableConflictError:")
+        conflict, = builder.variable_conflicts
+        assert conflict["name"] == "x"
+        assert (conflict["line_number"], conflict["conflicting_line_number"]) == (1, 2)
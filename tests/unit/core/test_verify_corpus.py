@@ -0,0 +1,99 @@
+"""
+Unit tests for corpus verification in `textfsmgen.core`.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/core/test_verify_corpus.py
+    or
+    $ python -m pytest tests/unit/core/test_verify_corpus.py
+"""
+
+import json
+
+import pytest
+
+from textfsmgen.core import TemplateBuilder
+from textfsmgen.core import get_corpus_filenames
+from textfsmgen.core import get_corpus_report_json
+from textfsmgen.core import verify_corpus
+
+USER_DATA = """
+Interface word(var_intf) is letters(var_status)
+  MTU digits(var_mtu) bytes -> Record
+""".strip()
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Create five captures, two of which have no record."""
+    for index in range(5):
+        if index in (1, 3):
+            content = "router# show version\nno interface here\n"
+        else:
+            content = f"Interface eth{index} is up\n  MTU 1500 bytes\n" * (index + 1)
+        subdir = tmp_path / ("site_a" if index % 2 else "site_b")
+        subdir.mkdir(exist_ok=True)
+        (subdir / f"capture{index}.txt").write_text(content)
+    return tmp_path
+
+
+def test_get_corpus_filenames(corpus):
+    """Verify that a directory and a glob select the same captures."""
+    by_dir = get_corpus_filenames(corpus)
+    by_glob = get_corpus_filenames(str(corpus / "**" / "*.txt"))
+    assert len(by_dir) == 5 and by_dir == by_glob
+    assert get_corpus_filenames(reversed(by_dir)) == by_dir
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_verify_corpus(corpus, workers):
+    """Verify the aggregated counts and the per-file results."""
+    template = TemplateBuilder(user_data=USER_DATA).template
+    report = verify_corpus(template, corpus, workers=workers)
+    assert report["files_count"] == 5
+    assert report["verified_count"] == 3
+    assert report["failures_count"] == 2
+    assert report["skipped_count"] == 0
+    assert report["rows_count"] == 1 + 3 + 5
+    assert report["is_stopped"] is False
+
+    filenames = [result["filename"] for result in report["results"]]
+    assert filenames == get_corpus_filenames(corpus)
+    assert json.loads(get_corpus_report_json(report)) == report
+
+
+def test_verify_corpus_stops_at_threshold(corpus):
+    """Verify that remaining captures are skipped after max_failures."""
+    template = TemplateBuilder(user_data=USER_DATA).template
+    report = verify_corpus(template, corpus, workers=1, max_failures=1)
+    assert report["is_stopped"] is True
+    assert report["failures_count"] == 1
+    assert report["skipped_count"] == 5 - len(report["results"])
+    assert report["skipped_count"] > 0
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize("max_failures", [0, -1])
+def test_verify_corpus_rejects_invalid_threshold(corpus, workers, max_failures):
+    """Verify that a threshold below one failure is rejected."""
+    template = TemplateBuilder(user_data=USER_DATA).template
+    with pytest.raises(ValueError):
+        verify_corpus(template, corpus, workers=workers, max_failures=max_failures)
+
+
+def test_verify_corpus_stops_at_eof(tmp_path):
+    """Verify that rows after an EOF transition are not counted."""
+    (tmp_path / "capture.txt").write_text("1\n2\nstop\n3\n4\n")
+    template = "Value a (\\S+)\n\nStart\n  ^stop -> EOF\n  ^${a} -> Record\n"
+    report = verify_corpus(template, tmp_path, workers=1)
+    assert report["rows_count"] == 2
+    assert report["verified_count"] == 1
+
+
+def test_template_builder_verify_corpus(corpus):
+    """Verify that the builder keeps the text summary as its message."""
+    builder = TemplateBuilder(user_data=USER_DATA)
+    builder.verify_corpus(corpus, workers=1)
+    assert "There is no record after parsed." in builder.verified_message
+    assert "5 file(s): 3 verified, 2 failed, 0 skipped, 9 row(s) in " in builder.verified_message
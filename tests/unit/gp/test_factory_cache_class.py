@@ -0,0 +1,82 @@
+"""
+Unit tests for the `textfsmgen.gp.FactoryCache` class.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/gp/test_factory_cache_class.py
+    or
+    $ python -m pytest tests/unit/gp/test_factory_cache_class.py
+"""
+
+import pytest
+
+from textfsmgen.gp import FACTORY_CACHE
+from textfsmgen.gp import FactoryCache
+from textfsmgen.gp import TranslatedPattern
+
+
+@pytest.fixture
+def enabled_factory_cache():
+    """Enable the shared factory cache for one test and restore it afterward."""
+    maxsize, enabled = FACTORY_CACHE.maxsize, FACTORY_CACHE.enabled
+    FACTORY_CACHE.clear()
+    FACTORY_CACHE.enable()
+    yield FACTORY_CACHE
+    FACTORY_CACHE.clear()
+    FACTORY_CACHE.maxsize, FACTORY_CACHE.enabled = maxsize, enabled
+
+
+class TestFactoryCacheClass:
+    """Test suite for FactoryCache."""
+
+    def test_disabled_by_default(self):
+        """Verify that the cache is opt-in and stores nothing when disabled."""
+        cache = FactoryCache()
+        node = TranslatedPattern.do_factory_create("up")
+        cache.put(("do_factory_create", ("up",)), node)
+        assert cache.get(("do_factory_create", ("up",))) is None
+        assert len(cache) == 0
+
+    def test_hits_misses_and_evictions(self):
+        """Verify LRU ordering and the hit/miss/eviction counters."""
+        cache = FactoryCache(maxsize=2, enabled=True)
+        for data in ["up", "down", "0"]:
+            cache.put(data, TranslatedPattern.do_factory_create(data))
+        assert cache.get("up") is None
+        assert cache.get("down").data == "down"
+        assert cache.get_stats() == dict(
+            hits=1, misses=1, evictions=1, size=2, maxsize=2
+        )
+
+        cache.clear()
+        assert cache.get_stats() == dict(
+            hits=0, misses=0, evictions=0, size=0, maxsize=2
+        )
+
+    def test_factory_uses_cache(self, enabled_factory_cache):
+        """Verify that repeated tokens are served from the shared cache."""
+        node1 = TranslatedPattern.do_factory_create("Gi0/1", "Gi0/2")
+        node2 = TranslatedPattern.do_factory_create("Gi0/1", "Gi0/2")
+        assert enabled_factory_cache.hits == 1
+        assert enabled_factory_cache.misses == 1
+        assert node1 is not node2
+        assert type(node1) is type(node2)
+        assert node1.pattern == node2.pattern
+
+    def test_cached_object_cannot_be_corrupted(self, enabled_factory_cache):
+        """Verify that modifying a returned object leaves the cache intact."""
+        node = TranslatedPattern.do_factory_create("1", "2")
+        node.lst_of_all_data.append("abc")
+        node.data = "corrupted"
+
+        cached_node = TranslatedPattern.do_factory_create("1", "2")
+        assert cached_node.lst_of_all_data == ["1", "2"]
+        assert cached_node.data == "1"
+
+    def test_recommend_pattern_using_data(self, enabled_factory_cache):
+        """Verify that recommendations are cached and stay correct."""
+        node1 = TranslatedPattern.recommend_pattern_using_data("1", "a")
+        node2 = TranslatedPattern.recommend_pattern_using_data("1", "a")
+        assert node1.name == node2.name == "alphabet_numeric"
+        assert enabled_factory_cache.hits >= 1
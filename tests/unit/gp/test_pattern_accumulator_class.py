@@ -0,0 +1,85 @@
+"""
+Unit tests for the `textfsmgen.gp.PatternAccumulator` class.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/gp/test_pattern_accumulator_class.py
+    or
+    $ python -m pytest tests/unit/gp/test_pattern_accumulator_class.py
+"""
+
+import random
+import re
+
+import pytest
+
+from textfsmgen.gp import PatternAccumulator
+from textfsmgen.gp import TranslatedPattern
+
+
+class TestPatternAccumulatorClass:
+    """Test suite for PatternAccumulator."""
+
+    def test_empty_accumulator(self):
+        """Verify the state of an accumulator without values."""
+        acc = PatternAccumulator()
+        assert acc.node is None
+        assert acc.pattern == ""
+        assert len(acc) == 0
+
+    @pytest.mark.parametrize(
+        "values, expected_name",
+        [
+            (["0", "1", "15", "2"], "digits"),
+            (["1.5", "2", "10.25"], "number"),
+            (["Gi0/1", "Gi0/2", "Te1/0/1"], "mixed_word"),
+            (["12:30:01", "00:00:01"], "mixed_number"),
+            (["up", "down", "administratively down"], "words"),
+            (["1", "a"], "alphabet_numeric"),
+        ],
+    )
+    def test_matches_factory(self, values, expected_name):
+        """Verify that streamed values give the same pattern as the factory."""
+        acc = PatternAccumulator()
+        for value in values:
+            acc.add(value)
+        node = TranslatedPattern.do_factory_create(*values)
+        assert acc.node.name == node.name == expected_name
+        assert acc.pattern == node.pattern
+        assert len(acc) == len(values)
+
+    def test_absorbed_values_are_not_kept(self):
+        """Verify that only the values that widened the pattern are retained."""
+        acc = PatternAccumulator()
+        acc.extend(["up", "down"] * 1000)
+        assert len(acc) == 2000
+        assert acc.witnesses == ["up"]
+        assert acc.node.name == "letters"
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_pattern_matches_every_value(self, seed):
+        """Verify that the accumulated pattern matches every absorbed value."""
+        alphabet = "019aZq.,:/-+()[]$%!#@_ "
+        rand = random.Random(seed)
+        for _ in range(100):
+            values = [
+                "".join(rand.choice(alphabet) for _ in range(rand.randint(1, 6))).strip() or "x"
+                for _ in range(rand.randint(1, 8))
+            ]
+            acc = PatternAccumulator(*values)
+            assert all(re.fullmatch(acc.pattern, value) for value in values), values
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_widened_pattern_matches_factory(self, seed):
+        """Verify that widening on digits and punctuation picks the factory class."""
+        node = TranslatedPattern.do_factory_create("0", "-")
+        assert PatternAccumulator("0", "-").pattern == node.pattern == r"[\x21-\x7e]"
+        rand = random.Random(seed)
+        for _ in range(500):
+            values = [
+                "".join(rand.choice("0123-.:/") for _ in range(rand.randint(1, 4)))
+                for _ in range(rand.randint(1, 5))
+            ]
+            node = TranslatedPattern.do_factory_create(*values)
+            assert PatternAccumulator(*values).pattern == node.pattern, values
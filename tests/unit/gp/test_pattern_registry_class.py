@@ -0,0 +1,78 @@
+"""
+Unit tests for the `textfsmgen.gp.PatternRegistry` class.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/gp/test_pattern_registry_class.py
+    or
+    $ python -m pytest tests/unit/gp/test_pattern_registry_class.py
+"""
+
+import pytest
+
+from textfsmgen.deps import genericlib_PATTERN as PATTERN
+from textfsmgen.gp import PATTERN_REGISTRY
+from textfsmgen.gp import PatternRegistry
+from textfsmgen.gp import TranslatedPattern
+
+
+class TestPatternRegistryClass:
+    """Test suite for PatternRegistry."""
+
+    def test_register_and_lookup(self):
+        """Verify that a registered pattern is retrievable by its name."""
+        registry = PatternRegistry()
+        registry.register("digits", PATTERN.DIGITS)
+        assert "digits" in registry
+        assert len(registry) == 1
+        assert registry.get_pattern("digits") == PATTERN.DIGITS
+        assert registry.get_pattern("unknown", "fallback") == "fallback"
+
+    def test_matcher_is_compiled_once(self):
+        """Verify that the same compiled matcher is reused for a pattern."""
+        registry = PatternRegistry()
+        matcher = registry.get_matcher(PATTERN.WORD)
+        assert registry.get_matcher(PATTERN.WORD) == matcher
+
+    def test_unregistered_patterns_are_bounded(self):
+        """Verify that ad-hoc patterns are evicted while registered ones stay."""
+        registry = PatternRegistry(maxsize=2)
+        registry.register("digits", PATTERN.DIGITS)
+        for index in range(10):
+            assert registry.get_matcher(f"a{{{index}}}")("a" * index)
+        assert list(registry._adhoc_matchers) == ["a{8}", "a{9}"]
+        assert PATTERN.DIGITS in registry._matchers
+        assert registry.get_matcher(PATTERN.DIGITS)("123")
+        assert len(registry._adhoc_matchers) == 2
+
+    @pytest.mark.parametrize(
+        "pattern, data, expected_result",
+        [
+            (PATTERN.DIGITS, "123", True),
+            (PATTERN.DIGITS, "123a", False),
+            (PATTERN.DIGITS, "123\n", False),
+            (PATTERN.WORD_GROUP, "abc  def", True),
+            (PATTERN.WORD_GROUP, "abc", False),
+        ],
+    )
+    def test_matcher_is_anchored(self, pattern, data, expected_result):
+        """Verify that matchers require the whole string to match."""
+        matcher = PATTERN_REGISTRY.get_matcher(pattern)
+        assert bool(matcher(data)) is expected_result
+
+    @pytest.mark.parametrize(
+        "data, expected_lessen_pattern, expected_root_pattern",
+        [
+            ("abc", PATTERN.LETTERS, PATTERN.NON_WHITESPACES),
+            ("abc def", PATTERN.WORD_OR_GROUP, PATTERN.NON_WHITESPACES_OR_GROUP),
+            ("- +", PATTERN.PUNCTS_OR_GROUP, PATTERN.NON_WHITESPACES_OR_GROUP),
+            ("1", PATTERN.DIGIT, PATTERN.NON_WHITESPACE),
+        ],
+    )
+    def test_registry_backs_translated_pattern(self, data, expected_lessen_pattern,
+                                               expected_root_pattern):
+        """Verify that lessen and root patterns resolve through the registry."""
+        node = TranslatedPattern.do_factory_create(data)
+        assert node.lessen_pattern == expected_lessen_pattern
+        assert node.root_pattern == expected_root_pattern
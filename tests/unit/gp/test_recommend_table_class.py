@@ -0,0 +1,65 @@
+"""
+Unit tests for the `textfsmgen.gp.RecommendTable` class.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/gp/test_recommend_table_class.py
+    or
+    $ python -m pytest tests/unit/gp/test_recommend_table_class.py
+"""
+
+import pytest
+
+from textfsmgen.gp import FACTORY_CLASSES
+from textfsmgen.gp import RECOMMEND_TABLE
+from textfsmgen.gp import TranslatedPattern
+
+VARIANTS = [
+    ("1",), ("7", "0"), ("12",), ("1.5",), (".5", "10"), ("a",), ("ab",),
+    ("Up",), ("a", "1"), ("a1",), ("-",), ("--",), ("- -",), ("-  +",),
+    ("a", "-"), ("-1",), ("10%",), ("a-1",), ("Gi0/1",), ("ab cd",),
+    ("ab  cd",), ("ab cd", "ef"), ("a-1 b",), ("a-1  b",), ("é",),
+    ("éé",), ("é é",), ("é  x",),
+]
+
+
+def get_outcome(func, node1, node2):
+    """Return a comparable summary of a recommendation, or its error type."""
+    try:
+        node = func(node1, node2)
+    except Exception as ex:     # noqa
+        return type(ex).__name__
+    return type(node), node.pattern, node.lst_of_all_data, bool(node)
+
+
+class TestRecommendTableClass:
+    """Test suite for RecommendTable."""
+
+    def test_table_covers_every_class_pair(self):
+        """Verify that the table holds an entry for every pair of classes."""
+        assert len(RECOMMEND_TABLE.entries) == len(FACTORY_CLASSES) ** 2
+        modes = {mode for mode, _, _ in RECOMMEND_TABLE.entries.values()}
+        assert modes == {"subset", "superset", "join", "unsupported"}
+
+    def test_variants_cover_every_class(self):
+        """Verify that the data variants exercise every factory class."""
+        classes = {type(TranslatedPattern.do_factory_create(*data)) for data in VARIANTS}
+        assert classes == set(FACTORY_CLASSES)
+
+    @pytest.mark.parametrize("data1", VARIANTS)
+    def test_table_reproduces_recommend(self, data1):
+        """Verify that the table gives the same outcome as recommend()."""
+        node1 = TranslatedPattern.do_factory_create(*data1)
+        for data2 in VARIANTS:
+            node2 = TranslatedPattern.do_factory_create(*data2)
+            expected = get_outcome(lambda a, b: a.recommend(b), node1, node2)
+            result = get_outcome(RECOMMEND_TABLE.recommend, node1, node2)
+            assert result == expected, (data1, data2)
+
+    def test_non_translated_pattern_operand(self):
+        """Verify that an unknown operand still raises the recommend error."""
+        node = TranslatedPattern.do_factory_create("1")
+        with pytest.raises(Exception) as ex:
+            TranslatedPattern.recommend_pattern(node, "abc")
+        assert type(ex.value).__name__ == "NotImplementRecommendedRTPattern"
@@ -0,0 +1,108 @@
+"""
+Unit tests for the `textfsmgen.gp.TokenProfile` class.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/gp/test_token_profile_class.py
+    or
+    $ python -m pytest tests/unit/gp/test_token_profile_class.py
+"""
+
+import random
+
+import pytest
+
+from textfsmgen.gp import FACTORY_CLASSES
+from textfsmgen.gp import TokenProfile
+from textfsmgen.gp import TranslatedPattern
+from textfsmgen.gp import get_candidate_classes
+
+
+def create_by_class_chain(data, *other):
+    """Reference factory: try every class of `FACTORY_CLASSES` in order."""
+    for class_ in FACTORY_CLASSES:
+        node = class_(data, *other)
+        if node:
+            return node
+    return None
+
+
+def create_by_factory(data, *other):
+    """Factory under test, returning None instead of raising."""
+    try:
+        return TranslatedPattern.do_factory_create(data, *other)
+    except Exception:   # noqa
+        return None
+
+
+def get_random_tokens(seed, total):
+    """Generate tokens mixing every character kind known to `TokenProfile`."""
+    alphabet = "019aZq.,:/-+()[]$%!#@_ \t٣é"
+    rand = random.Random(seed)
+    tokens = []
+    for _ in range(total):
+        size = rand.randint(1, 6)
+        tokens.append("".join(rand.choice(alphabet) for _ in range(size)))
+    return tokens
+
+
+EDGE_TOKENS = [
+    "", " ", "1", "123", "1.5", ".5", "1.", "-1", "+1.5", "(1.1)", "10%",
+    "1,000", "12:30", "1/2", "5G", "a", "abc", "a1", "1a", "Gi0/1", "-", "--",
+    "- -", "-  -", "!", "a b", "a  b", "a! b", "a,  b-c", "xé", "٣",
+    "٣٣", "up", "down", "5\n", "ab\n", "a b\n", "\t", "a\tb",
+]
+
+
+class TestTokenProfileClass:
+    """Test suite for TokenProfile and get_candidate_classes."""
+
+    @pytest.mark.parametrize(
+        "token, expected_mask",
+        [
+            ("1", TokenProfile.ASCII_DIGIT),
+            ("a1", TokenProfile.LETTER | TokenProfile.ASCII_DIGIT),
+            ("-1.5", TokenProfile.NUMBER_PUNCT | TokenProfile.ASCII_DIGIT | TokenProfile.DOT),
+            ("a! b", TokenProfile.LETTER | TokenProfile.PUNCT | TokenProfile.SPACE),
+            ("٣\t", TokenProfile.UNICODE_DIGIT | TokenProfile.WHITESPACE),
+            ("é", TokenProfile.OTHER),
+        ],
+    )
+    def test_mask(self, token, expected_mask):
+        """Verify that a token is summarized into the expected kind mask."""
+        assert TokenProfile(token).mask == expected_mask
+
+    def test_candidates_preserve_factory_order(self):
+        """Verify that candidates keep the relative order of FACTORY_CLASSES."""
+        candidates = get_candidate_classes("abc", "a1")
+        positions = [FACTORY_CLASSES.index(class_) for class_ in candidates]
+        assert positions == sorted(positions)
+
+    @pytest.mark.parametrize("token", EDGE_TOKENS)
+    def test_equivalence_for_single_token(self, token):
+        """Verify that the factory matches the full class chain for one token."""
+        expected = create_by_class_chain(token)
+        result = create_by_factory(token)
+        if expected is None:
+            assert result is None
+        else:
+            assert type(result) is type(expected)
+            assert result.pattern == expected.pattern
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_equivalence_for_token_groups(self, seed):
+        """Verify that the factory matches the full class chain for token groups."""
+        tokens = EDGE_TOKENS + get_random_tokens(seed, 150)
+        rand = random.Random(seed)
+        groups = [[token] for token in tokens]
+        groups += [rand.sample(tokens, rand.randint(2, 4)) for _ in range(300)]
+
+        for group in groups:
+            expected = create_by_class_chain(*group)
+            result = create_by_factory(*group)
+            if expected is None:
+                assert result is None, group
+            else:
+                assert type(result) is type(expected), group
+                assert result.pattern == expected.pattern, group
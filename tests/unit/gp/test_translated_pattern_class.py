@@ -10,6 +10,10 @@ Run pytest in the project root to execute these tests:
 """
 
 import pytest
+from textfsmgen.gp import FACTORY_CLASSES
+from textfsmgen.gp import LESSEN_NAMES
+from textfsmgen.gp import NOT_CREATED
+from textfsmgen.gp import PATTERN_REGISTRY
 from textfsmgen.gp import TranslatedPattern
 
 
@@ -314,3 +318,101 @@ class TestGetReadableSnippetMethod:
         snippet = node.get_readable_snippet(var=var_name)
         assert snippet == expected_snippet
         assert node.pattern == expected_pattern
+
+
+class TestClassifyManyMethod:
+    """Test suite for TranslatedPattern.classify_many."""
+
+    def test_one_result_per_group(self):
+        """
+        Verify that every input group gets a result, in input order, that
+        matches the single-group factory.
+        """
+        groups = ["up", ["up", "down"], "0", ["1", "22", "1"], "Gi0/1", "up"]
+        nodes = TranslatedPattern.classify_many(groups)
+        assert len(nodes) == len(groups)
+        for group, node in zip(groups, nodes):
+            expected = TranslatedPattern.do_factory_create(*to_list(group))
+            assert type(node) is type(expected)
+            assert node.pattern == expected.pattern
+
+    def test_distinct_groups_are_classified_once(self):
+        """Verify that equal groups, after collapsing repeats, share one result."""
+        nodes = TranslatedPattern.classify_many([["1", "2", "1"], ["1", "2"], "1", "1"])
+        assert nodes[0] is nodes[1]
+        assert nodes[2] is nodes[3]
+        assert nodes[0].lst_of_all_data == ["1", "2"]
+
+    def test_unclassifiable_group(self):
+        """Verify that an unclassifiable group raises the factory error."""
+        with pytest.raises(Exception) as ex:
+            TranslatedPattern.classify_many(["abc", "a\tb"])
+        assert type(ex.value).__name__ == "FactoryTranslatedPatternRTIssue"
+
+
+class TestResolvedNames:
+    """Test suite for the precomputed TranslatedPattern name lookups."""
+
+    @pytest.mark.parametrize("class_", FACTORY_CLASSES)
+    def test_resolved_names_follow_ref_names(self, class_):
+        """Verify that each defined pattern resolves to its aligned ref name."""
+        pairs = zip(class_.defined_patterns, class_.ref_names)
+        for pattern, ref_name in pairs:
+            actual_name, lessen_name, lessen_pattern = class_.resolved_names[pattern]
+            assert actual_name == ref_name
+            assert lessen_name == LESSEN_NAMES.get(ref_name, class_.name)
+            assert lessen_pattern == PATTERN_REGISTRY.get_pattern(lessen_name)
+
+    @pytest.mark.parametrize(
+        "data, expected_actual_name, expected_lessen_name",
+        [
+            ("1", "digit", "digit"),
+            ("abc def", "phrase", "word_or_group"),
+            ("- +", "puncts_phrase", "puncts_or_group"),
+            ("a,  b-c", "mixed_word_group", "mixed_word_or_group"),
+        ],
+    )
+    def test_name_properties(self, data, expected_actual_name, expected_lessen_name):
+        """Verify actual_name and lessen_name of factory-created nodes."""
+        node = TranslatedPattern.do_factory_create(data)
+        assert node.actual_name == expected_actual_name
+        assert node.lessen_name == expected_lessen_name
+
+
+class TestTryCreateMethod:
+    """Test suite for the non-raising TranslatedPattern factories."""
+
+    @pytest.mark.parametrize("data", ["1", "abc", "a1 b12", "- +", "\xc8"])
+    def test_try_create_matches_factory(self, data):
+        """Verify that try_create returns the same node as do_factory_create."""
+        node = TranslatedPattern.try_create(data)
+        expected_node = TranslatedPattern.do_factory_create(data)
+        assert type(node) is type(expected_node)
+        assert node.pattern == expected_node.pattern
+
+    @pytest.mark.parametrize("data", ["", " ", "a\nb"])
+    def test_try_create_returns_sentinel(self, data):
+        """Verify that unsupported data yields NOT_CREATED instead of raising."""
+        assert TranslatedPattern.try_create(data) is NOT_CREATED
+        assert not NOT_CREATED
+        with pytest.raises(Exception):
+            TranslatedPattern.do_factory_create(data)
+
+    @pytest.mark.parametrize(
+        "data1, data2, is_created",
+        [
+            ("1", "abc", True),
+            ("- -", "-", True),
+            ("ab cd", "a-1", False),     # words vs mixed word is unsupported
+        ],
+    )
+    def test_try_recommend_pattern(self, data1, data2, is_created):
+        """Verify that try_recommend_pattern returns NOT_CREATED for unsupported pairs."""
+        node1 = TranslatedPattern.do_factory_create(data1)
+        node2 = TranslatedPattern.do_factory_create(data2)
+        node = TranslatedPattern.try_recommend_pattern(node1, node2)
+        if is_created:
+            expected_node = TranslatedPattern.recommend_pattern(node1, node2)
+            assert node.pattern == expected_node.pattern
+        else:
+            assert node is NOT_CREATED
@@ -17,6 +17,7 @@ import pytest
 from textfsmgen.verify import verify
 from textfsmgen.core import get_textfsm_template
 
+from textfsmgen.gp import NOT_CREATED
 from textfsmgen.gpcategory import CategoryLinePattern
 
 from tests.unit import replace_dates_with_placeholder
@@ -348,3 +349,34 @@ class TestCategoryLinePattern:
         # Verification passes
         is_verified = verify(generated_snippet, line, expected_result=expected_result)
         assert is_verified, "Verification failed: parsed result did not match expected"
+
+
+class TestCategoryLinePatternTryCreate:
+    """Test class for CategoryLinePattern.try_create"""
+    @pytest.mark.parametrize(
+        "line, count, expected_snippet",
+        [
+            ("Name: abc", 1, "Name: letters(var_Name)"),
+            ("Name: a  Type: b", 2, "Name: letter(var_Name)  Type: letter(var_Type)"),
+        ]
+    )
+    def test_try_create(self, line, count, expected_snippet):
+        """Verify that try_create parses category lines like the constructor."""
+        node = CategoryLinePattern.try_create(line, count=count)
+        assert node.to_template_snippet() == expected_snippet
+        expected_node = CategoryLinePattern(line, count=count)
+        assert node.to_regex() == expected_node.to_regex()
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "no separator",     # missing separator
+            ": value",          # missing variable text
+            "12:30:01 up",      # time format
+        ]
+    )
+    def test_try_create_returns_sentinel(self, line):
+        """Verify that non-category lines yield NOT_CREATED instead of raising."""
+        assert CategoryLinePattern.try_create(line) is NOT_CREATED
+        with pytest.raises(Exception):
+            CategoryLinePattern(line)
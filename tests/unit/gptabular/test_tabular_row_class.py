@@ -0,0 +1,49 @@
+"""
+Unit tests for the `textfsmgen.gptabular.TabularRow` class.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/gptabular/test_tabular_row_class.py
+    or
+    $ python -m pytest tests/unit/gptabular/test_tabular_row_class.py
+"""
+
+import pytest
+
+from textfsmgen.gp import NOT_CREATED
+from textfsmgen.gptabular import TabularRow
+
+
+@pytest.mark.parametrize(
+    "line, pattern, case, columns_count, expected_positions",
+    [
+        ("a   b   c", r" *\S+ *", "findall", 3, [(0, 4), (4, 8), (8, 999999)]),
+        ("a | b | c", "|", "split", 3, [(0, 2), (2, 5), (5, 999999)]),
+        ("a   b", r"(?P<v000>\S+ +)(?P<v001>\S+)", "variable", -1, [(0, 4), (4, 999999)]),
+    ]
+)
+def test_try_create_ref_row(line, pattern, case, columns_count, expected_positions):
+    """Verify that try_create_ref_row builds the same row as create_ref_row."""
+    ref_row = TabularRow.try_create_ref_row(line, pattern, case=case, columns_count=columns_count)
+    expected_ref_row = TabularRow.create_ref_row(line, pattern, case=case, columns_count=columns_count)
+    positions = [(cell.left, cell.right) for cell in ref_row.cells]
+    assert positions == expected_positions
+    assert positions == [(cell.left, cell.right) for cell in expected_ref_row.cells]
+
+
+@pytest.mark.parametrize(
+    "line, pattern, case, columns_count",
+    [
+        ("a   b", r" *\S+ *", "findall", 3),        # column count mismatch
+        ("a | b", "|", "split", 3),                 # column count mismatch
+        ("a   b", r"(?P<v000>\d+)", "variable", -1),  # no tokens
+        ("a   b", r"\S+", "unsupported", -1),       # unsupported case
+    ]
+)
+def test_try_create_ref_row_returns_sentinel(line, pattern, case, columns_count):
+    """Verify that unparsable lines yield NOT_CREATED instead of raising."""
+    result = TabularRow.try_create_ref_row(line, pattern, case=case, columns_count=columns_count)
+    assert result is NOT_CREATED
+    with pytest.raises(Exception):
+        TabularRow.create_ref_row(line, pattern, case=case, columns_count=columns_count)
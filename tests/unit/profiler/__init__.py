@@ -0,0 +1,10 @@
+"""
+Unit tests for the `textfsmgen.profiler` module.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/profiler
+    or
+    $ python -m pytest tests/unit/profiler
+"""
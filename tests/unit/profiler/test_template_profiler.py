@@ -0,0 +1,109 @@
+"""
+Unit tests for the `textfsmgen.profiler` module.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/profiler/test_template_profiler.py
+    or
+    $ python -m pytest tests/unit/profiler/test_template_profiler.py
+"""
+
+from io import StringIO
+
+import pytest
+
+from textfsmgen.core import TemplateBuilder
+from textfsmgen.exceptions import TemplateBuilderError
+from textfsmgen.profiler import ProfilingTextFSM
+from textfsmgen.profiler import get_profile_report_text
+from textfsmgen.profiler import profile_template
+
+from tests.unit.core import get_user_data
+from tests.unit.core import get_test_data
+
+TEMPLATE = r"""
+Value intf (\S+)
+Value mtu (\d+)
+
+Start
+  ^Interface ${intf} is (up|down) -> Detail
+
+Detail
+  ^  MTU ${mtu} bytes -> Record Start
+""".lstrip()
+
+DATA = """
+Interface eth0 is up
+  Hardware is Ethernet
+  MTU 1500 bytes
+Interface eth1 is down
+  MTU 9000 bytes
+""".lstrip()
+
+
+class TestProfilingTextFSM:
+    """Test suite for the instrumented parser."""
+
+    def test_counters(self):
+        """Verify the per-state and per-rule attempts and matches."""
+        parser = ProfilingTextFSM(StringIO(TEMPLATE))
+        assert len(parser.ParseTextToDicts(DATA)) == 2
+
+        states = {state["state"]: state for state in parser.get_states_report()}
+        assert states["Start"]["lines_count"] == 2
+        assert states["Detail"]["lines_count"] == 3
+        assert (states["Detail"]["attempts"], states["Detail"]["matches"]) == (3, 2)
+
+        first, second = parser.get_rules_report()
+        assert (first["state"], first["line_num"]) == ("Start", 5)
+        assert (first["attempts"], first["matches"]) == (2, 2)
+        assert second["rule"] == "^  MTU ${mtu} bytes"
+        assert sum(rule["regex_share"] for rule in (first, second)) == pytest.approx(1, abs=1e-3)
+
+    def test_reset_profile(self):
+        """Verify that the counters restart from zero."""
+        parser = ProfilingTextFSM(StringIO(TEMPLATE))
+        parser.ParseTextToDicts(DATA)
+        parser.reset_profile()
+        assert all(rule["attempts"] == 0 for rule in parser.get_rules_report())
+        assert all(state["lines_count"] == 0 for state in parser.get_states_report())
+
+
+class TestProfileTemplate:
+    """Test suite for the profile report."""
+
+    def test_profile_template(self):
+        """Verify the totals of a report."""
+        report = profile_template(TEMPLATE, DATA)
+        assert report["lines_count"] == report["checked_lines_count"] == 5
+        assert report["rows_count"] == 2
+        assert report["lines_per_second"] > 0
+        assert report["regex_elapsed"] >= 0
+        assert [state["state"] for state in report["states"]] == ["Start", "Detail"]
+
+    def test_report_text(self):
+        """Verify the tables and summary of a report."""
+        report = profile_template(TEMPLATE, DATA)
+        text = get_profile_report_text(report, limit=1)
+        assert "lines_count" in text and "regex_share" in text
+        assert text.splitlines()[-1].startswith("5 line(s), 2 row(s) in ")
+        assert text.count("^  MTU") + text.count("^Interface") == 1
+
+    def test_template_builder(self, capsys):
+        """Verify the profile report of a builder and of a profiled verify."""
+        builder = TemplateBuilder(user_data=get_user_data(case="case2"),
+                                  test_data=get_test_data())
+        report = builder.get_profile_report()
+        assert report["rows_count"] == len(builder.get_test_result())
+
+        assert builder.profile_report is None
+        builder.verify(debug=True, profile=True)
+        assert builder.profile_report["rows_count"] == report["rows_count"]
+        assert "Profile:" in capsys.readouterr().out
+
+    def test_template_builder_without_test_data(self):
+        """Verify that profiling needs test data."""
+        builder = TemplateBuilder(user_data=get_user_data(case="case2"))
+        with pytest.raises(TemplateBuilderError):
+            builder.get_profile_report()
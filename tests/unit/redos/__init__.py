@@ -0,0 +1,10 @@
+"""
+Unit tests for the `textfsmgen.redos` module.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/redos
+    or
+    $ python -m pytest tests/unit/redos
+"""
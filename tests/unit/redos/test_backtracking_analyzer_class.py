@@ -0,0 +1,134 @@
+"""
+Unit tests for the `textfsmgen.redos.BacktrackingAnalyzer` class.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/redos/test_backtracking_analyzer_class.py
+    or
+    $ python -m pytest tests/unit/redos/test_backtracking_analyzer_class.py
+"""
+
+import re
+from textwrap import dedent
+
+import pytest
+
+from textfsmgen.deps import genericlib_PATTERN as PATTERN
+from textfsmgen.gp import TranslatedPattern
+from textfsmgen.gpdiff import DiffLinePattern
+from textfsmgen.gptabular import TabularTextPattern
+from textfsmgen.redos import BacktrackingAnalyzer
+from textfsmgen.redos import analyze_pattern
+from textfsmgen.redos import analyze_template
+from textfsmgen.redos import format_pattern
+from textfsmgen.redos import sre_parse
+
+TABLE = dedent("""
+    fruits    meat      drinks
+    ------    --------  -------
+    orange    pork      water
+    peach               pepsi soda
+    mango     chicken
+""").strip()
+
+
+class TestBacktrackingAnalyzer:
+    """Test suite for the backtracking analyzer."""
+
+    @pytest.mark.parametrize(
+        "pattern,severity",
+        [
+            (PATTERN.MIXED_WORD_GROUP, "exponential"),
+            (PATTERN.MIXED_WORDS, "exponential"),
+            (r"(?: *\S+ *)+", "exponential"),
+            (r"(\d+)+$", "exponential"),
+            (PATTERN.MIXED_WORD, "polynomial"),
+            (PATTERN.NUMBER, "polynomial"),
+            (PATTERN.MIXED_NUMBER, "polynomial"),
+            (r"(?P<a>\S+( +\S+){,3}) +(?P<b>\S+)", "polynomial"),
+            (PATTERN.NON_WHITESPACES_OR_GROUP, ""),
+            (PATTERN.WORD_GROUP, ""),
+            (PATTERN.PUNCTS_GROUP, ""),
+            (r"(?P<a>\S+) +(?P<b>\d+)", ""),
+            (r"(?P<a>\w+)-(?P<b>\w+)", ""),
+        ]
+    )
+    def test_severity(self, pattern, severity):
+        """Verify the worst severity found in known patterns."""
+        assert BacktrackingAnalyzer(pattern).severity == severity
+
+    def test_finding(self):
+        """Verify the content of a finding."""
+        finding, = analyze_pattern(r"x(?P<v>\d*[.]?\d+)")
+        assert finding["kind"] == "overlapping_quantifiers"
+        assert finding["severity"] == "polynomial"
+        assert finding["fragment"] == r"\d*\.?\d+"
+        assert "more than one way" in finding["message"]
+
+    def test_nested_quantifier(self):
+        """Verify that iterations splitting the same characters are flagged."""
+        kinds = {finding["kind"] for finding in analyze_pattern(r"(a|aa)+b")}
+        assert kinds == {"nested_quantifier"}
+
+    def test_invalid_pattern(self):
+        """Verify that an invalid pattern is reported."""
+        with pytest.raises(re.error):
+            analyze_pattern("(a")
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            PATTERN.MIXED_WORD_GROUP,
+            PATTERN.MIXED_NUMBER,
+            r"(?i)^(?P<a>[^\]x-]+)(?:y|zz)*?(?=\d)\b.$",
+            r"(?P<a>a)(?(a)b|c)(?P=a)\1{2,}(?!q)(?<=w)(?s-i:.)\Z",
+        ]
+    )
+    def test_format_pattern(self, pattern):
+        """Verify that formatting parsed items gives back the same items."""
+        parsed = sre_parse.parse(pattern)
+        names = {number: name for name, number in parsed.state.groupdict.items()}
+        text = format_pattern(parsed.data, names, parsed.state.flags)
+        reparsed = sre_parse.parse(text)
+        assert repr(reparsed.data) == repr(parsed.data)
+        assert reparsed.state.flags == parsed.state.flags
+
+
+class TestGeneratedPatterns:
+    """Test suite for the analysis of gp, gptabular and gpdiff output."""
+
+    def test_gp(self):
+        """Verify the patterns of translated words."""
+        node = TranslatedPattern.do_factory_create("a1-b x2:y")
+        assert BacktrackingAnalyzer(node.get_regex_pattern(var="v")).severity == "exponential"
+        node = TranslatedPattern.do_factory_create("abc def")
+        assert analyze_pattern(node.get_regex_pattern(var="v")) == []
+
+    def test_gptabular(self):
+        """Verify that columns sharing spaces are flagged."""
+        findings = analyze_pattern(TabularTextPattern(TABLE).to_regex())
+        assert findings
+        assert {finding["severity"] for finding in findings} == {"polynomial"}
+
+    def test_gpdiff(self):
+        """Verify that a line with mixed words is flagged."""
+        node = DiffLinePattern("Interface eth0 is up, line 1.5 mb",
+                               "Interface eth1 is admin down, line 22 kb")
+        assert BacktrackingAnalyzer(node.pattern).severity == "exponential"
+
+    def test_template(self):
+        """Verify that findings are reported with their rule."""
+        template = dedent(r"""
+            Value name ([\x21-\x7e]*[a-zA-Z0-9][\x21-\x7e]*( [\x21-\x7e]*[a-zA-Z0-9][\x21-\x7e]*)*)
+            Value mtu (\d+)
+
+            Start
+              ^Interface ${name} is up
+              ^  MTU ${mtu} bytes -> Record
+        """).lstrip()
+        findings = analyze_template(template)
+        assert findings
+        assert {finding["line_num"] for finding in findings} == {5}
+        assert {finding["state"] for finding in findings} == {"Start"}
+        assert findings[0]["rule"] == "^Interface ${name} is up"
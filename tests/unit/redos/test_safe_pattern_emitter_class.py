@@ -0,0 +1,182 @@
+"""
+Unit tests for the `textfsmgen.redos.SafePatternEmitter` class.
+
+Usage
+-----
+Run pytest in the project root to execute these tests:
+    $ pytest tests/unit/redos/test_safe_pattern_emitter_class.py
+    or
+    $ python -m pytest tests/unit/redos/test_safe_pattern_emitter_class.py
+"""
+
+import re
+import time
+from io import StringIO
+from itertools import product
+from textwrap import dedent
+
+import pytest
+from textfsm import TextFSM
+
+from textfsmgen.deps import genericlib_PATTERN as PATTERN
+from textfsmgen.gp import TranslatedPattern
+from textfsmgen.gpdiff import DiffLinePattern
+from textfsmgen.gptabular import TabularTextPattern
+from textfsmgen.redos import HAS_POSSESSIVE
+from textfsmgen.redos import BacktrackingAnalyzer
+from textfsmgen.redos import SafePatternEmitter
+from textfsmgen.redos import make_safe_pattern
+from textfsmgen.redos import make_safe_template
+
+CONTEXTS = [
+    "(?P<v>{p})",
+    "(?P<v>{p})$",
+    r"(?P<v>{p}) (?P<t>\S+)",
+    r"(?P<v>{p}) +(?P<t>{p})$",
+    r"(?P<v>{p})(?P<t>\d*)x",
+]
+
+STRINGS = ["".join(chars) for size in range(6) for chars in product("a1.: ", repeat=size)]
+
+# Seconds allowed for one match of a safe pattern on a pathological line.
+TIME_LIMIT = 0.5
+
+
+def get_match_result(regex, method, text):
+    """Return the span and groups of a match, or None."""
+    match = getattr(regex, method)(text)
+    return match and (match.span(), match.groups(), match.groupdict())
+
+
+def assert_equivalent(pattern, safe_pattern):
+    """Assert that two patterns match every test string the same way."""
+    regex, safe_regex = re.compile(pattern), re.compile(safe_pattern)
+    for text in STRINGS:
+        for method in ("match", "search", "fullmatch"):
+            expected = get_match_result(regex, method, text)
+            assert get_match_result(safe_regex, method, text) == expected, (method, text)
+
+
+def get_elapsed_time(pattern, text):
+    """Return the seconds taken by one failed match."""
+    regex = re.compile(pattern)
+    start = time.perf_counter()
+    assert regex.match(text) is None
+    return time.perf_counter() - start
+
+
+class TestSafePatternEmitter:
+    """Test suite for the safe pattern emitter."""
+
+    @pytest.mark.parametrize(
+        "name",
+        ["MIXED_WORD", "MIXED_WORD_GROUP", "MIXED_WORDS", "NUMBER",
+         "MIXED_NUMBER", "NON_WHITESPACES_OR_GROUP", "WORD_GROUP"]
+    )
+    @pytest.mark.parametrize("context", CONTEXTS)
+    def test_equivalence(self, name, context):
+        """Verify that safe patterns match and capture like the originals."""
+        pattern = context.format(p=getattr(PATTERN, name))
+        assert_equivalent(pattern, make_safe_pattern(pattern, is_complete=True))
+        fragment = "(?:{})(?P<rest>.*)"
+        assert_equivalent(fragment.format(pattern),
+                          fragment.format(make_safe_pattern(pattern)))
+
+    def test_unambiguous_rewrites(self):
+        """Verify the rewrites applied to ambiguous runs."""
+        emitter = SafePatternEmitter(PATTERN.MIXED_WORD)
+        assert emitter.rewrites[0] == dict(
+            kind="unambiguous_prefix", fragment=r"[\x21-\x7e]*",
+            replacement=r"[\x21-\x2f\x3a-\x40\x5b-\x60\x7b-\x7e]*",
+        )
+        emitter = SafePatternEmitter(PATTERN.NUMBER)
+        assert emitter.rewrites[0]["kind"] == "optional_separator"
+        assert BacktrackingAnalyzer(emitter.safe_pattern).severity == ""
+
+    @pytest.mark.skipif(not HAS_POSSESSIVE, reason="possessive quantifiers need Python 3.11+")
+    def test_possessive_quantifiers(self):
+        """Verify that only quantifiers that never give back become possessive."""
+        pattern = r"(?P<a>\S+) +(?P<b>\d+)$"
+        assert make_safe_pattern(pattern, is_complete=True) == r"(?P<a>\S++) ++(?P<b>\d++)$"
+        assert make_safe_pattern(r"(?P<a>\S+) +(?P<b>\d+)") == r"(?P<a>\S++) ++(?P<b>\d+)"
+        assert make_safe_pattern(r"\d+", is_complete=True) == r"\d++"
+        assert make_safe_pattern(r"(?P<a>\S+)\S") == r"(?P<a>\S+)\S"
+        assert make_safe_pattern(r"\s+$") == r"\s+$"
+
+    def test_unchanged_pattern(self):
+        """Verify that a pattern without rewrites is returned as is."""
+        assert make_safe_pattern(r"[.](?P<a>x|y)") == r"[.](?P<a>x|y)"
+        assert SafePatternEmitter(r"[.](?P<a>x|y)").rewrites == []
+
+    def test_emitter_modes(self):
+        """Verify the safe mode of gp, gptabular and gpdiff."""
+        node = TranslatedPattern.do_factory_create("a1-b x2:y")
+        pattern = node.get_regex_pattern(var="v", is_safe=True)
+        assert pattern.startswith("(?P<v>")
+        assert BacktrackingAnalyzer(pattern).severity != "exponential"
+
+        table = dedent("""
+            fruits    meat      drinks
+            ------    --------  -------
+            orange    pork      water
+            peach               pepsi soda
+        """).strip()
+        node = TabularTextPattern(table)
+        for line in table.splitlines()[2:]:
+            expected = re.match(node.to_regex(), line).groupdict()
+            assert re.match(node.to_regex(is_safe=True), line).groupdict() == expected
+
+        lines = ["Interface eth0 is up, line 1.5 mb", "Interface eth1 is admin down, line 22 kb"]
+        node = DiffLinePattern(*lines)
+        assert BacktrackingAnalyzer(node.safe_pattern).severity != "exponential"
+        for line in lines:
+            expected = re.match(node.pattern, line).groupdict()
+            assert re.match(node.safe_pattern, line).groupdict() == expected
+
+    def test_safe_template(self):
+        """Verify that Value regexes are rewritten and the rows are unchanged."""
+        template = dedent(r"""
+            Value name ([\x21-\x7e]*[a-zA-Z0-9][\x21-\x7e]*( [\x21-\x7e]*[a-zA-Z0-9][\x21-\x7e]*)*)
+            Value mtu (\d*[.]?\d+)
+
+            Start
+              ^Interface ${name} is up
+              ^  MTU ${mtu} bytes -> Record
+        """).lstrip()
+        data = "Interface eth0 a-1 is up\n  MTU 1500 bytes\nInterface e1 is up\n  MTU .5 bytes\n"
+        safe_template = make_safe_template(template)
+        assert safe_template != template
+        assert safe_template.splitlines()[3:] == template.splitlines()[3:]
+
+        expected = TextFSM(StringIO(template)).ParseTextToDicts(data)
+        assert TextFSM(StringIO(safe_template)).ParseTextToDicts(data) == expected
+
+
+class TestWorstCaseTiming:
+    """Test suite for safe patterns on pathological lines."""
+
+    def test_mixed_word_group(self):
+        """Verify that many mixed words followed by a mismatch stay fast."""
+        pattern = f"(?P<v>{PATTERN.MIXED_WORD_GROUP}) x$"
+        line = " ".join(["a1b2"] * 2000) + " !"
+        assert get_elapsed_time(make_safe_pattern(pattern), line) < TIME_LIMIT
+
+    def test_number(self):
+        """Verify that a long run of digits followed by a mismatch stays fast."""
+        pattern = f"(?P<v>{PATTERN.NUMBER}) x$"
+        line = "1" * 50000 + "x"
+        assert get_elapsed_time(make_safe_pattern(pattern), line) < TIME_LIMIT
+
+    def test_gpdiff_line(self):
+        """Verify a gpdiff pattern on a long malformed line."""
+        node = DiffLinePattern("port eth0 state up a-1 end", "port eth1 state admin down b:2 end")
+        line = "port eth0 state " + "x1 " * 2000 + "!"
+        assert get_elapsed_time(node.safe_pattern, line) < TIME_LIMIT
+
+    def test_original_is_exponential(self):
+        """Verify that the original pattern slows down sharply with more words."""
+        pattern = f"(?P<v>{PATTERN.MIXED_WORD_GROUP}) x$"
+        # Four extra words cost at least 2**4 times more; 8 leaves a wide margin.
+        short, long = (" ".join(["aaaa"] * count) + " !" for count in (5, 9))
+        assert get_elapsed_time(pattern, long) > 8 * get_elapsed_time(pattern, short)
+        assert get_elapsed_time(make_safe_pattern(pattern), long) < TIME_LIMIT
@@ -12,6 +12,8 @@ Run pytest in the project root to execute these tests:
 import pytest
 
 from textfsmgen.exceptions import RuntimeException
+from textfsmgen.exceptions import RuntimeErrorRegistry
+from textfsmgen.exceptions import RUNTIME_ERROR_REGISTRY
 
 from tests.unit import DummyClass
 
@@ -119,4 +121,50 @@ class TestRuntimeException:
             RuntimeException.do_raise_runtime_error(obj, "dummy failure")
         exc = exc_info.value
         assert exc.__class__.__name__ == "DummyClassRTError"
-        assert str(exc) == "dummy failure"
\ No newline at end of file
+        assert str(exc) == "dummy failure"
+
+
+class TestRuntimeErrorRegistry:
+    """
+    Unit tests for `RuntimeErrorRegistry`.
+
+    Coverage:
+    - Class names are derived like `genericlib.exceptions.create_runtime_error`.
+    - Each named exception class is created once and reused across raises.
+    """
+
+    @pytest.mark.parametrize(
+        "obj, expected_name",
+        [
+            (None, "RuntimeError"),
+            ("customError", "CustomError"),
+            (DummyClass(), "DummyClassRTError"),
+        ],
+    )
+    def test_get_class_name(self, obj, expected_name):
+        """Verify that class names follow the genericlib naming rules."""
+        assert RuntimeErrorRegistry.get_class_name(obj) == expected_name
+
+    def test_get_class_is_created_once(self):
+        """Verify that the same exception class is returned for a name."""
+        registry = RuntimeErrorRegistry()
+        exc_cls = registry.get_class("CustomError")
+        assert registry.get_class("CustomError") is exc_cls
+        assert issubclass(exc_cls, Exception)
+        assert "CustomError" in registry
+        assert len(registry) == 1
+
+        registry.clear()
+        assert len(registry) == 0
+
+    def test_raises_reuse_registered_class(self):
+        """Verify that repeated raises share one class but not one instance."""
+        caught = []
+        for index in range(3):
+            with pytest.raises(Exception) as exc_info:
+                RuntimeException.do_raise_runtime_error("RepeatedError", f"failure {index}")
+            caught.append(exc_info.value)
+
+        assert caught[0].__class__ is RUNTIME_ERROR_REGISTRY.get_class("RepeatedError")
+        assert len({type(exc) for exc in caught}) == 1
+        assert [str(exc) for exc in caught] == ["failure 0", "failure 1", "failure 2"]
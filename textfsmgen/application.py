@@ -34,8 +34,6 @@ import platform
 from pathlib import Path
 from pathlib import PurePath
 import yaml
-from io import StringIO
-from textfsm import TextFSM
 from pprint import pformat
 
 from textfsmgen.deps import genericlib_get_data_as_tabular as get_data_as_tabular
@@ -45,6 +43,7 @@ from textfsmgen.deps import genericlib_dedent_and_strip as dedent_and_strip
 from textfsmgen.deps import genericlib_file_module as file
 
 from textfsmgen import TemplateBuilder
+from textfsmgen.core import TEXTFSM_PARSER_POOL
 from textfsmgen.exceptions import TemplateBuilderInvalidFormat
 from textfsmgen.config import Data
 
@@ -2776,9 +2775,7 @@ class Application:
                     return
 
             # --- Parse test data ---
-            stream = StringIO(template)
-            parser = TextFSM(stream)
-            rows = parser.ParseTextToDicts(self.snapshot.test_data)
+            rows = TEXTFSM_PARSER_POOL.parse_text_to_dicts(template, self.snapshot.test_data)
 
             # --- Construct result string ---
             result = ''
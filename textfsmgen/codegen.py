@@ -0,0 +1,662 @@
+"""
+textfsmgen.codegen
+==================
+
+Code generation of standalone Python parsers from TextFSM templates.
+
+This module turns a TextFSM template into the source of an importable
+Python module that parses text without the TextFSM interpreter. Every
+rule regex is precompiled at import time, every state is a plain
+function, and the Value options (Filldown, Fillup, List, Required)
+are inlined where a value is assigned, cleared, or recorded.
+
+Purpose
+-------
+- Remove the per-line, per-rule, per-state dispatch of TextFSM for
+  templates that run on large volumes of text.
+- Produce parsers with no runtime dependency besides `re`.
+- Give the same rows as `TextFSM.ParseTextToDicts`.
+- Parse Start-only, record-per-line templates with a single combined
+  regex (`RecordPerLineParser`).
+- Skip a rule's regex on lines missing its longest required literal,
+  and report the evaluations avoided (`get_prefilter_report`).
+
+Notes
+-----
+- The template is compiled by `TextFSM` first, so only valid templates
+  are generated and the generated code follows the compiled rules.
+- Only the Value options shipped with `textfsm` are supported.
+"""
+
+import re
+import types
+from io import StringIO
+
+from textfsm import TextFSM
+
+from textfsmgen.exceptions import ParserCodeGenError
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:     # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+SUPPORTED_OPTIONS = ("Filldown", "Fillup", "Key", "List", "Required")
+
+
+REPEAT_OPCODES = tuple(
+    getattr(sre_constants, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(sre_constants, name)
+)
+
+
+def iter_required_literals(items):
+    """Yield the runs of literal characters that every match must contain."""
+    run = []
+    for op, av in items:
+        if op == sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        if op == sre_constants.AT:
+            # Anchors are zero-width, so the run stays contiguous.
+            continue
+        if run:
+            yield "".join(run)
+            run = []
+        if op == sre_constants.SUBPATTERN:
+            _, add_flags, _, pattern = av
+            if not add_flags & sre_constants.SRE_FLAG_IGNORECASE:
+                yield from iter_required_literals(pattern.data)
+        elif op in REPEAT_OPCODES:
+            low, _, pattern = av
+            if low >= 1:
+                yield from iter_required_literals(pattern.data)
+    if run:
+        yield "".join(run)
+
+
+def get_required_literal(regex: str) -> str:
+    """
+    Return the longest literal that every match of a regex contains.
+
+    Only literals outside alternations, optional parts, and
+    case-insensitive parts are considered, so a line without the
+    literal cannot match the regex.
+
+    Parameters
+    ----------
+    regex : str
+        A regular expression.
+
+    Returns
+    -------
+    str
+        The longest required literal, or an empty string if none.
+    """
+    try:
+        parsed = sre_parse.parse(regex)
+    except Exception:   # noqa
+        return ""
+    if parsed.state.flags & sre_constants.SRE_FLAG_IGNORECASE:
+        return ""
+    return max(iter_required_literals(parsed.data), key=len, default="")
+
+
+class ParserCodeGenerator:
+    """
+    Generate the source of a standalone parser module from a template.
+
+    Parameters
+    ----------
+    template : str
+        A valid TextFSM template.
+    prefilter : bool, default=True
+        Whether a rule's regex is only evaluated on lines containing the
+        rule's required literal (see `get_required_literal`).
+    count_evaluations : bool, default=False
+        Whether the module counts the regex evaluations and the
+        prefilter skips of every rule, in ``EVALUATED`` and ``SKIPPED``.
+
+    Attributes
+    ----------
+    template : str
+        The TextFSM template.
+    parser : TextFSM
+        The compiled template, whose values, states and rules drive the
+        generated code.
+    rules : list of tuple
+        ``(state_name, rule, literal)`` of every rule, in generation order.
+
+    Raises
+    ------
+    ParserCodeGenError
+        If the template cannot be compiled or uses an unsupported option.
+    """
+
+    def __init__(self, template: str, prefilter=True, count_evaluations=False):
+        self.template = str(template)
+        self.prefilter = prefilter
+        self.count_evaluations = count_evaluations
+        try:
+            self.parser = TextFSM(StringIO(self.template))
+        except Exception as ex:
+            raise ParserCodeGenError(f"{type(ex).__name__}: {ex}")
+
+        self.value_indexes = {}
+        for index, value in enumerate(self.parser.values):
+            self.value_indexes.setdefault(value.name, index)
+            for name in value.OptionNames():
+                if name not in SUPPORTED_OPTIONS:
+                    raise ParserCodeGenError(
+                        f"Value {value.name!r} uses unsupported option {name!r}."
+                    )
+        self.state_names = list(self.parser.states)
+        self.rules = [
+            (state_name, rule, get_required_literal(rule.regex) if prefilter else "")
+            for state_name in self.state_names
+            for rule in self.parser.states[state_name]
+        ]
+
+    def get_state_function_name(self, state_name: str) -> str:
+        """Return the name of the generated function of a state."""
+        return f"_state_{self.state_names.index(state_name)}"
+
+    def get_value_options(self, index: int) -> list:
+        """Return the option names of the value at `index`, in order."""
+        return self.parser.values[index].OptionNames()
+
+    def is_nested_list(self, index: int) -> bool:
+        """Return True if a List value stores dicts of nested groups."""
+        value = self.parser.values[index]
+        return "List" in value.OptionNames() and value.compiled_regex.groups > 1
+
+    def generate_assign(self, index: int, expr: str) -> list[str]:
+        """Return the lines assigning `expr` to the value at `index`."""
+        lines = [f"V[{index}] = {expr}"]
+        for option in self.get_value_options(index):
+            if option == "Filldown":
+                lines.append(f"F[{index}] = V[{index}]")
+            elif option == "Fillup":
+                lines.extend([
+                    f"if V[{index}]:",
+                    "    for row in reversed(R):",
+                    f"        if row[{index}]:",
+                    "            break",
+                    f"        row[{index}] = V[{index}]",
+                ])
+            elif option == "List" and self.is_nested_list(index):
+                lines.extend([
+                    f"nested = _VALUE_{index}(V[{index}])",
+                    "if nested and nested.groupdict():",
+                    f"    L[{index}].append(nested.groupdict())",
+                    "else:",
+                    f"    L[{index}].append(V[{index}])",
+                ])
+            elif option == "List":
+                lines.append(f"L[{index}].append(V[{index}])")
+        return lines
+
+    def generate_clear(self, index: int) -> list[str]:
+        """Return the lines clearing the value at `index` (Clear)."""
+        options = self.get_value_options(index)
+        lines = [f"V[{index}] = None"]
+        for option in options:
+            if option == "Filldown":
+                lines.append(f"V[{index}] = F[{index}]")
+            elif option == "List" and "Filldown" not in options:
+                lines.append(f"L[{index}] = []")
+        return lines
+
+    def generate_clear_all(self, index: int) -> list[str]:
+        """Return the lines clearing the value at `index` (Clearall)."""
+        lines = [f"V[{index}] = None"]
+        for option in self.get_value_options(index):
+            if option == "Filldown":
+                lines.append(f"F[{index}] = None")
+            elif option == "List":
+                lines.append(f"L[{index}] = []")
+        return lines
+
+    def generate_record_functions(self) -> list[str]:
+        """Return the `_clear`, `_clear_all` and `_record` functions."""
+        size = len(self.parser.values)
+        clear = [line for index in range(size) for line in self.generate_clear(index)]
+        clear_all = [line for index in range(size) for line in self.generate_clear_all(index)]
+
+        record = []
+        for index in range(size):
+            for option in self.get_value_options(index):
+                if option == "Required":
+                    record.extend([
+                        f"if not V[{index}]:",
+                        "    _clear(V, F, L)",
+                        "    return",
+                    ])
+                elif option == "List":
+                    record.append(f"V[{index}] = list(L[{index}])")
+        if size:
+            record.extend([
+                "row = V[:]",
+                "if len(row) == row.count(None) + row.count([]):",
+                "    return",
+                "R.append([\"\" if item is None else item for item in row])",
+                "_clear(V, F, L)",
+            ])
+
+        lines = []
+        for name, args, body in [
+            ("_clear", "V, F, L", clear),
+            ("_clear_all", "V, F, L", clear_all),
+            ("_record", "V, F, L, R", record),
+        ]:
+            lines.append(f"def {name}({args}):")
+            lines.extend(f"    {line}" for line in body or ["return"])
+            lines.extend(["", ""])
+        return lines
+
+    def generate_rule(self, state_index: int, rule_index: int, key: int) -> list[str]:
+        """Return the body lines of the rule at `key` in `rules`."""
+        _, rule, literal = self.rules[key]
+        check = [
+            f"match = _RULE_{state_index}_{rule_index}(line)",
+            "if match:",
+        ]
+        if self.count_evaluations:
+            check.insert(0, f"EVALUATED[{key}] += 1")
+
+        lines = [f"# {rule.match}" + (f" -> {self.get_action(rule)}" if self.get_action(rule) else "")]
+        if not literal:
+            lines.extend(check)
+            indent = "    "
+        elif self.count_evaluations:
+            lines.extend([f"if {literal!r} not in line:", f"    SKIPPED[{key}] += 1", "else:"])
+            lines.extend(f"    {line}" for line in check)
+            indent = "        "
+        else:
+            lines.append(f"if {literal!r} in line:")
+            lines.extend(f"    {line}" for line in check)
+            indent = "        "
+
+        body = []
+        for name in rule.regex_obj.regex.groupindex:
+            index = self.value_indexes.get(name)
+            if index is not None:
+                body.extend(self.generate_assign(index, f"match.group({name!r})"))
+
+        if rule.record_op == "Record":
+            body.append("_record(V, F, L, R)")
+        elif rule.record_op == "Clear":
+            body.append("_clear(V, F, L)")
+        elif rule.record_op == "Clearall":
+            body.append("_clear_all(V, F, L)")
+
+        if rule.line_op == "Error":
+            if rule.new_state:
+                msg = f"Error: {rule.new_state}. Rule Line: {rule.line_num}. Input Line: "
+                body.append(f"raise ParseError({msg!r} + line + '.')")
+            else:
+                msg = f"State Error raised. Rule Line: {rule.line_num}. Input Line: "
+                body.append(f"raise ParseError({msg!r} + line)")
+        elif rule.line_op != "Continue":
+            body.append(f"return {self.get_target(state_index, rule)}")
+
+        lines.extend(f"{indent}{line}" for line in body or ["pass"])
+        return lines
+
+    @classmethod
+    def get_action(cls, rule) -> str:
+        """Return the action of a rule as written in a template."""
+        op = ".".join(op for op in (rule.line_op, rule.record_op) if op)
+        return " ".join(item for item in (op, rule.new_state) if item)
+
+    def get_target(self, state_index: int, rule) -> str:
+        """Return the expression of the state after a `Next` rule."""
+        if rule.new_state in ("End", "EOF"):
+            return f"_{rule.new_state.upper()}"
+        if rule.new_state:
+            return self.get_state_function_name(rule.new_state)
+        return f"_state_{state_index}"
+
+    def generate(self) -> str:
+        """
+        Generate the source of the standalone parser module.
+
+        Returns
+        -------
+        str
+            Python source defining ``HEADER``, ``ParseError``,
+            ``parse_text(text, eof=True)`` and
+            ``parse_text_to_dicts(text, eof=True)``, plus the per-rule
+            ``EVALUATED`` and ``SKIPPED`` counters if `count_evaluations`
+            is set.
+        """
+        values = self.parser.values
+        lines = [
+            '"""',
+            "Standalone parser generated by TextFSM Generator Community Edition.",
+            "",
+            "It gives the same rows as `TextFSM.ParseTextToDicts` with its template,",
+            "without depending on textfsm.",
+            '"""',
+            "",
+            "import re",
+            "",
+            f"HEADER = {[value.name for value in values]!r}",
+            f"HAS_EOF_STATE = {'EOF' in self.parser.states!r}",
+            "_END = 'End'",
+            "_EOF = 'EOF'",
+            "",
+        ]
+        if self.count_evaluations:
+            lines.extend([
+                f"EVALUATED = [0] * {len(self.rules)}",
+                f"SKIPPED = [0] * {len(self.rules)}",
+                "",
+            ])
+        for index, value in enumerate(values):
+            if self.is_nested_list(index):
+                lines.append(f"_VALUE_{index} = re.compile({value.regex!r}).match")
+        for state_index, state_name in enumerate(self.state_names):
+            for rule_index, rule in enumerate(self.parser.states[state_name]):
+                lines.append(
+                    f"_RULE_{state_index}_{rule_index} = re.compile({rule.regex!r}).match"
+                )
+        lines.extend([
+            "",
+            "",
+            "class ParseError(Exception):",
+            '    """Raised by an Error action of the template."""',
+            "",
+            "",
+        ])
+        lines.extend(self.generate_record_functions())
+
+        key = 0
+        for state_index, state_name in enumerate(self.state_names):
+            lines.append(f"def _state_{state_index}(line, V, F, L, R):")
+            lines.append(f'    """State {state_name}."""')
+            for rule_index, _ in enumerate(self.parser.states[state_name]):
+                lines.extend(
+                    f"    {line}"
+                    for line in self.generate_rule(state_index, rule_index, key)
+                )
+                key += 1
+            lines.extend([f"    return _state_{state_index}", "", ""])
+
+        size = len(values)
+        lines.extend([
+            "def parse_text(text, eof=True):",
+            '    """Parse text and return the rows as lists, in HEADER order."""',
+            f"    V = [None] * {size}",
+            f"    F = [None] * {size}",
+            f"    L = [[] for _ in range({size})]",
+            "    R = []",
+            f"    state = {self.get_state_function_name('Start')}",
+            "    for line in text.splitlines() if text else []:",
+            "        state = state(line, V, F, L, R)",
+            "        if state is _END or state is _EOF:",
+            "            break",
+            "    if state is not _END and not HAS_EOF_STATE and eof:",
+            "        _record(V, F, L, R)",
+            "    return R",
+            "",
+            "",
+            "def parse_text_to_dicts(text, eof=True):",
+            '    """Parse text and return the rows as dicts keyed by HEADER."""',
+            "    return [dict(zip(HEADER, row)) for row in parse_text(text, eof=eof)]",
+            "",
+        ])
+        return "\n".join(lines)
+
+
+def generate_parser_code(template: str, prefilter=True) -> str:
+    """
+    Generate the source of a standalone parser module from a template.
+
+    Parameters
+    ----------
+    template : str
+        A valid TextFSM template.
+    prefilter : bool, default=True
+        Whether rules are prefiltered by their required literal.
+
+    Returns
+    -------
+    str
+        The Python source of the parser module.
+
+    Raises
+    ------
+    ParserCodeGenError
+        If the template cannot be compiled or uses an unsupported option.
+    """
+    return ParserCodeGenerator(template, prefilter=prefilter).generate()
+
+
+def load_parser_module(source: str, name: str = "textfsmgen_parser") -> types.ModuleType:
+    """
+    Load generated parser source as a module, without writing a file.
+
+    Parameters
+    ----------
+    source : str
+        Source returned by `generate_parser_code`.
+    name : str, optional
+        Module name. The module is not added to `sys.modules`.
+
+    Returns
+    -------
+    types.ModuleType
+        The loaded parser module.
+    """
+    module = types.ModuleType(name)
+    code = compile(source, f"<{name}>", "exec")
+    exec(code, module.__dict__)     # noqa
+    return module
+
+
+def get_prefilter_report(template: str, data: str) -> dict:
+    """
+    Count the regex evaluations the rule prefilter avoids on some text.
+
+    The text is parsed by a generated parser that counts, for every
+    rule, the regex evaluations and the lines skipped because the rule's
+    required literal is absent.
+
+    Parameters
+    ----------
+    template : str
+        A valid TextFSM template.
+    data : str
+        The text to parse, e.g. the test data of a template.
+
+    Returns
+    -------
+    dict
+        Mapping with ``lines_count``, ``rows_count``,
+        ``evaluated_count``, ``skipped_count`` (the avoided evaluations),
+        ``skipped_ratio``, and ``rules``, a list of dicts with the
+        ``state``, ``rule``, ``literal``, ``evaluated`` and ``skipped``
+        counts of every rule.
+
+    Raises
+    ------
+    ParserCodeGenError
+        If the template cannot be compiled or uses an unsupported option.
+    """
+    generator = ParserCodeGenerator(template, count_evaluations=True)
+    module = load_parser_module(generator.generate())
+    rows = module.parse_text(data)
+
+    rules = [
+        dict(state=state_name, rule=rule.match, literal=literal,
+             evaluated=evaluated, skipped=skipped)
+        for (state_name, rule, literal), evaluated, skipped
+        in zip(generator.rules, module.EVALUATED, module.SKIPPED)
+    ]
+    evaluated_count = sum(module.EVALUATED)
+    skipped_count = sum(module.SKIPPED)
+    total = evaluated_count + skipped_count
+    return dict(
+        lines_count=len(data.splitlines()) if data else 0,
+        rows_count=len(rows),
+        evaluated_count=evaluated_count,
+        skipped_count=skipped_count,
+        skipped_ratio=round(skipped_count / total, 4) if total else 0.0,
+        rules=rules,
+    )
+
+
+class RecordPerLineParser:
+    """
+    Single-regex parser for Start-only, record-per-line templates.
+
+    Templates generated from tabular snippets are a `Start` state whose
+    rules either capture values and end in ``-> Record``, or capture
+    nothing (header and separator lines). For them, a record never spans
+    lines, so every rule is combined into one ordered alternation with
+    renamed groups: one regex call per line replaces the per-rule
+    dispatch of TextFSM, and the first alternative that matches is the
+    rule TextFSM would have taken.
+
+    Parameters
+    ----------
+    template : str
+        A valid TextFSM template.
+
+    Attributes
+    ----------
+    header : list of str
+        The value names, in template order.
+    regex : re.Pattern
+        The combined regex of every rule.
+
+    Raises
+    ------
+    ParserCodeGenError
+        If the template cannot be compiled or does not have the supported
+        shape; `get_unsupported_reason` describes the shape.
+    """
+
+    def __init__(self, template: str):
+        try:
+            parser = TextFSM(StringIO(str(template)))
+        except Exception as ex:
+            raise ParserCodeGenError(f"{type(ex).__name__}: {ex}")
+
+        reason = self.get_unsupported_reason(parser)
+        if reason:
+            raise ParserCodeGenError(reason)
+
+        self.header = [value.name for value in parser.values]
+        value_indexes = {name: index for index, name in enumerate(self.header)}
+
+        alternatives = []
+        self.rule_groups = {}
+        for rule_index, rule in enumerate(parser.states["Start"]):
+            prefix = f"_r{rule_index}"
+            regex = self.get_scoped_regex(rule.regex)
+            regex = re.sub(r"\(\?P<(\w+)>", rf"(?P<{prefix}_\1>", regex)
+            alternatives.append(f"(?P<{prefix}>{regex})")
+            self.rule_groups[prefix] = [
+                (value_indexes[name], f"{prefix}_{name}")
+                for name in rule.regex_obj.regex.groupindex if name in value_indexes
+            ]
+        try:
+            self.regex = re.compile("|".join(alternatives))
+        except re.error as ex:
+            raise ParserCodeGenError(f"Rules cannot be combined: {ex}")
+
+    @classmethod
+    def get_scoped_regex(cls, regex: str) -> str:
+        """Turn leading global inline flags, e.g. ``^(?i)``, into a scoped group."""
+        match = re.match(r"(\^?)\(\?([aiLmsux]+)\)", regex)
+        if not match:
+            return regex
+        return f"{match.group(1)}(?{match.group(2)}:{regex[match.end():]})"
+
+    @classmethod
+    def get_unsupported_reason(cls, parser: TextFSM) -> str:
+        """
+        Return why a compiled template cannot use this parser.
+
+        Parameters
+        ----------
+        parser : TextFSM
+            The compiled template.
+
+        Returns
+        -------
+        str
+            The reason, or an empty string if the template is supported.
+        """
+        if set(parser.states) - {"Start", "EOF"} or parser.states.get("EOF"):
+            return "Template has states other than Start and an empty EOF."
+        if not parser.states["Start"]:
+            return "Template has no rules in the Start state."
+        for value in parser.values:
+            if set(value.OptionNames()) - {"Key"}:
+                return f"Value {value.name!r} has options other than Key."
+
+        names = {value.name for value in parser.values}
+        for rule in parser.states["Start"]:
+            if rule.line_op not in ("", "Next") or rule.new_state:
+                return f"Rule {rule.match!r} has a line operator or a new state."
+            captures = names.intersection(rule.regex_obj.regex.groupindex)
+            if captures and rule.record_op != "Record":
+                return f"Rule {rule.match!r} captures values without Record."
+            if re.search(r"\\[1-9]|\(\?P=|\(\?\(", rule.regex):
+                return f"Rule {rule.match!r} uses a backreference."
+        return ""
+
+    @classmethod
+    def is_supported(cls, template: str) -> bool:
+        """Return True if a template can use this parser."""
+        try:
+            cls(template)
+            return True
+        except ParserCodeGenError:
+            return False
+
+    def parse_text(self, text, eof=True) -> list[list]:     # noqa
+        """
+        Parse text and return the rows as lists, in `header` order.
+
+        Parameters
+        ----------
+        text : str
+            The text to parse.
+        eof : bool, default=True
+            Accepted for compatibility with `TextFSM.ParseText`; the
+            implicit EOF record of these templates is always empty.
+
+        Returns
+        -------
+        list of list
+            The parsed rows.
+        """
+        rows = []
+        match_line = self.regex.match
+        rule_groups = self.rule_groups
+        size = len(self.header)
+        for line in text.splitlines() if text else []:
+            match = match_line(line)
+            if not match:
+                continue
+            groups = rule_groups[match.lastgroup]
+            if not groups:
+                continue
+            row = [None] * size
+            for index, name in groups:
+                row[index] = match.group(name)
+            if row.count(None) == size:
+                continue
+            rows.append(["" if item is None else item for item in row])
+        return rows
+
+    def parse_text_to_dicts(self, text, eof=True) -> list[dict]:
+        """Parse text and return the rows as dicts keyed by `header`."""
+        return [dict(zip(self.header, row)) for row in self.parse_text(text, eof=eof)]
@@ -60,6 +60,14 @@ class Data:
             'user_templates.yaml')
     )
 
+    # on-disk template build cache
+    user_cache_dirname = str(
+        PurePath(
+            Path.home(),
+            '.textfsmgen',
+            'cache')
+    )
+
     app_version = version
 
     # main app
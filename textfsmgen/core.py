@@ -24,9 +24,23 @@ Notes
 - Errors are surfaced with descriptive messages to aid debugging.
 """
 
+import asyncio
+import glob
+import hashlib
+import json
+import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from contextlib import ExitStack
+from contextlib import contextmanager
 from datetime import datetime
+from functools import partial
 from textwrap import indent
+import textfsm
 from textfsm import TextFSM
 from io import StringIO
 
@@ -35,6 +49,10 @@ from textfsmgen.deps import genericlib_file_module as file
 
 from textfsmgen.deps import regexapp_LinePattern as LinePattern
 from textfsmgen.deps import regexapp_enclose_string as enclose_string
+from textfsmgen.deps import regexapp_VarCls as VarCls
+from textfsmgen.deps import regexapp_REF as REF
+from textfsmgen.deps import regexapp_version
+from textfsmgen.deps import genericlib_version
 
 from textfsmgen.deps import genericlib_get_data_as_tabular as get_data_as_tabular
 from textfsmgen.deps import genericlib_Printer as Printer
@@ -43,11 +61,762 @@ from textfsmgen.deps import genericlib_datatype_module as datatype
 from textfsmgen.exceptions import TemplateParsedLineError
 from textfsmgen.exceptions import TemplateBuilderError
 from textfsmgen.exceptions import TemplateBuilderInvalidFormat
+from textfsmgen.exceptions import ParserCodeGenError
+
+from textfsmgen.codegen import RecordPerLineParser
+from textfsmgen.codegen import generate_parser_code
+from textfsmgen.codegen import get_prefilter_report
+
+from textfsmgen.profiler import get_profile_report_text
+from textfsmgen.profiler import profile_template
+
+from textfsmgen.config import version as textfsmgen_version
+from textfsmgen.config import Data
 
 import logging
 logger = logging.getLogger(__file__)
 
 
+def get_variables_from_triples(triples) -> list:
+    """
+    Rebuild template variables from cached triples.
+
+    Parameters
+    ----------
+    triples : iterable
+        ``(name, pattern, option)`` triples of normalized variables.
+
+    Returns
+    -------
+    list of VarCls
+        New variable objects, with the option restored as-is.
+    """
+    variables = []
+    for name, pattern, option in triples:
+        var = VarCls(name=name, pattern=pattern)
+        var.option = option
+        variables.append(var)
+    return variables
+
+
+_reference_digest = dict(snapshot=None, digest="")
+
+
+def get_reference_digest() -> str:
+    """
+    Return a digest of the regexapp pattern references in use.
+
+    Keywords such as ``word()`` or ``digits()`` are expanded from `REF`,
+    which holds the system references and the user references of
+    ``user_references.yaml``, so a build depends on them as much as on
+    its user data. The digest covers the ``pattern`` of every reference,
+    or its ``format*`` patterns for date and time references, and is
+    recomputed whenever one of them differs from the last call,
+    including after an in-place edit of an entry.
+
+    Returns
+    -------
+    str
+        A hex SHA-256 digest of the loaded reference patterns.
+    """
+    snapshot = [
+        (key, entry["pattern"] if "pattern" in entry else
+         [(field, value) for field, value in entry.items() if field.startswith("format")])
+        for key, entry in REF.items()
+    ]
+    if snapshot != _reference_digest["snapshot"]:
+        payload = json.dumps(snapshot, default=str)
+        _reference_digest.update(
+            snapshot=snapshot,
+            digest=hashlib.sha256(payload.encode("utf-8")).hexdigest(),
+        )
+    return _reference_digest["digest"]
+
+
+class StatementCache:
+    """
+    Bounded LRU cache of template statements per user-data line.
+
+    `TemplateBuilder.prepare` turns each user-data line into a statement
+    through `ParsedLine` and regexapp's `LinePattern`. Template libraries
+    reuse the same lines (prompts, headers, ``keep__`` and ``comment__``
+    lines) across many snippets, so the normalized statement and the
+    variables of a line are cached by the line text and the digest of the
+    pattern references (see `get_reference_digest`). Variables are stored
+    as ``(name, pattern, option)`` triples and rebuilt on every hit, so
+    builders never share mutable variable objects.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of cached lines. Defaults to 4096.
+    enabled : bool, optional
+        Whether lookups and stores are active. Defaults to True.
+    """
+
+    def __init__(self, maxsize=4096, enabled=True):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def enable(self, maxsize=None):
+        """Enable the cache, optionally changing its maximum size."""
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+            self.enabled = True
+            self._shrink()
+
+    def disable(self):
+        """Disable the cache and drop its entries."""
+        with self._lock:
+            self.enabled = False
+            self._entries.clear()
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def get(self, line: str, references: str = "") -> tuple[str, tuple] | None:
+        """
+        Look up the statement and variable triples of a line.
+
+        Parameters
+        ----------
+        line : str
+            A user-data line, already right-stripped.
+        references : str, optional
+            The digest of the pattern references the line was parsed with.
+
+        Returns
+        -------
+        tuple or None
+            ``(statement, variable_triples)``, or None on a miss.
+        """
+        if not self.enabled:
+            return None
+        key = (references, line)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, line: str, statement: str, variables: list,
+            references: str = "") -> None:
+        """
+        Store the statement and variables of a line.
+
+        Parameters
+        ----------
+        line : str
+            A user-data line, already right-stripped.
+        statement : str
+            The normalized statement of the line.
+        variables : list of VarCls
+            The variables extracted from the line.
+        references : str, optional
+            The digest of the pattern references the line was parsed with.
+        """
+        if not self.enabled:
+            return
+        triples = tuple((var.name, var.pattern, var.option) for var in variables)
+        key = (references, line)
+        with self._lock:
+            self._entries[key] = (statement, triples)
+            self._entries.move_to_end(key)
+            self._shrink()
+
+    def get_stats(self) -> dict:
+        """
+        Return a snapshot of the cache counters.
+
+        Returns
+        -------
+        dict
+            Mapping with keys ``hits``, ``misses``, ``evictions``,
+            ``currsize``, ``maxsize``, and ``enabled``.
+        """
+        with self._lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                currsize=len(self._entries),
+                maxsize=self.maxsize,
+                enabled=self.enabled,
+            )
+
+    def _shrink(self):
+        while len(self._entries) > max(self.maxsize, 0):
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+STATEMENT_CACHE = StatementCache()
+
+
+class TemplateBuildCache:
+    """
+    Content-addressed cache of `TemplateBuilder` build results.
+
+    Build results are keyed by a SHA-256 hash of the user data, the
+    pattern references (see `get_reference_digest`), and the versions of
+    textfsmgen, regexapp, textfsm, and genericlib, so editing a user
+    keyword or upgrading any of them invalidates every entry. An entry holds the
+    parsed statements, the variables, and the bare template; the comment
+    block (including its created date) is regenerated on every build and
+    never cached.
+
+    Two layers are available:
+
+    - an in-memory LRU layer, enabled by default;
+    - an on-disk layer under `Data.user_cache_dirname`, disabled by
+      default, which keeps one JSON file per entry and evicts the least
+      recently used files once their total size exceeds a cap.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of in-memory entries. Defaults to 256.
+    enabled : bool, optional
+        Whether the in-memory layer is enabled. Defaults to True.
+
+    Attributes
+    ----------
+    disk_dirname : str
+        Directory of the on-disk layer, or an empty string if disabled.
+    disk_max_bytes : int
+        Size cap of the on-disk layer in bytes.
+    memory_hits, disk_hits, misses, evictions : int
+        Lookup and eviction counters.
+    """
+    FORMAT_VERSION = 1
+    LIBRARY_VERSIONS = dict(
+        textfsmgen=textfsmgen_version,
+        regexapp=regexapp_version,
+        textfsm=textfsm.__version__,
+        genericlib=genericlib_version,
+    )
+
+    def __init__(self, maxsize=256, enabled=True):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self.disk_dirname = ""
+        self.disk_max_bytes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def is_disk_enabled(self) -> bool:
+        """Return True if the on-disk layer is enabled."""
+        return bool(self.disk_dirname)
+
+    def enable(self, maxsize=None):
+        """Enable the in-memory layer, optionally changing its maximum size."""
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+            self.enabled = True
+            self._shrink()
+
+    def disable(self):
+        """Disable the in-memory layer and drop its entries."""
+        with self._lock:
+            self.enabled = False
+            self._entries.clear()
+
+    def enable_disk(self, dirname="", max_bytes=16 * 1024 * 1024):
+        """
+        Enable the on-disk layer.
+
+        Parameters
+        ----------
+        dirname : str, optional
+            Cache directory. Defaults to `Data.user_cache_dirname`.
+        max_bytes : int, optional
+            Size cap of the cache directory. Defaults to 16 MiB.
+        """
+        with self._lock:
+            self.disk_dirname = str(dirname or Data.user_cache_dirname)
+            self.disk_max_bytes = max_bytes
+
+    def disable_disk(self):
+        """Disable the on-disk layer, keeping its files."""
+        with self._lock:
+            self.disk_dirname = ""
+
+    def clear(self):
+        """Drop every in-memory entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.memory_hits = self.disk_hits = 0
+            self.misses = self.evictions = 0
+
+    def get_key(self, user_data: str) -> str:
+        """
+        Return the content address of a build.
+
+        Parameters
+        ----------
+        user_data : str
+            The user data (template snippet) of the build.
+
+        Returns
+        -------
+        str
+            A hex SHA-256 digest of the user data, the pattern references,
+            the entry format version, and the library versions.
+        """
+        payload = json.dumps(
+            [self.FORMAT_VERSION, self.LIBRARY_VERSIONS,
+             get_reference_digest(), user_data],
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        """
+        Look up an entry, first in memory and then on disk.
+
+        Parameters
+        ----------
+        key : str
+            The key returned by `get_key`.
+
+        Returns
+        -------
+        dict or None
+            The cached entry, or None on a miss.
+        """
+        if not self.enabled and not self.is_disk_enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key) if self.enabled else None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return entry
+
+            entry = self.read_disk_entry(key)
+            if entry is not None:
+                self.disk_hits += 1
+                self.put_memory_entry(key, entry)
+                return entry
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, entry: dict) -> None:
+        """
+        Store an entry in every enabled layer.
+
+        Parameters
+        ----------
+        key : str
+            The key returned by `get_key`.
+        entry : dict
+            A JSON-serializable build result.
+        """
+        with self._lock:
+            self.put_memory_entry(key, entry)
+            self.write_disk_entry(key, entry)
+
+    def put_memory_entry(self, key: str, entry: dict) -> None:
+        """Store an entry in the in-memory layer if it is enabled."""
+        if not self.enabled:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._shrink()
+
+    def get_disk_filename(self, key: str) -> str:
+        """Return the file name of an on-disk entry."""
+        return os.path.join(self.disk_dirname, f"{key}.json")
+
+    def read_disk_entry(self, key: str) -> dict | None:
+        """Read an on-disk entry, returning None if missing or unreadable."""
+        if not self.is_disk_enabled:
+            return None
+        filename = self.get_disk_filename(key)
+        try:
+            with open(filename, encoding="utf-8") as stream:
+                entry = json.load(stream)
+            os.utime(filename)
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def write_disk_entry(self, key: str, entry: dict) -> None:
+        """Write an on-disk entry atomically, then enforce the size cap."""
+        if not self.is_disk_enabled:
+            return
+        filename = self.get_disk_filename(key)
+        tmp_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.disk_dirname, exist_ok=True)
+            with open(tmp_filename, "w", encoding="utf-8") as stream:
+                json.dump(entry, stream)
+            os.replace(tmp_filename, filename)
+            self.shrink_disk()
+        except OSError as ex:
+            logger.debug(f"Failed to write template build cache {filename!r}: {ex}")
+
+    def shrink_disk(self) -> None:
+        """Remove the least recently used files until the size cap is met."""
+        files = []
+        with os.scandir(self.disk_dirname) as entries:
+            for item in entries:
+                if item.name.endswith(".json") and item.is_file():
+                    stat = item.stat()
+                    files.append((stat.st_mtime, stat.st_size, item.path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, filename in sorted(files):
+            if total <= self.disk_max_bytes:
+                break
+            try:
+                os.remove(filename)
+                total -= size
+                self.evictions += 1
+            except OSError:
+                continue
+
+    def get_stats(self) -> dict:
+        """
+        Return a snapshot of the cache counters.
+
+        Returns
+        -------
+        dict
+            Mapping with keys ``memory_hits``, ``disk_hits``, ``misses``,
+            ``evictions``, ``currsize``, ``maxsize``, ``enabled``, and
+            ``disk_dirname``.
+        """
+        with self._lock:
+            return dict(
+                memory_hits=self.memory_hits,
+                disk_hits=self.disk_hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                currsize=len(self._entries),
+                maxsize=self.maxsize,
+                enabled=self.enabled,
+                disk_dirname=self.disk_dirname,
+            )
+
+    def _shrink(self):
+        while len(self._entries) > max(self.maxsize, 0):
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+TEMPLATE_BUILD_CACHE = TemplateBuildCache()
+
+
+class TextFSMParserPool:
+    """
+    Thread-safe pool of compiled `TextFSM` parsers keyed by template hash.
+
+    Compiling a template is paid once per template: released parsers are
+    reset and kept idle, and `acquire` hands an idle parser to exactly one
+    caller at a time, so concurrent threads never share parser state. At
+    most `maxsize` templates are pooled; the least recently used template
+    and its idle parsers are evicted beyond that bound.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of pooled templates. Defaults to 128.
+    max_idle : int, optional
+        Maximum number of idle parsers kept per template. Defaults to 8.
+
+    Attributes
+    ----------
+    hits : int
+        Number of acquisitions served by an idle parser.
+    misses : int
+        Number of acquisitions that compiled a new parser.
+    evictions : int
+        Number of templates evicted by the `maxsize` bound.
+    """
+
+    def __init__(self, maxsize=128, max_idle=8):
+        self.maxsize = maxsize
+        self.max_idle = max_idle
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._idle = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._idle)
+
+    @classmethod
+    def get_key(cls, template: str) -> str:
+        """Return the hex SHA-256 digest of a template."""
+        return hashlib.sha256(str(template).encode("utf-8")).hexdigest()
+
+    def acquire(self, template: str) -> TextFSM:
+        """
+        Take a reset parser of a template out of the pool.
+
+        An idle parser is reused when available; otherwise the template
+        is compiled. The caller owns the parser until it is handed back
+        with `release`.
+
+        Parameters
+        ----------
+        template : str
+            The TextFSM template text.
+
+        Returns
+        -------
+        TextFSM
+            A parser in its initial state.
+
+        Raises
+        ------
+        Exception
+            Any `textfsm` error raised while compiling an invalid template.
+        """
+        key = self.get_key(template)
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle is not None:
+                self._idle.move_to_end(key)
+                if idle:
+                    self.hits += 1
+                    return idle.pop()
+            self.misses += 1
+
+        parser = TextFSM(StringIO(template))
+        with self._lock:
+            if key not in self._idle:
+                self._idle[key] = []
+                self._shrink()
+        return parser
+
+    def release(self, template: str, parser: TextFSM) -> None:
+        """
+        Reset a parser and return it to the pool.
+
+        Parameters
+        ----------
+        template : str
+            The TextFSM template text the parser was compiled from.
+        parser : TextFSM
+            A parser obtained from `acquire`.
+        """
+        parser.Reset()
+        key = self.get_key(template)
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle is not None and len(idle) < self.max_idle:
+                idle.append(parser)
+
+    @contextmanager
+    def parser(self, template: str):
+        """
+        Context manager that acquires a parser and releases it on exit.
+
+        Parameters
+        ----------
+        template : str
+            The TextFSM template text.
+
+        Yields
+        ------
+        TextFSM
+            A parser in its initial state.
+        """
+        parser = self.acquire(template)
+        try:
+            yield parser
+        finally:
+            self.release(template, parser)
+
+    def parse_text_to_dicts(self, template: str, data: str) -> list[dict]:
+        """
+        Parse text with a pooled parser of a template.
+
+        Parameters
+        ----------
+        template : str
+            The TextFSM template text.
+        data : str
+            The text to parse.
+
+        Returns
+        -------
+        list of dict
+            The parsed records, as returned by `TextFSM.ParseTextToDicts`.
+        """
+        with self.parser(template) as parser:
+            return parser.ParseTextToDicts(data)
+
+    def clear(self) -> None:
+        """Drop every pooled parser and reset the counters."""
+        with self._lock:
+            self._idle.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def get_stats(self) -> dict:
+        """
+        Return a snapshot of the pool counters.
+
+        Returns
+        -------
+        dict
+            Mapping with keys ``hits``, ``misses``, ``evictions``,
+            ``currsize`` (pooled templates), ``idle`` (idle parsers),
+            ``maxsize``, and ``max_idle``.
+        """
+        with self._lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                currsize=len(self._idle),
+                idle=sum(len(idle) for idle in self._idle.values()),
+                maxsize=self.maxsize,
+                max_idle=self.max_idle,
+            )
+
+    def _shrink(self):
+        while len(self._idle) > max(self.maxsize, 0):
+            self._idle.popitem(last=False)
+            self.evictions += 1
+
+
+TEXTFSM_PARSER_POOL = TextFSMParserPool()
+
+
+class VariableTable:
+    """
+    Ordered, name-indexed table of template variables.
+
+    `TemplateBuilder.prepare` collects the variables of every user-data
+    line into one table. Variables keep their first-seen order, and a
+    variable whose name and pattern are already known is skipped with a
+    single dictionary lookup. A variable reusing a known name with a
+    different pattern cannot be declared twice in a TextFSM template, so
+    it is not added; it is recorded as a conflict instead.
+
+    Parameters
+    ----------
+    variables : list of VarCls, optional
+        Existing variables. The list is extended in place.
+
+    Attributes
+    ----------
+    variables : list of VarCls
+        The unique variables in first-seen order.
+    conflicts : list of dict
+        One mapping per conflicting variable, with the keys ``name``,
+        ``pattern``, ``line_number``, ``conflicting_pattern``, and
+        ``conflicting_line_number``. A line number of 0 means the
+        variable was already in the table.
+    """
+    def __init__(self, variables=None):
+        self.variables = variables if variables is not None else []
+        self.conflicts = []
+        self._index = dict()
+        for var in self.variables:
+            self._index.setdefault(var.name, (var, 0))
+
+    def __len__(self):
+        return len(self.variables)
+
+    def __iter__(self):
+        return iter(self.variables)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def add(self, var, line_number=0) -> bool:
+        """
+        Add a variable unless its name is already taken.
+
+        Parameters
+        ----------
+        var : VarCls
+            The variable to add.
+        line_number : int, optional
+            The 1-based user-data line of the variable, used in conflicts.
+
+        Returns
+        -------
+        bool
+            True if the variable was added, otherwise False.
+        """
+        known = self._index.get(var.name)
+        if known is None:
+            self._index[var.name] = (var, line_number)
+            self.variables.append(var)
+            return True
+
+        known_var, known_line_number = known
+        if known_var.pattern != var.pattern:
+            conflict = dict(
+                name=var.name,
+                pattern=known_var.pattern,
+                line_number=known_line_number,
+                conflicting_pattern=var.pattern,
+                conflicting_line_number=line_number,
+            )
+            self.conflicts.append(conflict)
+        return False
+
+    @classmethod
+    def get_conflicts_message(cls, conflicts) -> str:
+        """
+        Format variable conflicts as an error message.
+
+        Parameters
+        ----------
+        conflicts : list of dict
+            Conflicts recorded by `VariableTable.add`.
+
+        Returns
+        -------
+        str
+            One line per conflict, or an empty string if there is none.
+        """
+        lines = []
+        for conflict in conflicts:
+            lines.append(
+                "VariableConflictError: variable %r is declared with pattern %r "
+                "(line %s) and pattern %r (line %s)." % (
+                    conflict["name"],
+                    conflict["pattern"], conflict["line_number"],
+                    conflict["conflicting_pattern"],
+                    conflict["conflicting_line_number"],
+                )
+            )
+        return "\n".join(lines)
+
+
 class ParsedLine:
     """
     Represent and parse a single line into template format.
@@ -330,6 +1099,122 @@ class ParsedLine:
             raise TemplateParsedLineError(f"Invalid format - {self.text!r}")
 
 
+def iter_text_chunks(lines, boundary=None, chunk_lines=1000):
+    """
+    Group lines of text into chunks at record boundaries.
+
+    Parameters
+    ----------
+    lines : iterable of str
+        Lines of text, with or without line endings, e.g. an open file.
+    boundary : str, optional
+        Regex pattern of a line starting a new record, e.g. a device
+        prompt. A matching line starts a new chunk.
+    chunk_lines : int, optional
+        Maximum number of lines in a chunk. Defaults to 1000.
+
+    Yields
+    ------
+    str
+        A chunk of lines joined by newlines.
+    """
+    pattern = re.compile(boundary) if boundary else None
+    chunk = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        is_boundary = pattern is not None and pattern.search(line)
+        if chunk and (is_boundary or len(chunk) >= chunk_lines):
+            yield "\n".join(chunk)
+            chunk = []
+        chunk.append(line)
+    if chunk:
+        yield "\n".join(chunk)
+
+
+def pop_settled_rows(parser: TextFSM, eof=False) -> tuple[list[list], bool]:
+    """
+    Remove and return the parsed rows that later text can no longer change.
+
+    A ``Fillup`` value copies itself up into earlier rows whose column
+    is still empty, so the trailing rows with an empty ``Fillup`` column
+    stay in the parser until a later line fills them or the text ends.
+    This is the only place that uses the private `_result` and
+    `_cur_state_name` attributes of `TextFSM`.
+
+    Parameters
+    ----------
+    parser : TextFSM
+        A parser that has parsed part of a text with ``eof=False``.
+    eof : bool, default=False
+        If True, the text has ended and every row is settled.
+
+    Returns
+    -------
+    tuple of (list of list, bool)
+        The settled rows, in `parser.header` order, and whether the
+        parser reached an End or EOF state.
+    """
+    result = parser._result
+    is_stopped = parser._cur_state_name in ("End", "EOF")
+    size = len(result)
+    if not eof and not is_stopped:
+        for index, value in enumerate(parser.values):
+            if "Fillup" not in value.OptionNames():
+                continue
+            # Rows after the last filled one are still open to this value.
+            pos = len(result)
+            while pos and not result[pos - 1][index]:
+                pos -= 1
+            size = min(size, pos)
+    parser._result = result[size:]
+    return result[:size], is_stopped
+
+
+def iter_parsed_chunks(template: str, chunks):
+    """
+    Parse chunks of text with one parser, yielding the rows of each chunk.
+
+    The parser keeps its state and its current record from one chunk to
+    the next, so the rows are the same as parsing the whole text at
+    once with `TextFSM.ParseTextToDicts`, while only one chunk and its
+    rows are held in memory. Rows that a ``Fillup`` value may still
+    change are held back (see `pop_settled_rows`), so a ``Fillup`` value
+    that is rarely set keeps more rows in memory. Parsing stops at an
+    End or EOF state, and the implicit EOF record is part of the rows of
+    the last chunk.
+
+    Parameters
+    ----------
+    template : str
+        The TextFSM template text.
+    chunks : iterable of str
+        Consecutive chunks of the text, e.g. from `iter_text_chunks`.
+
+    Yields
+    ------
+    list of dict
+        The rows settled while parsing a chunk.
+    """
+    with TEXTFSM_PARSER_POOL.parser(template) as parser:
+        header = parser.header
+        pending = None
+        for chunk in chunks:
+            if pending is not None:
+                yield pending
+            parser.ParseText(chunk, eof=False)
+            rows, is_stopped = pop_settled_rows(parser)
+            pending = [dict(zip(header, row)) for row in rows]
+            if is_stopped:
+                break
+
+        # As in ParseText, the implicit EOF record is skipped after an End
+        # state or when the template has an EOF state.
+        parser.ParseText("", eof=True)
+        rows, _ = pop_settled_rows(parser, eof=True)
+        rows = [dict(zip(header, row)) for row in rows]
+        yield rows if pending is None else pending + rows
+
+
 class TemplateBuilder:
     """
     Build TextFSM templates and generate associated test scripts.
@@ -340,6 +1225,18 @@ class TemplateBuilder:
     company, and description, and provides verification utilities to ensure
     template correctness.
 
+    A template is built in stages, each of which caches its output:
+
+    - prepare: statements and variables, from the user data.
+    - assemble: the bare template and the full template with its comment.
+    - compile: the validated template and its `TextFSM` parser.
+    - verify: the rows parsed from the test data.
+
+    By default, the constructor runs every stage up to compile. With
+    ``lazy=True`` nothing runs until an attribute or method needs it, and
+    with ``skip_compile=True`` the template is not validated by `TextFSM`,
+    which suits bulk template export.
+
     Attributes
     ----------
     test_data : str
@@ -360,39 +1257,71 @@ class TemplateBuilder:
         File name to save the generated test script. Defaults to an empty string.
     variables : list
         List of variables extracted from the template.
+    variable_conflicts : list of dict
+        Variables reusing a name with a different pattern, as recorded
+        by `VariableTable`.
     statements : list
         List of template statements.
     template : str
         The generated TextFSM template string.
     template_parser : TextFSM
         Instance of the TextFSM parser for the generated template.
+    fast_parser : RecordPerLineParser or None
+        Single-regex parser of a record-per-line template, if supported.
     verified_message : str
         Message returned after successful verification.
+    profile_report : dict or None
+        Runtime profile of the last `verify` run with ``profile=True``.
     debug : bool
         Flag indicating whether to enable debug mode for template validation.
     bad_template : str
         Representation of an invalid or failed template.
+    lazy : bool
+        Flag indicating whether stages run on demand instead of in the
+        constructor.
+    skip_compile : bool
+        Flag indicating whether `build` skips the `TextFSM` validation.
 
     Methods
     -------
     prepare() -> None
         Prepare internal structures before building the template.
+    assemble() -> None
+        Assemble the bare and full templates, once.
+    compile_template() -> None
+        Validate the assembled template with `TextFSM`, once.
+    get_test_result() -> list of dict
+        Parse the test data with the template, once per template and data.
+    parse_text_to_dicts(data) -> list of dict
+        Parse text, through the single-regex `fast_parser` when possible.
     build_template_comment() -> None
         Generate template comments for documentation.
     reformat() -> None
         Reformat the template for readability and consistency.
     build() -> None
-        Build the final template from user and test data.
+        Run the prepare, assemble, and compile stages.
+    rebuild(user_data=None, test_data=None) -> None
+        Rebuild the template, re-parsing only changed user data lines.
     show_debug_info(test_result=None, expected_result=None) -> None
         Display debug information comparing test results with expectations.
-    verify(expected_rows_count=None, expected_result=None, debug=False) -> bool
+    verify(expected_rows_count=None, expected_result=None, debug=False, profile=False) -> bool
         Verify the generated template against expected results.
+    verify_stream(source=None, ..., boundary=None, chunk_lines=1000) -> dict
+        Verify large test data chunk by chunk with bounded memory.
+    verify_corpus(corpus, workers=None, max_failures=None) -> dict
+        Verify the template against a corpus of capture files.
     create_unittest() -> str
         Generate a Python unittest script for the template.
     create_pytest() -> str
         Generate a Python pytest script for the template.
     create_python_test() -> str
         Generate a generic Python test script snippet.
+    create_python_parser(prefilter=True) -> str
+        Generate a standalone Python parser module for the template.
+    get_prefilter_report() -> dict
+        Report the regex evaluations the rule prefilter avoids on test data.
+    get_profile_report() -> dict
+        Profile the per-state and per-rule regex cost on test data.
 
     Raises
     ------
@@ -405,7 +1334,7 @@ class TemplateBuilder:
 
     def __init__(self, test_data='', user_data='', namespace='',
                  author='', email='', company='', description='',
-                 filename='', debug=False):
+                 filename='', debug=False, lazy=False, skip_compile=False):
         self.test_data = text.list_to_text(test_data)
         self.user_data = text.list_to_text(user_data)
         self.namespace = str(namespace)
@@ -414,16 +1343,179 @@ class TemplateBuilder:
         self.company = str(company)
         self.description = text.list_to_text(description)
         self.filename = str(filename)
-        self.variables = []
-        self.statements = []
-        self.bare_template = ''
-        self.template = ''
-        self.template_parser = None
         self.verified_message = ''
+        self.profile_report = None
         self.debug = debug
-        self.bad_template = ''
+        self.lazy = lazy
+        self.skip_compile = skip_compile
+        self._line_entries = dict()
+        self.reset()
 
-        self.build()
+        if not self.lazy:
+            self.build()
+
+    def reset(self) -> None:
+        """
+        Discard the output of every stage, keeping the per-line results.
+        """
+        self._stages = set()
+        self._statements = []
+        self._variables = []
+        self._variable_conflicts = []
+        self._bare_template = ''
+        self._template = ''
+        self._template_parser = None
+        self._bad_template = ''
+        self._build_cache_key = ''
+        self._build_cache_entry = None
+        self._raw_bare_template = ''
+        self._test_result_key = None
+        self._test_result = None
+        self._fast_parser = None
+        self._fast_parser_reason = ''
+
+    @property
+    def statements(self) -> list:
+        """list of str: Template statements, from the prepare stage."""
+        self._run_prepare_stage()
+        return self._statements
+
+    @statements.setter
+    def statements(self, statements: list) -> None:
+        self._statements = statements
+        self._stages.add("prepare")
+
+    @property
+    def variables(self) -> list:
+        """list of VarCls: Unique template variables, from the prepare stage."""
+        self._run_prepare_stage()
+        return self._variables
+
+    @variables.setter
+    def variables(self, variables: list) -> None:
+        self._variables = variables
+        self._stages.add("prepare")
+
+    @property
+    def variable_conflicts(self) -> list:
+        """list of dict: Variable conflicts, from the prepare stage."""
+        self._run_prepare_stage()
+        return self._variable_conflicts
+
+    @variable_conflicts.setter
+    def variable_conflicts(self, conflicts: list) -> None:
+        self._variable_conflicts = conflicts
+
+    @property
+    def bare_template(self) -> str:
+        """str: The template without comment, from the assemble stage."""
+        self.assemble()
+        return self._bare_template
+
+    @bare_template.setter
+    def bare_template(self, template: str) -> None:
+        self._bare_template = template
+        self._stages.add("assemble")
+
+    @property
+    def template(self) -> str:
+        """
+        str: The full template, from the compile stage.
+
+        The template is empty if it failed to compile in debug mode. If
+        `skip_compile` is set, the assembled template is returned as-is.
+        """
+        if self.skip_compile:
+            self.assemble()
+        else:
+            self.compile_template()
+        return self._template
+
+    @template.setter
+    def template(self, template: str) -> None:
+        self._template = template
+        self._stages.update(["assemble", "compile"])
+
+    @property
+    def bad_template(self) -> str:
+        """str: The failed template with its error, from the compile stage."""
+        if not self.skip_compile:
+            self.compile_template()
+        return self._bad_template
+
+    @bad_template.setter
+    def bad_template(self, template: str) -> None:
+        self._bad_template = template
+
+    @property
+    def template_parser(self) -> TextFSM | None:
+        """
+        Return the parser of the generated template, owned by this builder.
+
+        The parser is taken from `TEXTFSM_PARSER_POOL` on first access, so
+        it is compiled only if no idle parser of the template is pooled.
+
+        Returns
+        -------
+        TextFSM or None
+            The parser, or None if no valid template was generated.
+        """
+        template = self.template
+        if self._template_parser is None and template:
+            self._template_parser = TEXTFSM_PARSER_POOL.acquire(template)
+        return self._template_parser
+
+    @template_parser.setter
+    def template_parser(self, parser: TextFSM | None) -> None:
+        self._template_parser = parser
+
+    @property
+    def fast_parser(self) -> RecordPerLineParser | None:
+        """
+        Return the single-regex parser of the template, if it has the shape.
+
+        Start-only templates whose rules capture values only with
+        ``-> Record``, as generated from tabular snippets, are parsed by a
+        `RecordPerLineParser`. For any other template, None is returned
+        and `fast_parser_reason` tells why.
+
+        Returns
+        -------
+        RecordPerLineParser or None
+            The fast parser, or None if the template is not supported.
+        """
+        template = self.template
+        if self._fast_parser is None and not self._fast_parser_reason and template:
+            try:
+                self._fast_parser = RecordPerLineParser(template)
+            except ParserCodeGenError as ex:
+                self._fast_parser_reason = str(ex)
+        return self._fast_parser
+
+    @property
+    def fast_parser_reason(self) -> str:
+        """str: Why `fast_parser` is None, or an empty string."""
+        return "" if self.fast_parser is not None else self._fast_parser_reason
+
+    def parse_text_to_dicts(self, data: str) -> list[dict]:
+        """
+        Parse text with the template, through the fast path when possible.
+
+        Parameters
+        ----------
+        data : str
+            The text to parse.
+
+        Returns
+        -------
+        list of dict
+            The parsed records, the same as `TextFSM.ParseTextToDicts`.
+            `fast_parser` is used if available; otherwise the text is
+            parsed by a pooled `TextFSM` parser.
+        """
+        if self.fast_parser is not None:
+            return self.fast_parser.parse_text_to_dicts(data)
+        return TEXTFSM_PARSER_POOL.parse_text_to_dicts(self.template, data)
 
     def prepare(self) -> None:
         """
@@ -436,14 +1528,18 @@ class TemplateBuilder:
         Processing steps
         ----------------
         - Strip trailing whitespace from each line.
-        - Convert the line into a `ParsedLine` and extract its statement.
+        - Convert the line into a `ParsedLine` and extract its statement,
+          memoized per line text by `STATEMENT_CACHE`.
         - Normalize statement formatting:
             * Replace escaped `\\$$` with `$$`.
             * Replace `\\$$ ->` with `$$ ->`.
             * Replace `\\$` with `\\x24`.
         - Append the statement to `self.statements` (including empty ones).
-        - Add variables from the parsed line to `self.variables`, ensuring
-          uniqueness by matching both `name` and `pattern`.
+        - Keep the per-line results, so `rebuild` only parses changed lines.
+        - Add variables from the parsed line to `self.variables` through a
+          `VariableTable`, keeping the first variable of each name. A name
+          reused with a different pattern is recorded in
+          `self.variable_conflicts`.
 
         Returns
         -------
@@ -456,32 +1552,101 @@ class TemplateBuilder:
             If a line cannot be parsed into a valid `ParsedLine`.
         """
 
-        for line in self.user_data.splitlines():
+        table = VariableTable(self._variables)
+        line_entries = dict()
+        for line_number, line in enumerate(self.user_data.splitlines(), start=1):
             line = line.rstrip()
 
-            parsed_line = ParsedLine(line)
-            statement = parsed_line.get_statement()
-            if statement.endswith(r'\$$'):
-                statement = '{}$$'.format(statement[:-3])
-            elif r'\$$ -> ' in statement:
-                statement = statement.replace(r'\$$ -> ', '$$ -> ')
-            statement = statement.replace(r'\$', r'\x24')
+            entry = line_entries.get(line) or self._line_entries.get(line)
+            if entry is None:
+                entry = self.get_statement_and_variables(line)
+            line_entries[line] = entry
+            statement, line_variables = entry
 
             if statement:
-                self.statements.append(statement)
+                self._statements.append(statement)
             else:
-                if self.statements:
-                    self.statements.append(statement)
-
-            if parsed_line.variables:
-                for pl_var in parsed_line.variables:
-                    is_identical = False
-                    for var in self.variables:
-                        if pl_var.name == var.name and pl_var.pattern == var.pattern:
-                            is_identical = True
-                            break
-                    if not is_identical:
-                        self.variables.append(pl_var)
+                if self._statements:
+                    self._statements.append(statement)
+
+            for pl_var in line_variables:
+                table.add(pl_var, line_number=line_number)
+
+        self._line_entries = line_entries
+        self._variable_conflicts.extend(table.conflicts)
+
+    def rebuild(self, user_data=None, test_data=None) -> None:
+        """
+        Rebuild the template incrementally after the user data changed.
+
+        Lines already parsed by the previous build of this builder reuse
+        their statement and variables, so only new or edited lines go
+        through `ParsedLine` and `LinePattern`; the variable table,
+        assembly, reformatting, and compilation are then redone.
+
+        Parameters
+        ----------
+        user_data : str or list, optional
+            The new user data. Defaults to the current user data.
+        test_data : str or list, optional
+            The new test data. Defaults to the current test data.
+
+        Raises
+        ------
+        TemplateBuilderError
+            Raised if the generated template is invalid and debug mode is disabled.
+        TemplateBuilderInvalidFormat
+            Raised if `user_data` does not contain any variables.
+        """
+        if user_data is not None:
+            self.user_data = text.list_to_text(user_data)
+        if test_data is not None:
+            self.test_data = text.list_to_text(test_data)
+
+        self.reset()
+        self.verified_message = ''
+        self.build()
+
+    @classmethod
+    def get_statement_and_variables(cls, line: str) -> tuple[str, list]:
+        """
+        Return the normalized statement and the variables of a line.
+
+        Results are memoized in `STATEMENT_CACHE` by line text and
+        pattern references.
+
+        Parameters
+        ----------
+        line : str
+            A user-data line, already right-stripped.
+
+        Returns
+        -------
+        tuple[str, list]
+            The normalized statement and the list of `VarCls` variables.
+
+        Raises
+        ------
+        TemplateParsedLineError
+            If the line cannot be parsed into a valid `ParsedLine`.
+        """
+        references = get_reference_digest()
+        entry = STATEMENT_CACHE.get(line, references=references)
+        if entry is not None:
+            statement, triples = entry
+            return statement, get_variables_from_triples(triples)
+
+        parsed_line = ParsedLine(line)
+        statement = parsed_line.get_statement()
+        if statement.endswith(r'\$$'):
+            statement = '{}$$'.format(statement[:-3])
+        elif r'\$$ -> ' in statement:
+            statement = statement.replace(r'\$$ -> ', '$$ -> ')
+        statement = statement.replace(r'\$', r'\x24')
+
+        STATEMENT_CACHE.put(line, statement, parsed_line.variables,
+                            references=references)
+        return statement, parsed_line.variables
 
     def build_template_comment(self) -> str:
         """
@@ -565,43 +1730,150 @@ class TemplateBuilder:
                     if line.strip():
                         lines.append(line)
 
-            lines.append("")  # blank line before state
-            lines.append(state)
-            start = match.end()
-            last_match = match
+            lines.append("")  # blank line before state
+            lines.append(state)
+            start = match.end()
+            last_match = match
+
+        if last_match and lines:
+            after = last_match.string[last_match.end():]
+            if after.strip():
+                for line in after.splitlines():
+                    if line.strip():
+                        lines.append(line)
+
+        return "\n".join(lines)
+
+    def _run_prepare_stage(self) -> None:
+        """
+        Run the prepare stage once, from the build cache when possible.
+
+        A cache hit restores the statements and variables and keeps the
+        entry, so `assemble` reuses its bare template.
+        """
+        if "prepare" in self._stages:
+            return
+
+        self._build_cache_key = TEMPLATE_BUILD_CACHE.get_key(self.user_data)
+        entry = TEMPLATE_BUILD_CACHE.get(self._build_cache_key)
+        if entry is not None:
+            self.load_build_cache_entry(entry)
+        else:
+            self.prepare()
+        self._build_cache_entry = entry
+        self._stages.add("prepare")
+
+    def assemble(self) -> None:
+        """
+        Assemble the bare template and the full template, once.
+
+        The bare template joins the variables and the statements, starting
+        with a `Start` state; the full template prepends the comment block.
+        Both are reformatted for readability.
+
+        Raises
+        ------
+        TemplateBuilderInvalidFormat
+            Raised if `user_data` does not contain any variables.
+        """
+        if "assemble" in self._stages:
+            return
+
+        self._run_prepare_stage()
+        if not self._variables:
+            raise TemplateBuilderInvalidFormat(
+                "user_data does not have any assigned variable for template."
+            )
+
+        # Build comment and template sections
+        comment = self.build_template_comment()
+        entry = self._build_cache_entry
+        if entry is not None:
+            bare_template = entry["bare_template"]
+        else:
+            variables = "\n".join(v.value for v in self._variables)
+            template_def = "\n".join(self._statements)
+
+            if not template_def.strip().startswith("Start"):
+                template_def = f"Start\n{template_def}"
+
+            bare_template = f"{variables}\n\n{template_def}"
+        template = f"{comment}\n{bare_template}"
+
+        # Reformat templates
+        self._raw_bare_template = bare_template
+        self._bare_template = self.reformat(bare_template)
+        self._template = self.reformat(template)
+        self._stages.add("assemble")
+
+    def compile_template(self) -> None:
+        """
+        Validate the assembled template with `TextFSM`, once.
+
+        The template is compiled through `TEXTFSM_PARSER_POOL`, so a
+        template is compiled only once per process. A successful build is
+        stored in `TEMPLATE_BUILD_CACHE`.
+
+        Raises
+        ------
+        TemplateBuilderError
+            Raised if variables conflict or the template is invalid, and
+            debug mode is disabled. In debug mode, the error is logged,
+            the invalid template is stored in `self.bad_template`, and
+            `self.template` is emptied.
+        """
+        if "compile" in self._stages:
+            return
+
+        self.assemble()
+        self._template_parser = None
+        error_msg = VariableTable.get_conflicts_message(self._variable_conflicts)
+        if not error_msg:
+            try:
+                with TEXTFSM_PARSER_POOL.parser(self._template):
+                    pass
+            except Exception as ex:
+                error_msg = f"{type(ex).__name__}: {ex}"
 
-        if last_match and lines:
-            after = last_match.string[last_match.end():]
-            if after.strip():
-                for line in after.splitlines():
-                    if line.strip():
-                        lines.append(line)
+        if error_msg:
+            if not self.debug:
+                raise TemplateBuilderError(error_msg)
+            self.logger.error(error_msg)
+            self._bad_template = f"{indent(error_msg, '# ')}\n{self._template}"
+            self._template = ""
+            self._stages.add("compile")
+            return
 
-        return "\n".join(lines)
+        if self._build_cache_key and self._build_cache_entry is None:
+            entry = self.get_build_cache_entry(self._raw_bare_template)
+            TEMPLATE_BUILD_CACHE.put(self._build_cache_key, entry)
+        self._stages.add("compile")
 
     def build(self) -> None:
         """
         Build a TextFSM template from user data.
 
-        This method prepares user data, constructs template statements and
-        variables, and generates a formatted TextFSM template. It also validates
-        the template by attempting to parse it with `TextFSM`.
+        This method runs the stages that have not run yet: prepare,
+        assemble, and, unless `skip_compile` is set, compile.
 
         Workflow
         --------
-        1. Reset `self.template`.
-        2. Call `self.prepare()` to parse user data into statements and variables.
-        3. If variables exist:
+        1. Look up `TEMPLATE_BUILD_CACHE`; on a miss, call `self.prepare()`
+           to parse user data into statements and variables.
+        2. If variables exist:
             - Build a template comment block.
             - Concatenate variables and statements into a bare template.
             - Ensure the template starts with a `Start` state.
             - Reformat both bare and full template for readability.
-            - Attempt to parse the template with `TextFSM`.
-        4. If parsing fails:
+            - Attempt to parse the template with `TextFSM`, through
+              `TEXTFSM_PARSER_POOL` so a template is compiled only once.
+        3. If variables conflict or parsing fails:
             - Raise `TemplateBuilderError` unless debug mode is enabled.
             - In debug mode, log the error and store the invalid template in
               `self.bad_template`.
-        5. If no variables are found, raise `TemplateBuilderInvalidFormat`.
+        4. If no variables are found, raise `TemplateBuilderInvalidFormat`.
+        5. Store a successful build in `TEMPLATE_BUILD_CACHE`. The comment
+           block is always regenerated, so its created date is current.
 
         Raises
         ------
@@ -610,46 +1882,50 @@ class TemplateBuilder:
         TemplateBuilderInvalidFormat
             Raised if `user_data` does not contain any variables.
         """
-        self.template = ""
-        self.prepare()
-
-        if not self.variables:
-            raise TemplateBuilderInvalidFormat(
-                "user_data does not have any assigned variable for template."
-            )
+        self._run_prepare_stage()
+        self.assemble()
+        if not self.skip_compile:
+            self.compile_template()
 
-        # Build comment and template sections
-        comment = self.build_template_comment()
-        variables = "\n".join(v.value for v in self.variables)
-        template_def = "\n".join(self.statements)
+    def get_build_cache_entry(self, bare_template: str) -> dict:
+        """
+        Return the JSON-serializable build result stored in the build cache.
 
-        if not template_def.strip().startswith("Start"):
-            template_def = f"Start\n{template_def}"
+        Parameters
+        ----------
+        bare_template : str
+            The bare template before reformatting.
 
-        bare_template = f"{variables}\n\n{template_def}"
-        template = f"{comment}\n{bare_template}"
+        Returns
+        -------
+        dict
+            Mapping with the statements, the variables as
+            ``[name, pattern, option]`` triples, and the bare template.
+        """
+        return dict(
+            statements=self.statements[:],
+            variables=[[var.name, var.pattern, var.option] for var in self.variables],
+            bare_template=bare_template,
+        )
 
-        # Reformat templates
-        self.bare_template = self.reformat(bare_template)
-        self.template = self.reformat(template)
+    def load_build_cache_entry(self, entry: dict) -> None:
+        """
+        Restore statements and variables from a build cache entry.
 
-        # Validate template with TextFSM
-        try:
-            stream = StringIO(self.template)
-            self.template_parser = TextFSM(stream)
-        except Exception as ex:
-            error_msg = f"{type(ex).__name__}: {ex}"
-            if not self.debug:
-                raise TemplateBuilderError(error_msg)
-            self.logger.error(error_msg)
-            self.bad_template = f"# {error_msg}\n{self.template}"
-            self.template = ""
+        Parameters
+        ----------
+        entry : dict
+            A mapping returned by `get_build_cache_entry`.
+        """
+        self.statements = list(entry["statements"])
+        self.variables = get_variables_from_triples(entry["variables"])
 
     def show_debug_info(
             self,
             test_result: list[dict] | None = None,
             expected_result: list[dict] | None = None,
             tabular: bool = False,
+            profile_report: dict | None = None,
     ) -> None:
         """
         Display debug information for template verification.
@@ -669,6 +1945,9 @@ class TemplateBuilder:
         tabular : bool, default=False
             If True, format `test_result` as a tabular string using
             `get_data_as_tabular`. Otherwise, display raw dictionaries.
+        profile_report : dict, optional
+            A `get_profile_report` report, displayed as tables of the
+            states and rules.
 
         Returns
         -------
@@ -706,12 +1985,38 @@ class TemplateBuilder:
                 test_result) if tabular else test_result
             print(f"{formatted_result}\n")
 
+        # Profile
+        if profile_report is not None:
+            printer.print("Profile:".ljust(width))
+            print(f"{get_profile_report_text(profile_report)}\n")
+
         # Verified Message
         verified_msg = f"Verified Message: {self.verified_message}"
         printer.print(verified_msg.ljust(width))
 
+    def get_test_result(self) -> list[dict]:
+        """
+        Parse the test data with the template, once per template and data.
+
+        Returns
+        -------
+        list of dict
+            The parsed rows. The list is cached and shared between calls,
+            so callers must not modify it.
+
+        Raises
+        ------
+        Exception
+            Any `textfsm` error raised while parsing the test data.
+        """
+        key = (self.template, self.test_data)
+        if self._test_result_key != key:
+            self._test_result = TEXTFSM_PARSER_POOL.parse_text_to_dicts(*key)
+            self._test_result_key = key
+        return self._test_result
+
     def verify(self, expected_rows_count=None, expected_result=None,
-               tabular=False, debug=False, ignore_space=False):
+               tabular=False, debug=False, ignore_space=False, profile=False):
         """
         Verify parsed test data against expected results.
 
@@ -736,6 +2041,10 @@ class TemplateBuilder:
         ignore_space : bool, default=False
             If True, strip leading and trailing spaces from parsed data before
             comparison.
+        profile : bool, default=False
+            If True, profile the template on the test data and keep the
+            report in `self.profile_report` (see `get_profile_report`).
+            With `debug`, the report is printed as tables.
 
         Returns
         -------
@@ -756,11 +2065,12 @@ class TemplateBuilder:
 
         is_verified = True
         try:
-            rows = self.template_parser.ParseTextToDicts(self.test_data)
+            rows = self.get_test_result()
+            self.profile_report = self.get_profile_report() if profile else None
             if not rows:
                 self.verified_message = 'There is no record after parsed.'
                 if debug:
-                    self.show_debug_info()
+                    self.show_debug_info(profile_report=self.profile_report)
                 return False
 
             # Validate row count
@@ -797,7 +2107,8 @@ class TemplateBuilder:
                 self.show_debug_info(
                     test_result=rows,
                     expected_result=expected_result,
-                    tabular=tabular
+                    tabular=tabular,
+                    profile_report=self.profile_report,
                 )
 
             return is_verified
@@ -805,6 +2116,170 @@ class TemplateBuilder:
         except Exception as ex:
             raise TemplateBuilderError(f"{type(ex).__name__}: {ex}")
 
+    def verify_stream(self, source=None, expected_rows_count=None,
+                      expected_result=None, boundary=None, chunk_lines=1000,
+                      ignore_space=False, max_mismatches=5) -> dict:
+        """
+        Verify large test data chunk by chunk with bounded memory.
+
+        Unlike `verify`, the test data is read lazily, parsed one chunk
+        at a time by `iter_parsed_chunks`, and compared row by row with
+        `expected_result`, so neither the test data nor the parsed rows
+        are held in memory as a whole. `self.verified_message` is updated
+        with the verification outcome.
+
+        Parameters
+        ----------
+        source : str, os.PathLike, or iterable of str, optional
+            A test data file name, or an iterable of lines such as an open
+            file. Defaults to the lines of `self.test_data`.
+        expected_rows_count : int, optional
+            Expected number of parsed rows.
+        expected_result : iterable of dict, optional
+            Expected parsed rows, which may be a generator.
+        boundary : str, optional
+            Regex pattern of a line starting a new record, used to split
+            the test data into chunks (see `iter_text_chunks`).
+        chunk_lines : int, default=1000
+            Maximum number of lines in a chunk.
+        ignore_space : bool, default=False
+            If True, strip leading and trailing spaces from parsed data before
+            comparison.
+        max_mismatches : int, default=5
+            Maximum number of mismatched rows kept in the report.
+
+        Returns
+        -------
+        dict
+            Report with keys ``is_verified``, ``lines_count``,
+            ``chunks_count``, ``rows_count``, ``expected_rows_count``,
+            ``mismatches_count``, and ``mismatches``, a list of the first
+            mismatched rows as dicts with ``index``, ``expected``, and
+            ``actual`` (None for a missing row).
+
+        Raises
+        ------
+        TemplateBuilderError
+            Raised if an exception occurs during reading or parsing.
+        """
+        report = dict(
+            is_verified=False, lines_count=0, chunks_count=0, rows_count=0,
+            expected_rows_count=expected_rows_count, mismatches_count=0,
+            mismatches=[],
+        )
+
+        def iter_lines(lines):
+            for line in lines:
+                report["lines_count"] += 1
+                yield line
+
+        def iter_chunks(chunks):
+            for chunk in chunks:
+                report["chunks_count"] += 1
+                yield chunk
+
+        def compare(index, expected, actual):
+            if expected == actual:
+                return
+            report["mismatches_count"] += 1
+            if len(report["mismatches"]) < max_mismatches:
+                report["mismatches"].append(
+                    dict(index=index, expected=expected, actual=actual)
+                )
+
+        expected_rows = None if expected_result is None else iter(expected_result)
+        try:
+            with ExitStack() as stack:
+                if source is None:
+                    lines = self.test_data.splitlines()
+                elif isinstance(source, (str, os.PathLike)):
+                    lines = stack.enter_context(open(source, encoding="utf-8"))
+                else:
+                    lines = source
+
+                chunks = iter_chunks(iter_text_chunks(
+                    iter_lines(lines), boundary=boundary, chunk_lines=chunk_lines
+                ))
+                for rows in iter_parsed_chunks(self.template, chunks):
+                    if ignore_space:
+                        rows = datatype.clean_list_of_dicts(rows)
+                    for row in rows:
+                        if expected_rows is not None:
+                            compare(report["rows_count"], next(expected_rows, None), row)
+                        report["rows_count"] += 1
+
+            if expected_rows is not None:
+                for index, expected in enumerate(expected_rows, report["rows_count"]):
+                    compare(index, expected, None)
+        except Exception as ex:
+            raise TemplateBuilderError(f"{type(ex).__name__}: {ex}")
+
+        if not report["lines_count"]:
+            self.verified_message = 'test_data is empty.'
+            return report
+        if not report["rows_count"]:
+            self.verified_message = 'There is no record after parsed.'
+            return report
+
+        is_verified = True
+        messages = []
+        if expected_rows_count is not None:
+            actual_count = report["rows_count"]
+            chk = expected_rows_count == actual_count
+            is_verified &= chk
+            messages.append(
+                f"Parsed-row-count and expected-row-count are {expected_rows_count}."
+                if chk else
+                f"Parsed-row-count is {actual_count} while expected-row-count is {expected_rows_count}."
+            )
+        if expected_rows is not None:
+            chk = not report["mismatches_count"]
+            is_verified &= chk
+            messages.append(
+                "Parsed result and expected result are matched." if chk else
+                f"Parsed result and expected result are different "
+                f"in {report['mismatches_count']} row(s)."
+            )
+        if is_verified and not messages:
+            messages.append('Parsed result has record(s).')
+
+        self.verified_message = "\n".join(messages)
+        report.update(is_verified=is_verified)
+        return report
+
+    def verify_corpus(self, corpus, workers=None, max_failures=None,
+                      boundary=None, chunk_lines=1000) -> dict:
+        """
+        Verify the template against a corpus of capture files.
+
+        This method runs `verify_corpus` with the current template and
+        updates `self.verified_message` with the text summary.
+
+        Parameters
+        ----------
+        corpus : str, os.PathLike, or iterable of str
+            A directory, a glob pattern, or capture file names.
+        workers : int, optional
+            Number of worker processes. Defaults to `os.cpu_count()`.
+        max_failures : int, optional
+            Number of failed captures that stops the run, at least 1.
+        boundary : str, optional
+            Regex pattern of a line starting a new record.
+        chunk_lines : int, default=1000
+            Maximum number of lines in a chunk.
+
+        Returns
+        -------
+        dict
+            The summary report of `verify_corpus`.
+        """
+        report = verify_corpus(
+            self.template, corpus, workers=workers, max_failures=max_failures,
+            boundary=boundary, chunk_lines=chunk_lines,
+        )
+        self.verified_message = get_corpus_report_text(report)
+        return report
+
     def create_test_script(self, test_script_fmt: str, error: str) -> str:
         """
         Generate a test script from the current template and test data.
@@ -992,6 +2467,84 @@ class TemplateBuilder:
         test_script = self.create_test_script(test_script_fmt, error)
         return test_script
 
+    def create_python_parser(self, prefilter=True) -> str:
+        """
+        Generate a standalone Python parser module for the current template.
+
+        The module has precompiled regexes, one function per state, and
+        the Value options inlined (see `textfsmgen.codegen`). It gives the
+        same rows as `TextFSM.ParseTextToDicts` without the TextFSM
+        interpreter. The module is written to `self.filename` if set.
+
+        Parameters
+        ----------
+        prefilter : bool, default=True
+            If True, a rule's regex is only evaluated on lines containing
+            the rule's longest required literal.
+
+        Returns
+        -------
+        str
+            The generated module source.
+
+        Raises
+        ------
+        TemplateBuilderError
+            Raised if there is no valid template.
+        ParserCodeGenError
+            Raised if the template uses an unsupported Value option.
+        """
+        if not self.template:
+            raise TemplateBuilderError('Cannot create Python parser without a valid template.')
+
+        source = generate_parser_code(self.template, prefilter=prefilter)
+        if self.filename:
+            file.write(self.filename, source)
+        return source
+
+    def get_prefilter_report(self) -> dict:
+        """
+        Report the regex evaluations the rule prefilter avoids on test data.
+
+        Returns
+        -------
+        dict
+            The report of `textfsmgen.codegen.get_prefilter_report` for
+            `self.template` and `self.test_data`.
+
+        Raises
+        ------
+        TemplateBuilderError
+            Raised if there is no valid template or no test data.
+        """
+        if not self.template:
+            raise TemplateBuilderError('Cannot report rule prefilter without a valid template.')
+        if not self.test_data:
+            raise TemplateBuilderError('Cannot report rule prefilter without test data.')
+        return get_prefilter_report(self.template, self.test_data)
+
+    def get_profile_report(self) -> dict:
+        """
+        Profile the template while it parses the test data.
+
+        Returns
+        -------
+        dict
+            The report of `textfsmgen.profiler.profile_template` for
+            `self.template` and `self.test_data`: per-state and per-rule
+            attempts, matches and regex time, and lines per second.
+
+        Raises
+        ------
+        TemplateBuilderError
+            Raised if there is no valid template or no test data.
+        """
+        if not self.template:
+            raise TemplateBuilderError('Cannot profile without a valid template.')
+        if not self.test_data:
+            raise TemplateBuilderError('Cannot profile without test data.')
+        return profile_template(self.template, self.test_data)
+
 
 def get_textfsm_template(
     template_snippet: str,
@@ -1043,3 +2596,352 @@ def get_textfsm_template(
     return textfsm_template
 
 
+def build_snippet(template_snippet: str, **kwargs) -> dict:
+    """
+    Build a TextFSM template from a snippet, capturing any error.
+
+    Parameters
+    ----------
+    template_snippet : str
+        Raw user data snippet to be converted into a TextFSM template.
+    **kwargs
+        Other keyword arguments of `TemplateBuilder`, such as `author`,
+        `company`, or `skip_compile`.
+
+    Returns
+    -------
+    dict
+        Mapping with the ``template`` (empty on failure) and the ``error``
+        message as ``"<ExceptionName>: <message>"`` (empty on success).
+    """
+    try:
+        builder = TemplateBuilder(user_data=template_snippet, **kwargs)
+        return dict(template=builder.template, error="")
+    except Exception as ex:
+        return dict(template="", error=f"{type(ex).__name__}: {ex}")
+
+
+def build_many(snippets, workers=None, chunksize=None, **kwargs) -> list[dict]:
+    """
+    Build TextFSM templates from many snippets over a process pool.
+
+    Snippets are sent to the workers in chunks, which keeps the
+    inter-process overhead low for the small snippets of a template
+    library. An error in one snippet is captured in its result and does
+    not abort the batch.
+
+    Parameters
+    ----------
+    snippets : iterable of str
+        Raw user data snippets.
+    workers : int, optional
+        Number of worker processes. Defaults to `os.cpu_count()`. With one
+        worker, or a single snippet, templates are built in this process.
+    chunksize : int, optional
+        Number of snippets sent to a worker at a time. Defaults to about
+        four chunks per worker.
+    **kwargs
+        Other keyword arguments of `TemplateBuilder`, applied to every
+        snippet.
+
+    Returns
+    -------
+    list of dict
+        One `build_snippet` result per snippet, in input order.
+    """
+    snippets = list(snippets)
+    workers = max(int(workers or os.cpu_count() or 1), 1)
+    build = partial(build_snippet, **kwargs)
+
+    if workers == 1 or len(snippets) <= 1:
+        return [build(snippet) for snippet in snippets]
+
+    workers = min(workers, len(snippets))
+    if not chunksize:
+        chunksize, extra = divmod(len(snippets), workers * 4)
+        chunksize += bool(extra)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(build, snippets, chunksize=chunksize))
+
+
+async def run_in_executor(func, *args, executor=None, semaphore=None, **kwargs):
+    """
+    Run a blocking callable on an executor without blocking the event loop.
+
+    Parameters
+    ----------
+    func : callable
+        The blocking callable.
+    *args
+        Positional arguments of `func`.
+    executor : concurrent.futures.Executor, optional
+        Executor running `func`. Defaults to the loop's default executor.
+        A process pool requires `func` and its arguments to be picklable.
+    semaphore : asyncio.Semaphore, optional
+        Semaphore held while `func` runs, to limit concurrency.
+    **kwargs
+        Keyword arguments of `func`.
+
+    Returns
+    -------
+    object
+        The return value of `func`.
+
+    Notes
+    -----
+    Cancelling the awaiting task cancels a job that has not started yet.
+    A job already running on a worker finishes, and its result is dropped.
+    """
+    loop = asyncio.get_running_loop()
+    call = partial(func, *args, **kwargs)
+    if semaphore is None:
+        return await loop.run_in_executor(executor, call)
+    async with semaphore:
+        return await loop.run_in_executor(executor, call)
+
+
+async def abuild_template(
+    template_snippet: str,
+    author: str = "",
+    email: str = "",
+    company: str = "",
+    description: str = "",
+    executor=None,
+    semaphore=None,
+) -> str:
+    """
+    Asynchronous counterpart of `get_textfsm_template`.
+
+    The template is built by `run_in_executor`, so the event loop stays
+    responsive while the snippet is parsed and the template compiled.
+
+    Parameters
+    ----------
+    template_snippet : str
+        Raw user data snippet to be converted into a TextFSM template.
+    author, email, company, description : str, optional
+        Template metadata, as in `get_textfsm_template`.
+    executor : concurrent.futures.Executor, optional
+        Executor running the build. Defaults to the loop's default executor.
+    semaphore : asyncio.Semaphore, optional
+        Semaphore limiting the number of concurrent builds.
+
+    Returns
+    -------
+    str
+        The generated TextFSM template.
+
+    Raises
+    ------
+    TemplateBuilderError
+        If the template cannot be built due to invalid input or parsing errors.
+    TemplateBuilderInvalidFormat
+        If the provided snippet has an invalid format.
+    """
+    return await run_in_executor(
+        get_textfsm_template,
+        template_snippet,
+        author=author,
+        email=email,
+        company=company,
+        description=description,
+        executor=executor,
+        semaphore=semaphore,
+    )
+
+
+def get_corpus_filenames(corpus) -> list[str]:
+    """
+    Resolve a corpus of capture files into a sorted list of file names.
+
+    Parameters
+    ----------
+    corpus : str, os.PathLike, or iterable of str
+        A directory (searched recursively), a glob pattern such as
+        ``captures/**/*.txt``, or an iterable of file names.
+
+    Returns
+    -------
+    list of str
+        The capture file names, sorted and without duplicates.
+    """
+    if isinstance(corpus, (str, os.PathLike)):
+        corpus = os.fspath(corpus)
+        if os.path.isdir(corpus):
+            filenames = [
+                os.path.join(dirpath, name)
+                for dirpath, _, names in os.walk(corpus) for name in names
+            ]
+        else:
+            filenames = glob.glob(corpus, recursive=True)
+    else:
+        filenames = [os.fspath(filename) for filename in corpus]
+    return sorted(set(filename for filename in filenames if os.path.isfile(filename)))
+
+
+def verify_capture(template: str, filename: str, boundary=None,
+                   chunk_lines=1000) -> dict:
+    """
+    Parse a capture file with a template and report the outcome.
+
+    The file is parsed chunk by chunk with `iter_parsed_chunks`, so large
+    captures are not read into memory. A capture fails if it cannot be
+    read or parsed, or if it yields no record.
+
+    Parameters
+    ----------
+    template : str
+        The TextFSM template text.
+    filename : str
+        The capture file name.
+    boundary : str, optional
+        Regex pattern of a line starting a new record (see
+        `iter_text_chunks`).
+    chunk_lines : int, default=1000
+        Maximum number of lines in a chunk.
+
+    Returns
+    -------
+    dict
+        Mapping with the ``filename``, the ``rows_count``, ``is_verified``,
+        the ``error`` message (empty on success), and the ``elapsed``
+        parse time in seconds.
+    """
+    start = time.perf_counter()
+    rows_count, error = 0, ""
+    try:
+        with open(filename, encoding="utf-8", errors="replace") as stream:
+            chunks = iter_text_chunks(stream, boundary=boundary, chunk_lines=chunk_lines)
+            for rows in iter_parsed_chunks(template, chunks):
+                rows_count += len(rows)
+        if not rows_count:
+            error = "There is no record after parsed."
+    except Exception as ex:
+        error = f"{type(ex).__name__}: {ex}"
+    return dict(
+        filename=filename,
+        rows_count=rows_count,
+        is_verified=not error,
+        error=error,
+        elapsed=round(time.perf_counter() - start, 6),
+    )
+
+
+def verify_corpus(template: str, corpus, workers=None, max_failures=None,
+                  boundary=None, chunk_lines=1000) -> dict:
+    """
+    Verify a template against a corpus of capture files.
+
+    Every capture is checked by `verify_capture`, over a process pool
+    when more than one worker is used. Once `max_failures` captures have
+    failed, captures not yet started are skipped.
+
+    Parameters
+    ----------
+    template : str
+        The TextFSM template text.
+    corpus : str, os.PathLike, or iterable of str
+        Capture files, as accepted by `get_corpus_filenames`.
+    workers : int, optional
+        Number of worker processes. Defaults to `os.cpu_count()`.
+    max_failures : int, optional
+        Number of failed captures that stops the run, at least 1.
+        Defaults to no limit.
+    boundary : str, optional
+        Regex pattern of a line starting a new record.
+    chunk_lines : int, default=1000
+        Maximum number of lines in a chunk.
+
+    Returns
+    -------
+    dict
+        Summary report with the ``template_hash`` (see
+        `TextFSMParserPool.get_key`), the counts ``files_count``, ``verified_count``,
+        ``failures_count``, ``skipped_count`` and ``rows_count``, the
+        ``elapsed`` wall time in seconds, ``is_stopped`` if the failure
+        threshold was reached, and ``results``, the `verify_capture`
+        result of every capture that ran, in file name order.
+
+    Raises
+    ------
+    ValueError
+        If `max_failures` is less than 1.
+    """
+    start = time.perf_counter()
+    filenames = get_corpus_filenames(corpus)
+    workers = max(int(workers or os.cpu_count() or 1), 1)
+    verify_file = partial(verify_capture, template, boundary=boundary,
+                          chunk_lines=chunk_lines)
+
+    if max_failures is not None and max_failures < 1:
+        raise ValueError(f"max_failures must be at least 1, not {max_failures}")
+    max_failures = max_failures or len(filenames) + 1
+
+    results, failures_count = [], 0
+    if workers == 1 or len(filenames) <= 1:
+        for filename in filenames:
+            result = verify_file(filename)
+            results.append(result)
+            failures_count += not result["is_verified"]
+            if failures_count >= max_failures:
+                break
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(filenames))) as executor:
+            futures = [executor.submit(verify_file, filename) for filename in filenames]
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                result = future.result()
+                results.append(result)
+                failures_count += not result["is_verified"]
+                if failures_count >= max_failures:
+                    for other in futures:
+                        other.cancel()
+        results.sort(key=lambda result: result["filename"])
+
+    return dict(
+        template_hash=TextFSMParserPool.get_key(template),
+        files_count=len(filenames),
+        verified_count=len(results) - failures_count,
+        failures_count=failures_count,
+        skipped_count=len(filenames) - len(results),
+        rows_count=sum(result["rows_count"] for result in results),
+        elapsed=round(time.perf_counter() - start, 6),
+        is_stopped=len(results) < len(filenames),
+        results=results,
+    )
+
+
+def get_corpus_report_text(report: dict) -> str:
+    """
+    Format a `verify_corpus` report as text.
+
+    Parameters
+    ----------
+    report : dict
+        A report returned by `verify_corpus`.
+
+    Returns
+    -------
+    str
+        A table of the per-file results followed by a summary line.
+    """
+    lines = []
+    if report["results"]:
+        columns = ["filename", "rows_count", "elapsed", "error"]
+        lines.append(get_data_as_tabular(report["results"], columns=columns))
+    summary = (
+        f"{report['files_count']} file(s): {report['verified_count']} verified, "
+        f"{report['failures_count']} failed, {report['skipped_count']} skipped, "
+        f"{report['rows_count']} row(s) in {report['elapsed']:.3f}s"
+    )
+    if report["is_stopped"]:
+        summary = f"{summary} (stopped at failure threshold)"
+    lines.append(summary)
+    return "\n".join(lines)
+
+
+def get_corpus_report_json(report: dict) -> str:
+    """Format a `verify_corpus` report as indented JSON."""
+    return json.dumps(report, indent=2)
@@ -86,3 +86,15 @@ from regexapp import ElementPattern as regexapp_ElementPattern  # noqa
 # Core functions
 # String utilities for enclosing and formatting regex expressions.
 from regexapp.core import enclose_string as regexapp_enclose_string  # noqa
+
+# Variable container
+# Holds the name, pattern, and option of a template variable.
+from regexapp.collection import VarCls as regexapp_VarCls      # noqa
+
+# Pattern references
+# Keyword patterns loaded from the system and user reference files.
+from regexapp.collection import REF as regexapp_REF     # noqa
+
+# Versioning
+# Provides version metadata for RegexApp.
+from regexapp import version as regexapp_version        # noqa
@@ -24,7 +24,7 @@ Notes
 - Exception messages are designed to be user‑friendly for GUI dialogs
   while still informative for developers.
 """
-from textfsmgen.deps import genericlib_raise_runtime_error as raise_runtime_error
+from textfsmgen.deps import genericlib_raise_runtime_error as raise_runtime_error   # noqa
 from textfsmgen.deps import genericlib_raise_exception as raise_exception   # noqa
 
 
@@ -75,15 +75,117 @@ class NoTestDataError(TemplateError):
     """
 
 
+class ParserCodeGenError(TemplateError):
+    """
+    Raised when a standalone parser cannot be generated from a template.
+    """
+
+
+class RuntimeErrorRegistry:
+    """
+    Registry of dynamically created runtime exception classes.
+
+    `genericlib.exceptions.raise_runtime_error` creates a new exception
+    type on every raise. This registry creates each named exception class
+    once and reuses it, so the retry and fallback loops of the generator
+    do not build a fresh type per failure. Class names are derived exactly
+    as genericlib derives them.
+
+    Attributes
+    ----------
+    classes : dict
+        Mapping of exception class name to exception class.
+    """
+    __slots__ = ("classes",)
+
+    def __init__(self):
+        self.classes = dict()
+
+    def __len__(self):
+        return len(self.classes)
+
+    def __contains__(self, name):
+        return name in self.classes
+
+    @classmethod
+    def get_class_name(cls, obj=None) -> str:
+        """
+        Derive the exception class name of an object.
+
+        Parameters
+        ----------
+        obj : Any, optional
+            A string used as the class name, or an object whose class
+            name is suffixed with "RTError". None results in "RuntimeError".
+
+        Returns
+        -------
+        str
+            The exception class name, with its first character uppercased.
+        """
+        if obj is None:
+            name = "RuntimeError"
+        else:
+            name = obj if isinstance(obj, str) else f"{type(obj).__name__}RTError"
+        name = str(name)
+        return name[0].upper() + name[1:]
+
+    def get_class(self, obj=None) -> type:
+        """
+        Return the exception class for an object, creating it once.
+
+        Parameters
+        ----------
+        obj : Any, optional
+            The object or string used to derive the exception class name.
+
+        Returns
+        -------
+        type
+            A subclass of `Exception` named after `obj`.
+        """
+        name = self.get_class_name(obj)
+        exc_cls = self.classes.get(name)
+        if exc_cls is None:
+            exc_cls = self.classes.setdefault(name, type(name, (Exception,), {}))
+        return exc_cls
+
+    def create_runtime_error(self, obj=None, msg: str = "") -> Exception:
+        """
+        Create a runtime exception instance of a registered class.
+
+        Parameters
+        ----------
+        obj : Any, optional
+            The object or string used to derive the exception class name.
+        msg : str, optional
+            The error message to associate with the exception.
+
+        Returns
+        -------
+        Exception
+            A new instance of the registered exception class.
+        """
+        return self.get_class(obj)(msg)
+
+    def clear(self) -> None:
+        """Remove every registered exception class."""
+        self.classes.clear()
+
+
+RUNTIME_ERROR_REGISTRY = RuntimeErrorRegistry()
+
+
 class RuntimeException:
     """
     Utility class for raising dynamically created runtime exceptions.
 
-    This class provides convenience methods that delegate to
-    `genericlib.exceptions.raise_runtime_error` to generate and raise custom
+    This class provides convenience methods that generate and raise custom
     exception types at runtime. The exception class name is derived
-    from either a provided string or the class name of an object.
+    from either a provided string or the class name of an object, and
+    each named class is created once by `RUNTIME_ERROR_REGISTRY`.
     """
+    __slots__ = ()
 
     def raise_runtime_error(self, name: str = "", msg: str = ""):
         """
@@ -106,7 +208,7 @@ class RuntimeException:
         """
         name = name.strip()
         obj = name or self
-        raise_runtime_error(obj=obj, msg=msg)
+        raise RUNTIME_ERROR_REGISTRY.create_runtime_error(obj=obj, msg=msg)
 
     @classmethod
     def do_raise_runtime_error(cls, obj=None, msg: str = ""):
@@ -128,4 +230,4 @@ class RuntimeException:
             A dynamically created exception instance with the specified
             message.
         """
-        raise_runtime_error(obj=obj, msg=msg)
+        raise RUNTIME_ERROR_REGISTRY.create_runtime_error(obj=obj, msg=msg)
@@ -40,6 +40,8 @@ Notes
 """
 
 import re
+import threading
+from collections import OrderedDict
 
 from textfsmgen.deps import genericlib_NUMBER as NUMBER     # noqa
 from textfsmgen.deps import genericlib_STRING as STRING     # noqa
@@ -50,6 +52,350 @@ from textfsmgen.deps import genericlib_datatype_module as datatype
 from textfsmgen.deps import genericlib_Line as Line
 
 from textfsmgen.exceptions import RuntimeException
+from textfsmgen.redos import make_safe_pattern
+
+
+class PatternRegistry:
+    """
+    Registry of precompiled, fully anchored regex patterns.
+
+    Patterns are registered under a reference name (e.g. ``"digits"`` or
+    ``"word_or_group"``) and compiled once. Matching goes through the
+    compiled object's ``fullmatch`` method, so callers do not depend on the
+    small internal cache of the `re` module, which is easily exhausted once
+    many pattern constants are in use.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of cached patterns that were never registered.
+        Defaults to 1024.
+
+    Notes
+    -----
+    - Registered patterns are kept for the life of the registry.
+    - Patterns that were never registered are compiled on first use and
+      kept in a bounded LRU cache, so any pattern string can be matched
+      through the registry without growing it forever.
+    - Access to the LRU cache is guarded by a lock.
+    """
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._patterns = dict()
+        self._matchers = dict()
+        self._adhoc_matchers = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, name):
+        return name in self._patterns
+
+    def __len__(self):
+        return len(self._patterns)
+
+    def register(self, name, pattern):
+        """
+        Register and precompile a pattern under a reference name.
+
+        Parameters
+        ----------
+        name : str
+            Reference name of the pattern.
+        pattern : str
+            Regex pattern string.
+        """
+        self._patterns[name] = pattern
+        if pattern not in self._matchers:
+            self._matchers[pattern] = re.compile(pattern).fullmatch
+
+    def get_pattern(self, name, default=None):
+        """
+        Return the pattern string registered under `name`.
+
+        Parameters
+        ----------
+        name : str
+            Reference name of the pattern.
+        default : Any, optional
+            Value returned when `name` is not registered.
+
+        Returns
+        -------
+        str or Any
+            The registered pattern string, or `default`.
+        """
+        return self._patterns.get(name, default)
+
+    def get_matcher(self, pattern):
+        """
+        Return the ``fullmatch`` method of the compiled `pattern`.
+
+        Parameters
+        ----------
+        pattern : str
+            Regex pattern string.
+
+        Returns
+        -------
+        callable
+            A function that takes a string and returns a match object
+            only when the whole string matches `pattern`.
+        """
+        matcher = self._matchers.get(pattern)
+        if matcher is not None:
+            return matcher
+
+        with self._lock:
+            matcher = self._adhoc_matchers.get(pattern)
+            if matcher is not None:
+                self._adhoc_matchers.move_to_end(pattern)
+                return matcher
+
+        matcher = re.compile(pattern).fullmatch
+        with self._lock:
+            self._adhoc_matchers[pattern] = matcher
+            while len(self._adhoc_matchers) > max(self.maxsize, 0):
+                self._adhoc_matchers.popitem(last=False)
+        return matcher
+
+
+PATTERN_REGISTRY = PatternRegistry()
+for _name, _pattern in [
+    # single-token patterns
+    (TEXT.DIGIT, PATTERN.DIGIT),
+    (TEXT.DIGITS, PATTERN.DIGITS),
+    (TEXT.NUMBER, PATTERN.NUMBER),
+    (TEXT.MIXED_NUMBER, PATTERN.MIXED_NUMBER),
+    (TEXT.LETTER, PATTERN.LETTER),
+    (TEXT.LETTERS, PATTERN.LETTERS),
+    (TEXT.ALPHABET_NUMERIC, PATTERN.ALPHABET_NUMERIC),
+    (TEXT.PUNCT, PATTERN.PUNCT),
+    (TEXT.PUNCTS, PATTERN.PUNCTS),
+    (TEXT.GRAPH, PATTERN.GRAPH),
+    (TEXT.WORD, PATTERN.WORD),
+    (TEXT.MIXED_WORD, PATTERN.MIXED_WORD),
+    (TEXT.NON_WHITESPACE, PATTERN.NON_WHITESPACE),
+    (TEXT.NON_WHITESPACES, PATTERN.NON_WHITESPACES),
+
+    # punctuation groups
+    ("puncts_or_phrase", PATTERN.PUNCTS_OR_PHRASE),
+    ("puncts_or_group", PATTERN.PUNCTS_OR_GROUP),
+    ("puncts_phrase", PATTERN.PUNCTS_PHRASE),
+    ("puncts_group", PATTERN.PUNCTS_GROUP),
+
+    # word groups
+    ("words", PATTERN.WORDS),
+    ("word_or_group", PATTERN.WORD_OR_GROUP),
+    ("phrase", PATTERN.PHRASE),
+    ("word_group", PATTERN.WORD_GROUP),
+
+    # mixed word groups
+    ("mixed_words", PATTERN.MIXED_WORDS),
+    ("mixed_word_or_group", PATTERN.MIXED_WORD_OR_GROUP),
+    ("mixed_phrase", PATTERN.MIXED_PHRASE),
+    ("mixed_word_group", PATTERN.MIXED_WORD_GROUP),
+
+    # non-whitespace groups
+    ("non_whitespaces_or_phrase", PATTERN.NON_WHITESPACES_OR_PHRASE),
+    ("non_whitespaces_or_group", PATTERN.NON_WHITESPACES_OR_GROUP),
+    ("non_whitespaces_phrase", PATTERN.NON_WHITESPACES_PHRASE),
+    ("non_whitespaces_group", PATTERN.NON_WHITESPACES_GROUP),
+]:
+    PATTERN_REGISTRY.register(_name, _pattern)
+
+
+class NotCreated:
+    """
+    Falsy sentinel returned by the non-raising ``try_*`` factories.
+
+    Factories such as `TranslatedPattern.try_create` return the singleton
+    `NOT_CREATED` instead of raising a runtime error, so callers probing
+    many inputs (one per line, token, or class pair) avoid building an
+    exception object and a traceback for every rejected input.
+    """
+    __slots__ = ()
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return "NOT_CREATED"
+
+
+NOT_CREATED = NotCreated()
+
+
+# Simplified (lessened) category of each group reference name.
+LESSEN_NAMES = dict(
+    # punctuation-related groups
+    puncts_or_group="puncts_or_group",
+    puncts_group="puncts_or_group",
+    puncts_phrase="puncts_or_group",
+    puncts_or_phrase="puncts_or_group",
+
+    # word-related groups
+    word_or_group="word_or_group",
+    word_group="word_or_group",
+    phrase="word_or_group",
+    words="word_or_group",
+
+    # mixed word groups
+    mixed_word_or_group="mixed_word_or_group",
+    mixed_words="mixed_word_or_group",
+    mixed_phrase="mixed_word_or_group",
+    mixed_word_group="mixed_word_or_group",
+
+    # non-whitespace groups
+    non_whitespaces_or_group="non_whitespaces_or_group",
+    non_whitespaces_or_phrase="non_whitespaces_or_group",
+    non_whitespaces_phrase="non_whitespaces_or_group",
+    non_whitespaces_group="non_whitespaces_or_group",
+)
+
+
+class FactoryCache:
+    """
+    Bounded LRU cache of translated pattern objects keyed by token tuples.
+
+    Network command outputs repeat the same tokens constantly (``up``,
+    ``down``, ``0``, interface names, timestamps). When enabled, the
+    cache lets `TranslatedPattern.do_factory_create` and
+    `TranslatedPattern.recommend_pattern_using_data` reuse previous
+    results instead of classifying the same tokens again. Because every
+    module calls the factory, the cache is shared by `gpcommon`,
+    `gptabular`, `gpdiff` and `gpiterative`.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of cached entries. Defaults to 4096.
+    enabled : bool, optional
+        Whether the cache is active. Defaults to False (opt-in).
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups served from the cache.
+    misses : int
+        Number of lookups not found in the cache.
+    evictions : int
+        Number of entries dropped because the cache was full.
+
+    Notes
+    -----
+    - Entries are stored and returned as copies (`TranslatedPattern.copy`),
+      so callers cannot corrupt a cached object.
+    - Access is guarded by a lock, so the cache may be shared by threads.
+    """
+    def __init__(self, maxsize=4096, enabled=False):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def enable(self, maxsize=None):
+        """
+        Activate the cache.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            New size bound. The current bound is kept when omitted.
+        """
+        if maxsize is not None:
+            self.maxsize = maxsize
+        self.enabled = True
+        self._shrink()
+
+    def disable(self):
+        """Deactivate the cache and drop its entries."""
+        self.enabled = False
+        self.clear()
+
+    def clear(self):
+        """Drop every entry and reset the hit/miss/eviction counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def get(self, key):
+        """
+        Return a copy of the object cached under `key`.
+
+        Parameters
+        ----------
+        key : tuple
+            Cache key, the name of the factory method paired with the
+            tuple of tokens it was given.
+
+        Returns
+        -------
+        TranslatedPattern or None
+            A copy of the cached object, or None when the cache is
+            disabled or `key` is not cached.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            node = self._entries.get(key)
+            if node is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return node.copy()
+
+    def put(self, key, node):
+        """
+        Cache a copy of `node` under `key`, evicting the least recently used entry.
+
+        Parameters
+        ----------
+        key : tuple
+            Cache key, the name of the factory method paired with the
+            tuple of tokens it was given.
+        node : TranslatedPattern
+            The object to cache.
+        """
+        if not self.enabled:
+            return
+        node = node.copy()
+        with self._lock:
+            self._entries[key] = node
+            self._entries.move_to_end(key)
+        self._shrink()
+
+    def get_stats(self):
+        """
+        Return the cache counters.
+
+        Returns
+        -------
+        dict
+            Mapping with ``hits``, ``misses``, ``evictions``, ``size`` and
+            ``maxsize`` keys.
+        """
+        return dict(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._entries),
+            maxsize=self.maxsize,
+        )
+
+    def _shrink(self):
+        with self._lock:
+            while len(self._entries) > max(self.maxsize, 0):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+
+FACTORY_CACHE = FactoryCache()
 
 
 class LData(RuntimeException):
@@ -75,6 +421,8 @@ class LData(RuntimeException):
         Stripped version of `raw_data` with leading/trailing
         whitespace removed.
     """
+    __slots__ = ("raw_data", "data")
+
     def __init__(self, data):
         self.raw_data = str(data)
         self.data = self.raw_data.strip()
@@ -160,20 +508,38 @@ class TranslatedPattern(RuntimeException):
     - This class is primarily used internally by the `textfsmgen.gp` module
       to generate and validate regex patterns for parsing text.
     - Invalid patterns raise `TextPatternError`.
+    - Instances are slotted and only hold their data and resolved
+      pattern; names and defined patterns are class attributes shared
+      by every instance of a subclass.
     """
-    def __init__(self, data, *other, name='',
-                 defined_pattern='', defined_patterns=None, ref_names=None,
-                 singular_name='', singular_pattern='', root_name=''):
+    __slots__ = ("data", "lst_of_all_data", "_pattern")
+
+    # static per-class metadata, overridden by subclasses
+    name = STRING.EMPTY
+    defined_pattern = STRING.EMPTY
+    defined_patterns = ()
+    ref_names = ()
+    singular_name = STRING.EMPTY
+    singular_pattern = STRING.EMPTY
+    root_name = STRING.EMPTY
+
+    # (actual_name, lessen_name, lessen_pattern) per defined pattern,
+    # precomputed for each subclass by __init_subclass__
+    resolved_names = dict()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        resolved_names = dict()
+        if cls.defined_patterns and cls.ref_names:
+            for pattern, ref_name in zip(cls.defined_patterns, cls.ref_names):
+                lessen_name = LESSEN_NAMES.get(ref_name, cls.name)
+                lessen_pattern = PATTERN_REGISTRY.get_pattern(lessen_name)
+                resolved_names[pattern] = (ref_name, lessen_name, lessen_pattern)
+        cls.resolved_names = resolved_names
+
+    def __init__(self, data, *other):
         self.data = str(data)
-        self.lst_of_other_data = list(other)
-        self.lst_of_all_data = [self.data] + self.lst_of_other_data
-        self.defined_pattern = str(defined_pattern)
-        self.defined_patterns = defined_patterns if isinstance(defined_patterns, list) else []
-        self.ref_names = ref_names if isinstance(ref_names, (list, tuple)) else []
-        self.singular_name = singular_name
-        self.singular_pattern = singular_pattern
-        self.root_name = root_name
-        self.name = str(name)
+        self.lst_of_all_data = [self.data, *other]
         self._pattern = STRING.EMPTY
         self.process()
 
@@ -219,6 +585,34 @@ class TranslatedPattern(RuntimeException):
         new_instance = self.__class__(*args, **kwargs)
         return new_instance
 
+    def copy(self):
+        """
+        Create an independent copy of the instance without re-matching data.
+
+        Returns
+        -------
+        Self
+            A copy with its own data list, so modifying the copy never
+            affects the original.
+        """
+        new_instance = self.__class__.__new__(self.__class__)
+        new_instance.data = self.data
+        new_instance.lst_of_all_data = list(self.lst_of_all_data)
+        new_instance._pattern = self._pattern
+        return new_instance
+
+    @property
+    def lst_of_other_data(self):
+        """
+        Return the data entries given in addition to the primary data.
+
+        Returns
+        -------
+        list of str
+            Every entry of `lst_of_all_data` except the first one.
+        """
+        return self.lst_of_all_data[1:]
+
     @property
     def translated(self):
         """
@@ -250,9 +644,9 @@ class TranslatedPattern(RuntimeException):
             - The reference name associated with `_pattern`, or
             - The fallback `name` attribute if no mapping is found.
         """
-        if self.defined_patterns and self.ref_names:
-            idx = self.defined_patterns.index(self._pattern)
-            return self.ref_names[idx]
+        if self.resolved_names:
+            actual_name, _, _ = self.get_resolved_names()
+            return actual_name
         else:
             return self.name
 
@@ -279,44 +673,37 @@ class TranslatedPattern(RuntimeException):
         Notes
         -----
         - Assumes `defined_patterns` and `ref_names` are aligned lists.
-        - The lookup table groups related names into categories such as
-          "puncts_or_group", "word_or_group", "mixed_word_or_group",
-          and "non_whitespaces_or_group".
-        """
-        if self.defined_patterns and self.ref_names:
-            idx = self.defined_patterns.index(self._pattern)
-            name = self.ref_names[idx]
-
-            tbl = dict(
-                # punctuation-related groups
-                puncts_or_group="puncts_or_group",
-                puncts_group="puncts_or_group",
-                puncts_phrase="puncts_or_group",
-                puncts_or_phrase="puncts_or_group",
-
-                # word-related groups
-                word_or_group="word_or_group",
-                word_group="word_or_group",
-                phrase="word_or_group",
-                words="word_or_group",
-
-                # mixed word groups
-                mixed_word_or_group="mixed_word_or_group",
-                mixed_words="mixed_word_or_group",
-                mixed_phrase="mixed_word_or_group",
-                mixed_word_group="mixed_word_or_group",
-
-                # non-whitespace groups
-                non_whitespaces_or_group="non_whitespaces_or_group",
-                non_whitespaces_or_phrase="non_whitespaces_or_group",
-                non_whitespaces_phrase="non_whitespaces_or_group",
-                non_whitespaces_group="non_whitespaces_or_group",
-            )
-            lessen_name = tbl.get(name, self.name)
+        - The lookup table `LESSEN_NAMES` groups related names into
+          categories such as "puncts_or_group", "word_or_group",
+          "mixed_word_or_group", and "non_whitespaces_or_group".
+        """
+        if self.resolved_names:
+            _, lessen_name, _ = self.get_resolved_names()
             return lessen_name
         else:
             return self.name
 
+    def get_resolved_names(self):
+        """
+        Return the precomputed names of the current pattern.
+
+        Returns
+        -------
+        tuple of str
+            ``(actual_name, lessen_name, lessen_pattern)`` for `_pattern`,
+            looked up in the class-level `resolved_names` map.
+
+        Raises
+        ------
+        ValueError
+            If `_pattern` is not one of the `defined_patterns`.
+        """
+        resolved = self.resolved_names.get(self._pattern)
+        if resolved is None:
+            cls_name = datatype.get_class_name(self)
+            raise ValueError(f"{self._pattern!r} is not a defined pattern of {cls_name}")
+        return resolved
+
     @property
     def pattern(self):
         """
@@ -355,24 +742,28 @@ class TranslatedPattern(RuntimeException):
         Notes
         -----
         - Assumes `defined_patterns` and `ref_names` are aligned lists.
-        - Falls back gracefully if `lessen_name` is not present in `ref_names`.
         """
-        if self.defined_patterns and self.ref_names:
-            lessen_name = self.lessen_name
-            idx = self.ref_names.index(lessen_name)
-            lessen_pat = self.defined_patterns[idx]
+        if self.resolved_names:
+            _, _, lessen_pat = self.get_resolved_names()
             return lessen_pat
         else:
             return self.pattern
 
     @property
     def root_pattern(self):
-        tbl = dict(
-            non_whitespace=PATTERN.NON_WHITESPACE,
-            non_whitespaces=PATTERN.NON_WHITESPACES,
-            non_whitespaces_or_group=PATTERN.NON_WHITESPACES_OR_GROUP
+        """
+        Resolve the root (broadest) pattern of the current instance.
+
+        Returns
+        -------
+        str
+            The registered pattern of `root_name`, or
+            `PATTERN.NON_WHITESPACES_OR_GROUP` when `root_name` is not
+            registered.
+        """
+        root_pattern = PATTERN_REGISTRY.get_pattern(
+            self.root_name, PATTERN.NON_WHITESPACES_OR_GROUP
         )
-        root_pattern = tbl.get(self.root_name, PATTERN.NON_WHITESPACES_OR_GROUP)
         return root_pattern
 
     def process(self):
@@ -420,16 +811,16 @@ class TranslatedPattern(RuntimeException):
         """
         Check whether all number entries match the given regex pattern.
 
-        This method appends a trailing `$` to the provided pattern to ensure
-        matches occur at the end of each string. It then evaluates every entry
-        in `lst_of_all_data` using `re.match`. The result is True only if all
+        The pattern is resolved through `PATTERN_REGISTRY`, which keeps a
+        precompiled copy of it, and every entry in `lst_of_all_data` is
+        evaluated with ``fullmatch``. The result is True only if all
         entries match the pattern.
 
         Parameters
         ----------
         pattern : str
-            The regex pattern to test against each number entry. A trailing `$`
-            is automatically appended to enforce end-of-string matching.
+            The regex pattern to test against each number entry. The
+            whole entry must match the pattern.
 
         Returns
         -------
@@ -437,8 +828,8 @@ class TranslatedPattern(RuntimeException):
             True if all entries in `lst_of_all_data` match the pattern,
             False otherwise.
         """
-        pat = f"{pattern}$"
-        is_matched = all(re.match(pat, data) for data in self.lst_of_all_data)
+        matcher = PATTERN_REGISTRY.get_matcher(pattern)
+        is_matched = all(matcher(data) for data in self.lst_of_all_data)
         return is_matched
 
     def is_digit(self) -> bool:
@@ -1133,7 +1524,7 @@ class TranslatedPattern(RuntimeException):
         return f"{self.actual_name}(value={value})"
 
     def get_regex_pattern(self, var: str = "", is_lessen: bool = False,
-                          is_root: bool = False) -> str:
+                          is_root: bool = False, is_safe: bool = False) -> str:
         """
         Generate a regex pattern string for the current instance.
 
@@ -1155,6 +1546,9 @@ class TranslatedPattern(RuntimeException):
         is_root : bool, optional
             If True, use `root_pattern` instead of `pattern`.
             Defaults to False.
+        is_safe : bool, optional
+            If True, rewrite the pattern with `make_safe_pattern` so it
+            cannot backtrack catastrophically. Defaults to False.
 
         Returns
         -------
@@ -1176,6 +1570,9 @@ class TranslatedPattern(RuntimeException):
         pattern = self.lessen_pattern if is_lessen else self.pattern
         pattern = self.root_pattern if is_root else pattern
 
+        if is_safe:
+            pattern = make_safe_pattern(pattern)
+
         if var:
             pattern = f"(?P<{var}>{pattern})"
 
@@ -1234,10 +1631,13 @@ class TranslatedPattern(RuntimeException):
 
         This method attempts to construct an instance of one of several
         `TranslatedPattern` subclasses using the provided `number` and
-        optional arguments. It iterates through a predefined list of
-        candidate classes and returns the first successfully created
-        instance. If no suitable class can handle the input, a runtime
-        error is raised.
+        optional arguments. The inputs are profiled once by
+        `get_candidate_classes`, which discards every class of
+        `FACTORY_CLASSES` that cannot match, and the remaining candidates
+        are tried in order. The first successfully created instance is
+        returned. If no suitable class can handle the input, a runtime
+        error is raised. When `FACTORY_CACHE` is enabled, results are
+        reused for repeated inputs.
 
         Parameters
         ----------
@@ -1258,53 +1658,109 @@ class TranslatedPattern(RuntimeException):
             If no subclass can handle the given input, a runtime error
             is raised with the identifier "FactoryTranslatedPatternRTIssue".
         """
-        classes = [
-            TranslatedDigitPattern,
-            TranslatedDigitsPattern,
+        node = cls.try_create(data, *other)
+        if node is NOT_CREATED:
+            RuntimeException.do_raise_runtime_error(    # noqa
+                obj="FactoryTranslatedPatternRTIssue",
+                msg=f"Factory could not create a pattern for number={data!r}, other={other!r}",
+            )
+        return node
 
-            TranslatedNumberPattern,
+    @classmethod
+    def try_create(cls, data: str, *other):
+        """
+        Non-raising counterpart of `do_factory_create`.
 
-            TranslatedLetterPattern,
-            TranslatedLettersPattern,
+        Parameters
+        ----------
+        data : str
+            The primary input data used to initialize the pattern.
+        *other : other arguments
+            Additional arguments passed to the candidate class constructors.
 
-            TranslatedAlphabetNumericPattern,
-            TranslatedWordPattern,
+        Returns
+        -------
+        TranslatedPattern or NotCreated
+            An instance of the first matching subclass, or the `NOT_CREATED`
+            sentinel if no subclass can handle the input.
+        """
+        key = ("do_factory_create", (data, *other))
+        node = FACTORY_CACHE.get(key)
+        if node is not None:
+            return node
 
-            TranslatedPunctPattern,
-            TranslatedPunctsPattern,
-            TranslatedPunctsGroupPattern,
+        for class_ in get_candidate_classes(data, *other):
+            node = class_(data, *other)
+            if node:
+                FACTORY_CACHE.put(key, node)
+                return node
+        return NOT_CREATED
 
-            TranslatedGraphPattern,
+    @classmethod
+    def classify_many(cls, groups):
+        """
+        Create translated pattern instances for many token groups at once.
 
-            TranslatedMixedNumberPattern,
-            TranslatedMixedWordPattern,
+        This batch counterpart of `do_factory_create` is meant for whole
+        table columns or token streams. Repeated values inside a group are
+        collapsed (first-seen order is kept, which does not change the
+        resulting pattern), every distinct token is profiled once across
+        all groups, and every distinct group is classified once.
 
-            TranslatedWordsPattern,
+        Parameters
+        ----------
+        groups : iterable
+            Token groups. A group is either a single token string or an
+            iterable of token strings that must share the same pattern.
 
-            TranslatedMixedWordsPattern,
+        Returns
+        -------
+        list of TranslatedPattern or inherited of TranslatedPattern
+            One instance per input group, in input order. Equal groups
+            share the same instance.
 
-            TranslatedNonWhitespacePattern,
-            TranslatedNonWhitespacesPattern,
-            TranslatedNonWhitespacesGroupPattern,
-        ]
-        for class_ in classes:
-            node = class_(data, *other)
-            if node:
-                return node
-        RuntimeException.do_raise_runtime_error(    # noqa
-            obj="FactoryTranslatedPatternRTIssue",
-            msg=f"Factory could not create a pattern for number={data!r}, other={other!r}",
-        )
+        Raises
+        ------
+        RuntimeError
+            If a group cannot be classified, a runtime error is raised
+            with the identifier "FactoryTranslatedPatternRTIssue".
+        """
+        candidates_by_token = dict()
+        nodes = dict()
+        result = []
+        for group in groups:
+            tokens = (group,) if isinstance(group, str) else tuple(group)
+            tokens = tuple(dict.fromkeys(tokens))
+            node = nodes.get(tokens)
+            if node is None:
+                key = ("do_factory_create", tokens)
+                node = FACTORY_CACHE.get(key)
+            if node is None:
+                candidates = get_candidate_classes(*tokens, memo=candidates_by_token) if tokens else []
+                for class_ in candidates:
+                    node = class_(*tokens)
+                    if node:
+                        FACTORY_CACHE.put(key, node)
+                        break
+                else:
+                    RuntimeException.do_raise_runtime_error(  # noqa
+                        obj="FactoryTranslatedPatternRTIssue",
+                        msg=f"Factory could not create a pattern for group={group!r}",
+                    )
+            nodes[tokens] = node
+            result.append(node)
+        return result
 
     @classmethod
     def recommend_pattern(cls, translated_pat_obj1, translated_pat_obj2):
         """
         Recommend a generalized pattern from two translated pattern objects.
 
-        This factory-style method delegates to the `recommend` method of
-        `translated_pat_obj1`, passing `translated_pat_obj2` as the argument.
-        It returns the generalized pattern produced by the recommendation
-        logic defined in the first object.
+        This factory-style method looks up the class pair of the two
+        objects in `RECOMMEND_TABLE`, a precomputed join table of the
+        `recommend` logic, and builds the generalized pattern it records.
+        The result is the same as calling ``translated_pat_obj1.recommend(
+        translated_pat_obj2)``.
 
         Parameters
         ----------
@@ -1320,9 +1776,29 @@ class TranslatedPattern(RuntimeException):
             A generalized translated pattern instance recommended based
             on the relationship between the two input objects.
         """
-        generalized_pat = translated_pat_obj1.recommend(translated_pat_obj2)
+        generalized_pat = RECOMMEND_TABLE.recommend(translated_pat_obj1, translated_pat_obj2)
         return generalized_pat
 
+    @classmethod
+    def try_recommend_pattern(cls, translated_pat_obj1, translated_pat_obj2):
+        """
+        Non-raising counterpart of `recommend_pattern`.
+
+        Parameters
+        ----------
+        translated_pat_obj1 : Instance of TranslatedPattern or inherited of TranslatedPattern
+            The primary translated pattern object.
+        translated_pat_obj2 : Instance of TranslatedPattern or inherited of TranslatedPattern
+            The secondary translated pattern object to be compared against.
+
+        Returns
+        -------
+        TranslatedPattern or NotCreated
+            The recommended pattern, or the `NOT_CREATED` sentinel if no
+            recommendation is implemented for the two objects.
+        """
+        return RECOMMEND_TABLE.try_recommend(translated_pat_obj1, translated_pat_obj2)
+
     @classmethod
     def recommend_pattern_using_data(cls, data1: str, data2: str):
         """
@@ -1330,10 +1806,12 @@ class TranslatedPattern(RuntimeException):
 
         This factory-style method first creates translated pattern
         objects from the provided input number using `do_factory_create`.
-        It then delegates to the `recommend` method of the first
-        translated pattern object, passing the second as the argument.
+        It then looks up the recommendation of the two objects in
+        `RECOMMEND_TABLE`, which gives the same result as the `recommend`
+        method of the first object.
         The result is a generalized pattern instance based on the
-        relationship between the two inputs.
+        relationship between the two inputs. When `FACTORY_CACHE` is
+        enabled, the result is reused for a repeated pair of inputs.
 
         Parameters
         ----------
@@ -1348,9 +1826,16 @@ class TranslatedPattern(RuntimeException):
             A generalized translated pattern instance recommended based
             on the relationship between the two input number values.
         """
+        key = ("recommend_pattern_using_data", (data1, data2))
+        generalized_pat = FACTORY_CACHE.get(key)
+        if generalized_pat is not None:
+            return generalized_pat
+
         translated_pat_obj1 = cls.do_factory_create(data1)
         translated_pat_obj2 = cls.do_factory_create(data2)
-        return translated_pat_obj1.recommend(translated_pat_obj2)
+        generalized_pat = RECOMMEND_TABLE.recommend(translated_pat_obj1, translated_pat_obj2)
+        FACTORY_CACHE.put(key, generalized_pat)
+        return generalized_pat
 
 
 class TranslatedDigitPattern(TranslatedPattern):
@@ -1378,14 +1863,10 @@ class TranslatedDigitPattern(TranslatedPattern):
     root_name : str
         The root category name for this pattern ("non_whitespace").
     """
-    def __init__(self, data, *other):
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.DIGIT,
-            defined_pattern=PATTERN.DIGIT,
-            root_name="non_whitespace",
-        )
+    __slots__ = ()
+    name = TEXT.DIGIT
+    defined_pattern = PATTERN.DIGIT
+    root_name = "non_whitespace"
 
     def is_subset_of(self, other):
         """
@@ -1531,14 +2012,10 @@ class TranslatedDigitsPattern(TranslatedPattern):
     root_name : str
         The root category name for this pattern ("non_whitespace").
     """
-    def __init__(self, data, *other):
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.DIGITS,
-            defined_pattern=PATTERN.DIGITS,
-            root_name='non_whitespaces'
-        )
+    __slots__ = ()
+    name = TEXT.DIGITS
+    defined_pattern = PATTERN.DIGITS
+    root_name = 'non_whitespaces'
 
     def is_subset_of(self, other):
         """
@@ -1686,14 +2163,10 @@ class TranslatedNumberPattern(TranslatedPattern):
     root_name : str
         Root category name for this pattern ("non_whitespaces").
     """
-    def __init__(self, data, *other):
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.NUMBER,
-            defined_pattern=PATTERN.NUMBER,
-            root_name='non_whitespaces'
-        )
+    __slots__ = ()
+    name = TEXT.NUMBER
+    defined_pattern = PATTERN.NUMBER
+    root_name = 'non_whitespaces'
 
     def is_subset_of(self, other) -> bool:
         """
@@ -1832,14 +2305,10 @@ class TranslatedMixedNumberPattern(TranslatedPattern):
     root_name : str
         Root category name for this pattern ("non_whitespaces").
     """
-    def __init__(self, data, *other):
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.MIXED_NUMBER,
-            defined_pattern=PATTERN.MIXED_NUMBER,
-            root_name="non_whitespaces",
-        )
+    __slots__ = ()
+    name = TEXT.MIXED_NUMBER
+    defined_pattern = PATTERN.MIXED_NUMBER
+    root_name = "non_whitespaces"
 
     def is_subset_of(self, other):
         """
@@ -1980,14 +2449,10 @@ class TranslatedLetterPattern(TranslatedPattern):
         Root category name for this pattern ("non_whitespace").
     """
 
-    def __init__(self, data: str, *other: object) -> None:
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.LETTER,
-            defined_pattern=PATTERN.LETTER,
-            root_name="non_whitespace",
-        )
+    __slots__ = ()
+    name = TEXT.LETTER
+    defined_pattern = PATTERN.LETTER
+    root_name = "non_whitespace"
 
     def is_subset_of(self, other):
         """
@@ -2129,14 +2594,10 @@ class TranslatedLettersPattern(TranslatedPattern):
         Root category name for this pattern ("non_whitespaces").
     """
 
-    def __init__(self, data: str, *other: object) -> None:
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.LETTERS,
-            defined_pattern=PATTERN.LETTERS,
-            root_name="non_whitespaces",
-        )
+    __slots__ = ()
+    name = TEXT.LETTERS
+    defined_pattern = PATTERN.LETTERS
+    root_name = "non_whitespaces"
 
     def is_subset_of(self, other) -> bool:
         """
@@ -2275,14 +2736,10 @@ class TranslatedAlphabetNumericPattern(TranslatedPattern):
         Root category name for this pattern ("non_whitespace").
     """
 
-    def __init__(self, data: str, *other: object) -> None:
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.ALPHABET_NUMERIC,
-            defined_pattern=PATTERN.ALPHABET_NUMERIC,
-            root_name="non_whitespace",
-        )
+    __slots__ = ()
+    name = TEXT.ALPHABET_NUMERIC
+    defined_pattern = PATTERN.ALPHABET_NUMERIC
+    root_name = "non_whitespace"
 
     def is_subset_of(self, other) -> bool:
         """
@@ -2428,14 +2885,10 @@ class TranslatedPunctPattern(TranslatedPattern):
         Root category name for this pattern ("non_whitespace").
     """
 
-    def __init__(self, data: str, *other: object) -> None:
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.PUNCT,
-            defined_pattern=PATTERN.PUNCT,
-            root_name="non_whitespace",
-        )
+    __slots__ = ()
+    name = TEXT.PUNCT
+    defined_pattern = PATTERN.PUNCT
+    root_name = "non_whitespace"
 
     def is_subset_of(self, other) -> bool:
         """
@@ -2570,14 +3023,10 @@ class TranslatedPunctsPattern(TranslatedPattern):
         Root category name for this pattern ("non_whitespaces").
     """
 
-    def __init__(self, data: str, *other: object) -> None:
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.PUNCTS,
-            defined_pattern=PATTERN.PUNCTS,
-            root_name="non_whitespaces",
-        )
+    __slots__ = ()
+    name = TEXT.PUNCTS
+    defined_pattern = PATTERN.PUNCTS
+    root_name = "non_whitespaces"
 
     def is_subset_of(self, other) -> bool:
         """
@@ -2726,29 +3175,23 @@ class TranslatedPunctsGroupPattern(TranslatedPattern):
         Root category name for this pattern ("non_whitespaces_or_group").
     """
 
-    def __init__(self, data: str, *other: object) -> None:
-        defined_patterns = [
-            PATTERN.PUNCTS_OR_PHRASE,
-            PATTERN.PUNCTS_OR_GROUP,
-            PATTERN.PUNCTS_PHRASE,
-            PATTERN.PUNCTS_GROUP,
-        ]
-        ref_names = [
-            "puncts_or_phrase",
-            "puncts_or_group",
-            "puncts_phrase",
-            "puncts_group",
-        ]
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.PUNCTS_GROUP,
-            defined_patterns=defined_patterns,
-            ref_names=ref_names,
-            singular_name="puncts",
-            singular_pattern=PATTERN.PUNCTS,
-            root_name="non_whitespaces_or_group",
-        )
+    __slots__ = ()
+    name = TEXT.PUNCTS_GROUP
+    defined_patterns = (
+        PATTERN.PUNCTS_OR_PHRASE,
+        PATTERN.PUNCTS_OR_GROUP,
+        PATTERN.PUNCTS_PHRASE,
+        PATTERN.PUNCTS_GROUP,
+    )
+    ref_names = (
+        "puncts_or_phrase",
+        "puncts_or_group",
+        "puncts_phrase",
+        "puncts_group",
+    )
+    singular_name = "puncts"
+    singular_pattern = PATTERN.PUNCTS
+    root_name = "non_whitespaces_or_group"
 
     def is_subset_of(self, other) -> bool:
         """
@@ -2891,14 +3334,10 @@ class TranslatedGraphPattern(TranslatedPattern):
         Root category name for this pattern ("non_whitespace").
     """
 
-    def __init__(self, data: str, *other: object) -> None:
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.GRAPH,
-            defined_pattern=PATTERN.GRAPH,
-            root_name="non_whitespace",
-        )
+    __slots__ = ()
+    name = TEXT.GRAPH
+    defined_pattern = PATTERN.GRAPH
+    root_name = "non_whitespace"
 
     def is_subset_of(self, other) -> bool:
         """
@@ -3035,14 +3474,10 @@ class TranslatedWordPattern(TranslatedPattern):
         Root category name for this pattern ("non_whitespaces").
     """
 
-    def __init__(self, data: str, *other: object) -> None:
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.WORD,
-            defined_pattern=PATTERN.WORD,
-            root_name="non_whitespaces",
-        )
+    __slots__ = ()
+    name = TEXT.WORD
+    defined_pattern = PATTERN.WORD
+    root_name = "non_whitespaces"
 
     def is_subset_of(self, other) -> bool:
         """
@@ -3194,25 +3629,23 @@ class TranslatedWordsPattern(TranslatedPattern):
         Root category name for this pattern ("non_whitespaces_or_group").
     """
 
-    def __init__(self, data: str, *other: object) -> None:
-        defined_patterns = [
-            PATTERN.WORDS,
-            PATTERN.WORD_OR_GROUP,
-            PATTERN.PHRASE,
-            PATTERN.WORD_GROUP,
-        ]
-        ref_names = ["words", "word_or_group", "phrase", "word_group"]
-
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.WORDS,
-            defined_patterns=defined_patterns,
-            ref_names=ref_names,
-            singular_name="word",
-            singular_pattern=PATTERN.WORD,
-            root_name="non_whitespaces_or_group",
-        )
+    __slots__ = ()
+    name = TEXT.WORDS
+    defined_patterns = (
+        PATTERN.WORDS,
+        PATTERN.WORD_OR_GROUP,
+        PATTERN.PHRASE,
+        PATTERN.WORD_GROUP,
+    )
+    ref_names = (
+        "words",
+        "word_or_group",
+        "phrase",
+        "word_group",
+    )
+    singular_name = "word"
+    singular_pattern = PATTERN.WORD
+    root_name = "non_whitespaces_or_group"
 
     def is_subset_of(self, other) -> bool:
         """
@@ -3355,14 +3788,10 @@ class TranslatedMixedWordPattern(TranslatedPattern):
         Root category name for this pattern ("non_whitespaces").
     """
 
-    def __init__(self, data: str, *other: object) -> None:
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.MIXED_WORD,
-            defined_pattern=PATTERN.MIXED_WORD,
-            root_name="non_whitespaces",
-        )
+    __slots__ = ()
+    name = TEXT.MIXED_WORD
+    defined_pattern = PATTERN.MIXED_WORD
+    root_name = "non_whitespaces"
 
     def is_subset_of(self, other) -> bool:
         """
@@ -3514,30 +3943,23 @@ class TranslatedMixedWordsPattern(TranslatedPattern):
         Root category name for this pattern ("non_whitespaces_or_group").
     """
 
-    def __init__(self, data: str, *other: object) -> None:
-        defined_patterns = [
-            PATTERN.MIXED_WORDS,
-            PATTERN.MIXED_WORD_OR_GROUP,
-            PATTERN.MIXED_PHRASE,
-            PATTERN.MIXED_WORD_GROUP,
-        ]
-        ref_names = [
-            "mixed_words",
-            "mixed_word_or_group",
-            "mixed_phrase",
-            "mixed_word_group"
-        ]
-
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.MIXED_WORDS,
-            defined_patterns=defined_patterns,
-            ref_names=ref_names,
-            singular_name="mixed_word",
-            singular_pattern=PATTERN.MIXED_WORD,
-            root_name="non_whitespaces_or_group",
-        )
+    __slots__ = ()
+    name = TEXT.MIXED_WORDS
+    defined_patterns = (
+        PATTERN.MIXED_WORDS,
+        PATTERN.MIXED_WORD_OR_GROUP,
+        PATTERN.MIXED_PHRASE,
+        PATTERN.MIXED_WORD_GROUP,
+    )
+    ref_names = (
+        "mixed_words",
+        "mixed_word_or_group",
+        "mixed_phrase",
+        "mixed_word_group",
+    )
+    singular_name = "mixed_word"
+    singular_pattern = PATTERN.MIXED_WORD
+    root_name = "non_whitespaces_or_group"
 
     def is_subset_of(self, other) -> bool:
         """
@@ -3679,14 +4101,10 @@ class TranslatedNonWhitespacePattern(TranslatedPattern):
         Root category name for this pattern ("non_whitespace").
     """
 
-    def __init__(self, data: str, *other: object) -> None:
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.NON_WHITESPACE,
-            defined_pattern=PATTERN.NON_WHITESPACE,
-            root_name="non_whitespace",
-        )
+    __slots__ = ()
+    name = TEXT.NON_WHITESPACE
+    defined_pattern = PATTERN.NON_WHITESPACE
+    root_name = "non_whitespace"
 
     def is_subset_of(self, other) -> bool:
         """
@@ -3832,14 +4250,10 @@ class TranslatedNonWhitespacesPattern(TranslatedPattern):
         Root category name for this pattern ("non_whitespaces").
     """
 
-    def __init__(self, data: str, *other: object) -> None:
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.NON_WHITESPACES,
-            defined_pattern=PATTERN.NON_WHITESPACES,
-            root_name="non_whitespaces",
-        )
+    __slots__ = ()
+    name = TEXT.NON_WHITESPACES
+    defined_pattern = PATTERN.NON_WHITESPACES
+    root_name = "non_whitespaces"
 
     def is_subset_of(self, other) -> bool:
         """
@@ -3988,30 +4402,23 @@ class TranslatedNonWhitespacesGroupPattern(TranslatedPattern):
         Root category name for this pattern ("non_whitespaces_or_group").
     """
 
-    def __init__(self, data: str, *other: object) -> None:
-        defined_patterns = [
-            PATTERN.NON_WHITESPACES_OR_PHRASE,
-            PATTERN.NON_WHITESPACES_OR_GROUP,
-            PATTERN.NON_WHITESPACES_PHRASE,
-            PATTERN.NON_WHITESPACES_GROUP,
-        ]
-        ref_names = [
-            "non_whitespaces_or_phrase",
-            "non_whitespaces_or_group",
-            "non_whitespaces_phrase",
-            "non_whitespaces_group",
-        ]
-
-        super().__init__(
-            data,
-            *other,
-            name=TEXT.NON_WHITESPACES_GROUP,
-            defined_patterns=defined_patterns,
-            ref_names=ref_names,
-            singular_name="non_whitespaces",
-            singular_pattern=PATTERN.NON_WHITESPACES,
-            root_name="non_whitespaces_or_group",
-        )
+    __slots__ = ()
+    name = TEXT.NON_WHITESPACES_GROUP
+    defined_patterns = (
+        PATTERN.NON_WHITESPACES_OR_PHRASE,
+        PATTERN.NON_WHITESPACES_OR_GROUP,
+        PATTERN.NON_WHITESPACES_PHRASE,
+        PATTERN.NON_WHITESPACES_GROUP,
+    )
+    ref_names = (
+        "non_whitespaces_or_phrase",
+        "non_whitespaces_or_group",
+        "non_whitespaces_phrase",
+        "non_whitespaces_group",
+    )
+    singular_name = "non_whitespaces"
+    singular_pattern = PATTERN.NON_WHITESPACES
+    root_name = "non_whitespaces_or_group"
 
     def is_subset_of(self, other) -> bool:
         """
@@ -4118,3 +4525,513 @@ class TranslatedNonWhitespacesGroupPattern(TranslatedPattern):
             return self.get_new_superset(other)
 
         return self.raise_recommend_exception(other)
+
+
+# Candidate classes tried by `TranslatedPattern.do_factory_create`,
+# ordered from the most specific to the most general pattern.
+FACTORY_CLASSES = (
+    TranslatedDigitPattern,
+    TranslatedDigitsPattern,
+
+    TranslatedNumberPattern,
+
+    TranslatedLetterPattern,
+    TranslatedLettersPattern,
+
+    TranslatedAlphabetNumericPattern,
+    TranslatedWordPattern,
+
+    TranslatedPunctPattern,
+    TranslatedPunctsPattern,
+    TranslatedPunctsGroupPattern,
+
+    TranslatedGraphPattern,
+
+    TranslatedMixedNumberPattern,
+    TranslatedMixedWordPattern,
+
+    TranslatedWordsPattern,
+
+    TranslatedMixedWordsPattern,
+
+    TranslatedNonWhitespacePattern,
+    TranslatedNonWhitespacesPattern,
+    TranslatedNonWhitespacesGroupPattern,
+)
+
+
+class TokenProfile:
+    """
+    Character-class profile of a token used to pre-select factory candidates.
+
+    A token is scanned once and summarized as a bit mask of the character
+    kinds it contains (ASCII digits, Unicode digits, ASCII letters, the
+    punctuation used by mixed numbers, other ASCII punctuation, spaces,
+    other whitespace and any remaining character). Each class in
+    `FACTORY_CLASSES` has a necessary condition expressed over that mask;
+    a class whose condition fails cannot match the token, so it does not
+    need to be constructed.
+
+    Notes
+    -----
+    - The conditions are necessary, not sufficient. Candidates are still
+      verified by constructing them, which keeps the factory result
+      identical to trying every class in order.
+    """
+    ASCII_DIGIT = 1
+    UNICODE_DIGIT = 2
+    LETTER = 4
+    DOT = 8
+    NUMBER_PUNCT = 16
+    PUNCT = 32
+    SPACE = 64
+    WHITESPACE = 128
+    OTHER = 256
+
+    DIGITS = ASCII_DIGIT | UNICODE_DIGIT
+    ALPHA_NUMERIC = LETTER | ASCII_DIGIT
+    PUNCTS = DOT | NUMBER_PUNCT | PUNCT
+    GRAPH = ALPHA_NUMERIC | PUNCTS
+    NON_WHITESPACES = GRAPH | UNICODE_DIGIT | OTHER
+
+    # punctuation allowed by PATTERN.MIXED_NUMBER other than the dot
+    number_puncts = frozenset("+([$-,:/])%")
+    letters = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
+    ascii_digits = frozenset("0123456789")
+
+    def __init__(self, token):
+        token = str(token)
+        self.size = len(token)
+        self.is_letter_first = self.size > 0 and token[0] in self.letters
+        self.mask = 0
+        for char in set(token):
+            self.mask |= self.get_char_kind(char)
+
+    @classmethod
+    def get_char_kind(cls, char):
+        """
+        Return the character-kind bit for a single character.
+
+        Parameters
+        ----------
+        char : str
+            A single character.
+
+        Returns
+        -------
+        int
+            One of the kind bits defined on `TokenProfile`.
+        """
+        if char in cls.ascii_digits:
+            return cls.ASCII_DIGIT
+        if char in cls.letters:
+            return cls.LETTER
+        if char == ".":
+            return cls.DOT
+        if char in cls.number_puncts:
+            return cls.NUMBER_PUNCT
+        if "\x21" <= char <= "\x7e":
+            return cls.PUNCT
+        if char == " ":
+            return cls.SPACE
+        if char.isspace():
+            return cls.WHITESPACE
+        if char.isdecimal():
+            return cls.UNICODE_DIGIT
+        return cls.OTHER
+
+    def has_only(self, kinds):
+        """Return True if the token holds no character outside `kinds`."""
+        return self.mask != 0 and self.mask & ~kinds == 0
+
+    def has_any(self, kinds):
+        """Return True if the token holds at least one character of `kinds`."""
+        return self.mask & kinds != 0
+
+    def get_candidates(self):
+        """
+        Evaluate the necessary condition of every class in `FACTORY_CLASSES`.
+
+        Returns
+        -------
+        frozenset of type
+            Classes the token could match. A class outside this set can
+            never match the token.
+        """
+        is_single = self.size == 1
+        is_letter_first = self.is_letter_first
+        has_only, has_any = self.has_only, self.has_any
+        digits, alpha_numeric = self.DIGITS, self.ALPHA_NUMERIC
+        puncts, graph = self.PUNCTS, self.GRAPH
+        non_whitespaces, space = self.NON_WHITESPACES, self.SPACE
+
+        conditions = [
+            (TranslatedDigitPattern, is_single and has_only(digits)),
+            (TranslatedDigitsPattern, has_only(digits)),
+            (TranslatedNumberPattern,
+             has_only(digits | self.DOT) and has_any(digits)),
+            (TranslatedLetterPattern, is_single and has_only(self.LETTER)),
+            (TranslatedLettersPattern, has_only(self.LETTER)),
+            (TranslatedAlphabetNumericPattern,
+             is_single and has_only(alpha_numeric)),
+            (TranslatedWordPattern,
+             is_letter_first and has_only(alpha_numeric)),
+            (TranslatedPunctPattern, is_single and has_only(puncts)),
+            (TranslatedPunctsPattern, has_only(puncts)),
+            (TranslatedPunctsGroupPattern,
+             has_only(puncts | space) and has_any(puncts)),
+            (TranslatedGraphPattern, is_single and has_only(graph)),
+            (TranslatedMixedNumberPattern,
+             has_only(digits | self.LETTER | self.DOT | self.NUMBER_PUNCT)
+             and has_any(digits)),
+            (TranslatedMixedWordPattern,
+             has_only(graph) and has_any(alpha_numeric)),
+            (TranslatedWordsPattern,
+             is_letter_first and has_only(alpha_numeric | space)),
+            (TranslatedMixedWordsPattern,
+             has_only(graph | space) and has_any(alpha_numeric)),
+            (TranslatedNonWhitespacePattern,
+             is_single and has_only(non_whitespaces)),
+            (TranslatedNonWhitespacesPattern, has_only(non_whitespaces)),
+            (TranslatedNonWhitespacesGroupPattern,
+             has_only(non_whitespaces | space) and has_any(non_whitespaces)),
+        ]
+        return frozenset(class_ for class_, is_candidate in conditions if is_candidate)
+
+
+def get_candidate_classes(data, *other, memo=None):
+    """
+    Select the factory classes that can possibly match every token.
+
+    Each token is profiled once with `TokenProfile`; a class is kept only
+    if its necessary condition holds for all tokens. The relative order
+    of `FACTORY_CLASSES` is preserved.
+
+    Parameters
+    ----------
+    data : str
+        The primary token.
+    *other : str
+        Additional tokens that must share the same pattern.
+    memo : dict, optional
+        Mapping of token to its candidate set. When provided, it is
+        consulted and updated so that repeated tokens are profiled once.
+
+    Returns
+    -------
+    list of type
+        Candidate classes, most specific first.
+    """
+    memo = dict() if memo is None else memo
+    candidates = None
+    for token in (data, *other):
+        token_candidates = memo.get(token)
+        if token_candidates is None:
+            token_candidates = TokenProfile(token).get_candidates()
+            memo[token] = token_candidates
+        candidates = token_candidates if candidates is None else candidates & token_candidates
+        if not candidates:
+            break
+    return [class_ for class_ in FACTORY_CLASSES if class_ in candidates]
+
+
+class RecommendTable:
+    """
+    Precomputed join table of `recommend` outcomes keyed by class pair.
+
+    The relationship between the classes of `FACTORY_CLASSES` is static:
+    which branch of `recommend` applies only depends on the classes of the
+    two operands, never on their data. The table evaluates every class
+    pair once, on representative instances, and records how the
+    recommendation is built:
+
+    - ``"subset"``: a new instance of the other operand's class
+      (`get_new_subset`),
+    - ``"superset"``: a new instance of the first operand's class
+      (`get_new_superset`),
+    - ``"join"``: a new instance of a broader class built from the data
+      of the first operand, or of both operands,
+    - ``"unsupported"``: no recommendation is implemented.
+
+    A recommendation then becomes a table lookup followed by a single
+    construction, whose `process` call verifies the data.
+
+    Notes
+    -----
+    - The table is built lazily on first use.
+    - Operands whose classes are not in `FACTORY_CLASSES` (e.g. custom
+      subclasses) fall back to calling `recommend` directly.
+    """
+    representative_data = {
+        TranslatedDigitPattern: ("1",),
+        TranslatedDigitsPattern: ("12",),
+        TranslatedNumberPattern: ("1.5",),
+        TranslatedLetterPattern: ("a",),
+        TranslatedLettersPattern: ("ab",),
+        TranslatedAlphabetNumericPattern: ("a", "1"),
+        TranslatedWordPattern: ("a1",),
+        TranslatedPunctPattern: ("-",),
+        TranslatedPunctsPattern: ("--",),
+        TranslatedPunctsGroupPattern: ("- -",),
+        TranslatedGraphPattern: ("a", "-"),
+        TranslatedMixedNumberPattern: ("-1",),
+        TranslatedMixedWordPattern: ("a-1",),
+        TranslatedWordsPattern: ("ab cd",),
+        TranslatedMixedWordsPattern: ("a-1 b",),
+        TranslatedNonWhitespacePattern: ("\u00e9",),
+        TranslatedNonWhitespacesPattern: ("\u00e9\u00e9",),
+        TranslatedNonWhitespacesGroupPattern: ("\u00e9 \u00e9",),
+    }
+
+    def __init__(self):
+        self._entries = None
+        self._related = None
+        self._lock = threading.Lock()
+
+    @property
+    def entries(self):
+        """Return the join table, building it on first access."""
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    self.build()
+        return self._entries
+
+    def build(self):
+        """Evaluate `recommend` once for every pair of factory classes."""
+        nodes = {
+            class_: class_(*data) for class_, data in self.representative_data.items()
+        }
+        entries, related = dict(), dict()
+        for class1, node1 in nodes.items():
+            for class2, node2 in nodes.items():
+                key = (class1, class2)
+                is_subset = node1.is_subset_of(node2)
+                is_superset = node1.is_superset_of(node2)
+                related[key] = is_subset or is_superset
+                if is_subset:
+                    entries[key] = ("subset", class2, NUMBER.TWO)
+                    continue
+                if is_superset:
+                    entries[key] = ("superset", class1, NUMBER.TWO)
+                    continue
+                try:
+                    node = node1.recommend(node2)
+                except Exception:   # noqa
+                    entries[key] = ("unsupported", None, NUMBER.ZERO)
+                    continue
+                entries[key] = ("join", type(node), len(node.lst_of_all_data))
+        self._related = related
+        self._entries = entries
+
+    def get_entry(self, class1, class2):
+        """
+        Return the table entry of a class pair.
+
+        Parameters
+        ----------
+        class1 : type
+            Class of the first operand.
+        class2 : type
+            Class of the second operand.
+
+        Returns
+        -------
+        tuple or None
+            ``(mode, result_class, data_count)``, or None when the pair is
+            not covered by the table.
+        """
+        return self.entries.get((class1, class2))
+
+    def get_reference_data(self, node, other):
+        """Table-backed equivalent of `TranslatedPattern.get_reference_data`."""
+        if self._related[(type(node), type(other))]:
+            return other.data
+        if node.is_plural() and other.is_plural():
+            return node.data
+        return node.get_singular_data()
+
+    def recommend(self, node, other):
+        """
+        Recommend a generalized pattern for two translated pattern objects.
+
+        Parameters
+        ----------
+        node : TranslatedPattern
+            The primary translated pattern object.
+        other : TranslatedPattern
+            The secondary translated pattern object.
+
+        Returns
+        -------
+        TranslatedPattern
+            The same result as ``node.recommend(other)``.
+
+        Raises
+        ------
+        RuntimeError
+            If no recommendation is implemented for the class pair.
+        """
+        if not isinstance(other, TranslatedPattern):
+            return node.recommend(other)
+
+        entry = self.get_entry(type(node), type(other))
+        if entry is None:
+            return node.recommend(other)
+
+        mode, class_, data_count = entry
+        if mode == "subset":
+            return class_(other.data, self.get_reference_data(other, node))
+        if mode == "superset":
+            return class_(node.data, self.get_reference_data(node, other))
+        if mode == "join":
+            data = (node.data, other.data)[:data_count]
+            return class_(*data)
+        return node.raise_recommend_exception(other)
+
+    def try_recommend(self, node, other):
+        """
+        Non-raising counterpart of `recommend`.
+
+        Returns
+        -------
+        TranslatedPattern or NotCreated
+            The same result as ``node.recommend(other)``, or the
+            `NOT_CREATED` sentinel when the class pair is unsupported.
+        """
+        if isinstance(other, TranslatedPattern):
+            entry = self.get_entry(type(node), type(other))
+            if entry is not None and entry[NUMBER.ZERO] == "unsupported":
+                return NOT_CREATED
+        try:
+            return self.recommend(node, other)
+        except Exception:   # noqa
+            return NOT_CREATED
+
+
+RECOMMEND_TABLE = RecommendTable()
+
+
+class PatternAccumulator:
+    """
+    Incrementally infer the narrowest translated pattern of a value stream.
+
+    Values are fed one at a time with `add`. The accumulator keeps the
+    current narrowest `TranslatedPattern` and only widens it when a new
+    value is not matched by the current pattern, by rebuilding it from
+    the values that caused it to widen. Values already absorbed are
+    never re-tested, so inferring the pattern of a column is O(rows) and
+    needs constant memory, which allows feeding very large outputs line
+    by line.
+
+    Parameters
+    ----------
+    *values : str
+        Optional initial values, added in order.
+
+    Attributes
+    ----------
+    node : TranslatedPattern or None
+        The current pattern, or None before the first value.
+    count : int
+        Number of values added.
+    witnesses : list of str
+        The values that caused the pattern to widen. The list only grows
+        when the pattern changes, so it stays small.
+
+    Notes
+    -----
+    - A widened pattern is rebuilt from the witnesses with
+      `do_factory_create`, so it is the pattern the factory selects for
+      them. `recommend` is not used, since it can return a broader class
+      than the factory, e.g. a non-whitespace class instead of the graph
+      class.
+    """
+    def __init__(self, *values):
+        self.node = None
+        self.count = 0
+        self.witnesses = []
+        for value in values:
+            self.add(value)
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def pattern(self):
+        """Return the regex pattern of the current node, or an empty string."""
+        return self.node.pattern if self.node is not None else STRING.EMPTY
+
+    def is_matched(self, value, node=None):
+        """
+        Check whether `value` is matched by the pattern of `node`.
+
+        Parameters
+        ----------
+        value : str
+            The value to test.
+        node : TranslatedPattern, optional
+            The node to test against. Defaults to the current node.
+
+        Returns
+        -------
+        bool
+            True if the whole value matches the node pattern.
+        """
+        node = self.node if node is None else node
+        if node is None:
+            return False
+        return bool(PATTERN_REGISTRY.get_matcher(node.pattern)(value))
+
+    def add(self, value):
+        """
+        Absorb a value and widen the current pattern if necessary.
+
+        Parameters
+        ----------
+        value : str
+            The value to absorb.
+
+        Returns
+        -------
+        TranslatedPattern
+            The current (possibly widened) pattern.
+
+        Raises
+        ------
+        RuntimeError
+            If no pattern can represent the absorbed values, a runtime
+            error is raised with the identifier "FactoryTranslatedPatternRTIssue".
+        """
+        value = str(value)
+        self.count += 1
+        if self.node is None:
+            self.node = TranslatedPattern.do_factory_create(value)
+            self.witnesses = [value]
+            return self.node
+
+        if self.is_matched(value):
+            return self.node
+
+        witnesses = self.witnesses + [value]
+        self.node = TranslatedPattern.do_factory_create(*witnesses)
+        self.witnesses = witnesses
+        return self.node
+
+    def extend(self, values):
+        """
+        Absorb every value of an iterable.
+
+        Parameters
+        ----------
+        values : iterable of str
+            Values to absorb, consumed lazily.
+
+        Returns
+        -------
+        TranslatedPattern or None
+            The current pattern, or None if no value was ever added.
+        """
+        for value in values:
+            self.add(value)
+        return self.node
@@ -24,6 +24,7 @@ from textfsmgen.deps import genericlib_PATTERN as PATTERN   # noqa
 from textfsmgen.deps import genericlib_text_module as text
 
 from textfsmgen.gp import LData, TranslatedPattern
+from textfsmgen.gp import NOT_CREATED
 from textfsmgen.exceptions import RuntimeException
 from textfsmgen.gpiterative import IterativeLinePattern
 
@@ -521,6 +522,35 @@ class CategoryLinePattern(BaseCategoryPattern):
 
         return left, separator, right
 
+    def get_category_pattern_issue(self) -> str:
+        """
+        Describe why the line is not a valid category pattern.
+
+        This is the non-raising check behind
+        `raise_exception_if_not_category_pattern`. It looks for the
+        separator, verifies that variable text exists before the separator,
+        and rejects unsupported formats such as time, IPv6, or MAC address
+        patterns.
+
+        Returns
+        -------
+        str
+            An error message, or an empty string if the line is a valid
+            category pattern.
+        """
+        if self.separator not in self.data:
+            return f"Data string does not contain the expected separator '{self.separator}'."
+
+        index = self.data.index(self.separator)
+        if index == NUMBER.ZERO:
+            return f"Data string is missing variable text before separator '{self.separator}'."
+
+        chk_word = self.get_word_by_pos(index)
+        if self.is_time_ipv6_or_mac_addr_format(chk_word):
+            return f"Unsupported variable text format detected: '{chk_word}'."
+
+        return STRING.EMPTY
+
     def raise_exception_if_not_category_pattern(self) -> None:
         """
         Validate that the line contains a valid category pattern.
@@ -539,22 +569,46 @@ class CategoryLinePattern(BaseCategoryPattern):
         RuntimeError
             If the variable text format is unsupported (time, IPv6, or MAC address).
         """
-        if self.separator not in self.data:
-            self.raise_runtime_error(
-                msg=f"Data string does not contain the expected separator '{self.separator}'."
-            )
+        err_msg = self.get_category_pattern_issue()
+        if err_msg:
+            self.raise_runtime_error(msg=err_msg)
 
-        index = self.data.index(self.separator)
-        if index == NUMBER.ZERO:
-            self.raise_runtime_error(
-                msg=f"Data string is missing variable text before separator '{self.separator}'."
-            )
+    @classmethod
+    def try_create(cls, line: str, count: int = 1, separator: str = ":"):
+        """
+        Non-raising counterpart of the `CategoryLinePattern` constructor.
 
-        chk_word = self.get_word_by_pos(index)
-        if self.is_time_ipv6_or_mac_addr_format(chk_word):
-            self.raise_runtime_error(
-                msg=f"Unsupported variable text format detected: '{chk_word}'."
-            )
+        The line is validated with `get_category_pattern_issue` before it
+        is parsed, so a line that is not in category format is rejected
+        without raising.
+
+        Parameters
+        ----------
+        line : str
+            The input line string to be parsed.
+        count : int, optional
+            Number of recursive parsing attempts. Defaults to 1.
+        separator : str, optional
+            Separator character used to split the line. Defaults to ':'.
+
+        Returns
+        -------
+        CategoryLinePattern or NotCreated
+            The parsed line pattern, or the `NOT_CREATED` sentinel if the
+            line cannot be parsed.
+        """
+        node = cls(line, count=NUMBER.ZERO, separator=separator)
+        if not count:
+            return node
+        if node.get_category_pattern_issue():
+            return NOT_CREATED
+
+        node.count = count
+        try:
+            node.process()
+        except Exception:   # noqa
+            return NOT_CREATED
+        return node
 
     @classmethod
     def is_time_or_ipv6_mac_format(cls, data: str) -> bool:
@@ -641,53 +695,55 @@ class CategoryLinePattern(BaseCategoryPattern):
         if not next_count or not self.right_data.strip():
             return self.right_data, STRING.EMPTY
 
-        try:
-            # Attempt recursive parsing
-            node = self(self.right_data, count=next_count,
-                        separator=self.separator)
+        # Attempt recursive parsing
+        node = self.try_create(self.right_data, count=next_count,
+                               separator=self.separator)
+        if node is not NOT_CREATED:
             left_data = node.left_data
             pat = at_least_one_spaces_pat if double_spaces in left_data else spaces_pat
 
             if blank_space in left_data:
-                val, remaining = re.split(pat, self.right_data, maxsplit=1)
-                return val, remaining
-            return STRING.EMPTY, self.right_data
-
-        except Exception:     # noqa
-            # Fallback parsing logic
-            items = re.split(spaces_pat, self.right_data)
-            lst: list[str] = []
-
-            for item in items:
-                is_separator = item == self.separator
-                is_valid = not self.is_time_ipv6_or_mac_addr_format(
-                    item) and item.endswith(self.separator)
-                lst.append(TextPattern(item))
-                if is_separator and is_valid:
-                    break
-
-            other_pat = spaces_pat.join(lst)
-            match = re.search(other_pat, self.right_data)
-            other_left = match.group()
-            other_remaining = self.right_data[len(other_left):]
-
-            if double_spaces in other_left:
-                other_first, other_last = re.split(at_least_one_spaces_pat,
-                                                   other_left, maxsplit=1)
-                return other_first, f"{other_last}{other_remaining}"
-
-            # Secondary fallback: stop at time/IPv6/MAC formats
-            lst.clear()
-            for item in items:
-                lst.append(item)
-                if self.is_time_ipv6_or_mac_addr_format(item):
-                    break
-
-            other_pat = spaces_pat.join(lst)
-            match = re.search(other_pat, self.right_data)
-            other_left = match.group()
-            other_remaining = self.right_data[len(other_left):]
-            return other_left, other_remaining
+                items = re.split(pat, self.right_data, maxsplit=1)
+                if len(items) == NUMBER.TWO:
+                    val, remaining = items
+                    return val, remaining
+            else:
+                return STRING.EMPTY, self.right_data
+
+        # Fallback parsing logic
+        items = re.split(spaces_pat, self.right_data)
+        lst: list[str] = []
+
+        for item in items:
+            is_separator = item == self.separator
+            is_valid = not self.is_time_ipv6_or_mac_addr_format(
+                item) and item.endswith(self.separator)
+            lst.append(TextPattern(item))
+            if is_separator and is_valid:
+                break
+
+        other_pat = spaces_pat.join(lst)
+        match = re.search(other_pat, self.right_data)
+        other_left = match.group()
+        other_remaining = self.right_data[len(other_left):]
+
+        if double_spaces in other_left:
+            other_first, other_last = re.split(at_least_one_spaces_pat,
+                                               other_left, maxsplit=1)
+            return other_first, f"{other_last}{other_remaining}"
+
+        # Secondary fallback: stop at time/IPv6/MAC formats
+        lst.clear()
+        for item in items:
+            lst.append(item)
+            if self.is_time_ipv6_or_mac_addr_format(item):
+                break
+
+        other_pat = spaces_pat.join(lst)
+        match = re.search(other_pat, self.right_data)
+        other_left = match.group()
+        other_remaining = self.right_data[len(other_left):]
+        return other_left, other_remaining
 
     def process(self) -> None:
         """
@@ -741,13 +797,10 @@ class CategoryLinePattern(BaseCategoryPattern):
 
         # Recursively parse remaining data if present
         if other_remaining:
-            try:
-                other_node = self(other_remaining, count=self.count - 1)
-                if other_node.parsed:
-                    self._lst.append(CategorySpacerPattern())
-                    self._lst.append(other_node)
-            except Exception:   # noqa
-                return
+            other_node = self.try_create(other_remaining, count=self.count - 1)
+            if other_node:
+                self._lst.append(CategorySpacerPattern())
+                self._lst.append(other_node)
 
 
 class CategoryLinesPattern(RuntimeException):
@@ -856,7 +909,8 @@ class CategoryLinesPattern(RuntimeException):
         -----
         - If `starting_from` and `ending_to` markers overlap or are invalid,
           `ending_to` is ignored.
-        - Errors during parsing fall back to storing the raw line.
+        - Lines rejected by `CategoryLinePattern.try_create` fall back to
+          storing the raw line.
         """
         self.index_a = get_line_position_by(self.lines, self.starting_from)
         self.index_b = get_line_position_by(self.lines, self.ending_to)
@@ -868,12 +922,9 @@ class CategoryLinesPattern(RuntimeException):
         lines = self.lines[start_index:self.index_b]
 
         for index, line in enumerate(lines):
-            try:
-                kwargs = self.options.get(str(index), self.kwargs)
-                node = CategoryLinePattern(line, **kwargs)
-                self._lst.append(node if node.parsed else line)
-            except Exception:  # noqa
-                self._lst.append(line)
+            kwargs = self.options.get(str(index), self.kwargs)
+            node = CategoryLinePattern.try_create(line, **kwargs)
+            self._lst.append(node if node else line)
 
     def raise_exception_if_not_category_format(self) -> None:
         """
@@ -174,11 +174,11 @@ def get_fixed_line_snippet(lines: list[str], line: str = "", index: int | None =
 
     # Tokenize and normalize numeric tokens
     tokens = Text(line.strip()).do_finditer_split(PATTERN.NON_WHITESPACES)
-    for i, token in enumerate(tokens):
-        if token.strip():
-            factory = TranslatedPattern.do_factory_create(token)
-            if factory.name in {"digit", "digits", "number", "mixed_number", "puncts"}:
-                tokens[i] = factory.get_template_snippet()
+    indices = [i for i, token in enumerate(tokens) if token.strip()]
+    factories = TranslatedPattern.classify_many(tokens[i] for i in indices)
+    for i, factory in zip(indices, factories):
+        if factory.name in {"digit", "digits", "number", "mixed_number", "puncts"}:
+            tokens[i] = factory.get_template_snippet()
 
     snippet_body = text.join_string(*tokens)
     leading = text.Line.get_leading(line)
@@ -39,6 +39,7 @@ from textfsmgen.deps import genericlib_Text as Text
 from textfsmgen.deps import genericlib_text_module as text
 
 from textfsmgen.gp import TranslatedPattern
+from textfsmgen.redos import make_safe_pattern
 from textfsmgen.exceptions import RuntimeException
 
 
@@ -932,6 +933,15 @@ class DiffLinePattern(RuntimeException):
         """
         return f"{self.leading_whitespace}{self._pattern}{self.trailing_whitespace}"
 
+    @property
+    def safe_pattern(self) -> str:
+        """
+        str: `pattern` rewritten with `make_safe_pattern`, so it cannot
+        backtrack catastrophically on long mismatching lines.
+        """
+        pattern = self.pattern
+        return make_safe_pattern(pattern) if pattern else pattern
+
     @property
     def snippet(self) -> str:
         """
@@ -192,9 +192,8 @@ class SnippetElement(RuntimeException):
                     lst.append(item)
 
         result: List[SnippetElement] = []
-        for index, item in enumerate(lst):
+        for index, pat_obj in enumerate(TranslatedPattern.classify_many(lst)):
             new_var_name = f"v{ref_index + index + 1}" if ref_index else f"{self.var_name}{index}"
-            pat_obj = TranslatedPattern.do_factory_create(item)
             sub_editable_snippet = pat_obj.get_readable_snippet(var=new_var_name)
             trailing = self.trailing if index == len(lst) - NUMBER.ONE else STRING.EMPTY
             result.append(self(sub_editable_snippet, trailing=trailing))
@@ -763,8 +762,8 @@ class IterativeLinePattern(LData):
         spaces = re.findall(PATTERN.WHITESPACES, self.data)
         parts: List[str] = []
 
-        for index, item in enumerate(re.split(PATTERN.WHITESPACES, self.data)):
-            node = TranslatedPattern.do_factory_create(item)
+        items = re.split(PATTERN.WHITESPACES, self.data)
+        for index, node in enumerate(TranslatedPattern.classify_many(items)):
             var_name = f"v{self.label}{index}"
             parts.append(node.get_readable_snippet(var=var_name))
             if index < len(spaces):
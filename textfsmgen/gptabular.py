@@ -55,6 +55,8 @@ from textfsmgen.deps import genericlib_text_module as text
 from textfsmgen.deps import genericlib_number_module as number
 
 from textfsmgen.gp import TranslatedPattern
+from textfsmgen.gp import NOT_CREATED
+from textfsmgen.redos import make_safe_pattern
 from textfsmgen.exceptions import RuntimeException
 
 from textfsmgen.gpcommon import get_line_position_by
@@ -176,9 +178,15 @@ class TabularTextPattern(RuntimeException):
         lines = self.lines[self.index_a:self.index_b]
         self.tabular_parser = TabularTextPatternByVarColumns(*lines, **self.kwargs)
 
-    def to_regex(self) -> str:
-        """Return a regex pattern generated from the parsed table."""
-        return self.tabular_parser.to_regex() if self else STRING.EMPTY
+    def to_regex(self, is_safe: bool = False) -> str:
+        """
+        Return a regex pattern generated from the parsed table.
+
+        If `is_safe` is True, the pattern is rewritten with
+        `make_safe_pattern` so it cannot backtrack catastrophically.
+        """
+        pattern = self.tabular_parser.to_regex() if self else STRING.EMPTY
+        return make_safe_pattern(pattern) if is_safe and pattern else pattern
 
     def to_template_snippet(self) -> str:
         """Return a template snippet generated from the parsed table."""
@@ -1062,6 +1070,7 @@ class TabularTable(RuntimeException):
         divider_leading_pat = f'{re.escape(self.divider)} *'
         divider_trailing_pat = f' *{re.escape(self.divider)}'
 
+        TabularColumn.do_translating_columns(self.columns)
         for column in self.columns:
             has_empty_cell = does_prev_col_has_empty_cell or column.has_empty_cell
             if self.is_divider:
@@ -1118,6 +1127,7 @@ class TabularTable(RuntimeException):
         if not self:
             return STRING.EMPTY
 
+        TabularColumn.do_translating_columns(self.columns)
         lst_of_snippet: List[str] = []
         headers_snippet = self.get_header_lines_snippet()
         if self.is_headers_row and headers_snippet:
@@ -1760,19 +1770,24 @@ class TabularRow(RuntimeException):
     # Reference row creation methods
     # -----------------------------
 
+    @classmethod
+    def get_ref_row_tokens_issue(cls, line: str, pattern: str, tokens: list[str]) -> str:
+        """Return an error message if no reference-row tokens were extracted."""
+        if tokens:
+            return STRING.EMPTY
+        return (
+            f"Parsing failed for {cls.__name__}.\n"
+            f"Pattern: {pattern!r}\n"
+            f"Line: {line!r}\n"
+            "Reason: no valid tokens were extracted."
+        )
+
     @classmethod
     def do_creating_ref_row(cls, line: str, pattern: str, tokens: list[str], aligned: bool = True) -> "TabularRow":
         """Create a reference row from parsed tokens."""
-        if not tokens:
-            RuntimeException.do_raise_runtime_error(
-                obj=f"{cls.__name__}RTError",
-                msg=(
-                    f"Parsing failed for {cls.__name__}.\n"
-                    f"Pattern: {pattern!r}\n"
-                    f"Line: {line!r}\n"
-                    "Reason: no valid tokens were extracted."
-                ),
-            )
+        err_msg = cls.get_ref_row_tokens_issue(line, pattern, tokens)
+        if err_msg:
+            RuntimeException.do_raise_runtime_error(obj=f"{cls.__name__}RTError", msg=err_msg)
 
         ref_row = cls(line, aligned=aligned)
         prev_right, cell = 0, None
@@ -1790,28 +1805,28 @@ class TabularRow(RuntimeException):
         return ref_row
 
     @classmethod
-    def do_creating_ref_row_by_findall(cls, line: str, pattern: str, columns_count: int = -1) -> "TabularRow":
-        """Create a reference row using regex findall."""
+    def get_ref_row_tokens_by_findall(cls, line: str, pattern: str,
+                                      columns_count: int = -1) -> tuple[list[str], str, bool, str]:
+        """Extract reference-row tokens using regex findall."""
         tokens = re.findall(pattern, line)
         total = len(tokens)
 
         if columns_count > 0 and columns_count != total:
-            RuntimeException.do_raise_runtime_error(
-                obj=f"{cls.__name__}RTError",
-                msg=(
-                    f"Column count mismatch in {cls.__name__}.\n"
-                    f"Parsed columns: {total} | Expected columns: {columns_count}\n"
-                    f"Pattern: {pattern!r}\n"
-                    f"Line: {line!r}\n"
-                    "Hint: Verify the input line matches the expected pattern structure."
-                ),
+            err_msg = (
+                f"Column count mismatch in {cls.__name__}.\n"
+                f"Parsed columns: {total} | Expected columns: {columns_count}\n"
+                f"Pattern: {pattern!r}\n"
+                f"Line: {line!r}\n"
+                "Hint: Verify the input line matches the expected pattern structure."
             )
+            return tokens, pattern, True, err_msg
 
-        return cls.do_creating_ref_row(line, pattern, tokens)
+        return tokens, pattern, True, cls.get_ref_row_tokens_issue(line, pattern, tokens)
 
     @classmethod
-    def do_creating_ref_row_by_splitting(cls, line: str, separator: str, columns_count: int = 1) -> "TabularRow":
-        """Create a reference row by splitting the line using a separator."""
+    def get_ref_row_tokens_by_splitting(cls, line: str, separator: str,
+                                        columns_count: int = 1) -> tuple[list[str], str, bool, str]:
+        """Extract reference-row tokens by splitting the line using a separator."""
         pattern = re.escape(separator)
         tokens = re.split(pattern, line)
         total = len(tokens)
@@ -1835,28 +1850,79 @@ class TabularRow(RuntimeException):
             total = len(tokens)
 
         if columns_count > 0 and columns_count != total:
-            RuntimeException.do_raise_runtime_error(
-                obj=f"{cls.__name__}RTError",
-                msg=(
-                    f"Column count mismatch in {cls.__name__}.\n"
-                    f"Parsed columns: {total}\n"
-                    f"Expected columns: {columns_count}\n"
-                    f"Pattern: {pattern!r}\n"
-                    f"Line: {line!r}\n"
-                    "Hint: Ensure the input line matches the expected pattern structure."
-                ),
+            err_msg = (
+                f"Column count mismatch in {cls.__name__}.\n"
+                f"Parsed columns: {total}\n"
+                f"Expected columns: {columns_count}\n"
+                f"Pattern: {pattern!r}\n"
+                f"Line: {line!r}\n"
+                "Hint: Ensure the input line matches the expected pattern structure."
             )
+            return tokens, pattern, False, err_msg
 
-        return cls.do_creating_ref_row(line, pattern, tokens, aligned=False)
+        return tokens, pattern, False, cls.get_ref_row_tokens_issue(line, pattern, tokens)
 
     @classmethod
-    def do_creating_ref_row_by_variable(cls, line: str, pattern: str) -> "TabularRow":
-        """Create a reference row using regex named groups (v000, v001, ...)."""
+    def get_ref_row_tokens_by_variable(cls, line: str, pattern: str) -> tuple[list[str], str, bool, str]:
+        """Extract reference-row tokens using regex named groups (v000, v001, ...)."""
         match = re.match(pattern, line)
         result = match.groupdict() if match else {}
         tokens = [result.get(f"v{i:03d}") for i in range(256) if f"v{i:03d}" in result]
 
-        return cls.do_creating_ref_row(line, pattern, tokens)
+        return tokens, pattern, True, cls.get_ref_row_tokens_issue(line, pattern, tokens)
+
+    @classmethod
+    def get_ref_row_tokens(cls, line: str, pattern: str, case: str = "",
+                           columns_count: int = -1) -> tuple[list[str], str, bool, str]:
+        """
+        Extract reference-row tokens without raising.
+
+        Parameters
+        ----------
+        line : str
+            Input line to parse.
+        pattern : str
+            Regex pattern or separator string.
+        case : str, optional
+            Parsing strategy: "findall", "variable", or "split".
+        columns_count : int, optional
+            Expected number of columns. Default is -1 (no check).
+
+        Returns
+        -------
+        tuple[list[str], str, bool, str]
+            The tokens, the effective pattern, the alignment flag, and an
+            error message which is empty when the tokens are usable.
+        """
+        if case == "findall":
+            return cls.get_ref_row_tokens_by_findall(line, pattern, columns_count)
+        elif case == "variable":
+            return cls.get_ref_row_tokens_by_variable(line, pattern)
+        elif case == "split":
+            return cls.get_ref_row_tokens_by_splitting(line, pattern, columns_count)
+        else:
+            err_msg = (
+                f"Unsupported case encountered in create_ref_row.\n"
+                f"Case value: {case!r}\n"
+                f"Class: {cls.__name__}\n"
+                "Hint: Verify that the provided case is valid and supported."
+            )
+            return [], pattern, True, err_msg
+
+    @classmethod
+    def do_creating_ref_row_by_findall(cls, line: str, pattern: str, columns_count: int = -1) -> "TabularRow":
+        """Create a reference row using regex findall."""
+        return cls.create_ref_row(line, pattern, case="findall", columns_count=columns_count)
+
+    @classmethod
+    def do_creating_ref_row_by_splitting(cls, line: str, separator: str, columns_count: int = 1) -> "TabularRow":
+        """Create a reference row by splitting the line using a separator."""
+        return cls.create_ref_row(line, separator, case="split", columns_count=columns_count)
+
+    @classmethod
+    def do_creating_ref_row_by_variable(cls, line: str, pattern: str) -> "TabularRow":
+        """Create a reference row using regex named groups (v000, v001, ...)."""
+        return cls.create_ref_row(line, pattern, case="variable")
 
     @classmethod
     def create_ref_row(cls, line: str, pattern: str, case: str = "", columns_count: int = -1) -> "TabularRow":
@@ -1884,23 +1950,32 @@ class TabularRow(RuntimeException):
         RuntimeError
             If the parsing strategy is unsupported or column count mismatches.
         """
-
-        if case == "findall":
-            return cls.do_creating_ref_row_by_findall(line, pattern, columns_count)
-        elif case == "variable":
-            return cls.do_creating_ref_row_by_variable(line, pattern)
-        elif case == "split":
-            return cls.do_creating_ref_row_by_splitting(line, pattern, columns_count)
-        else:
+        tokens, pattern, aligned, err_msg = cls.get_ref_row_tokens(
+            line, pattern, case=case, columns_count=columns_count
+        )
+        if err_msg:
             return RuntimeException.do_raise_runtime_error(
-                obj=f"{cls.__name__}RTError",
-                msg=(
-                    f"Unsupported case encountered in create_ref_row.\n"
-                    f"Case value: {case!r}\n"
-                    f"Class: {cls.__name__}\n"
-                    "Hint: Verify that the provided case is valid and supported."
-                ),
+                obj=f"{cls.__name__}RTError", msg=err_msg
             )
+        return cls.do_creating_ref_row(line, pattern, tokens, aligned=aligned)
+
+    @classmethod
+    def try_create_ref_row(cls, line: str, pattern: str, case: str = "", columns_count: int = -1):
+        """
+        Non-raising counterpart of `create_ref_row`.
+
+        Returns
+        -------
+        TabularRow or NotCreated
+            A reference row, or the `NOT_CREATED` sentinel if the line
+            cannot be parsed with the given strategy.
+        """
+        tokens, pattern, aligned, err_msg = cls.get_ref_row_tokens(
+            line, pattern, case=case, columns_count=columns_count
+        )
+        if err_msg:
+            return NOT_CREATED
+        return cls.do_creating_ref_row(line, pattern, tokens, aligned=aligned)
 
 
 class TabularColumn:
@@ -1955,6 +2030,8 @@ class TabularColumn:
         self.left_border = NUMBER.ZERO
         self.right_border = NUMBER.ZERO
         self._alignment = "left"
+        self._translated_texts = None
+        self._translated_pattern = None
 
     def __len__(self) -> int:
         """Return 1 if the column has cells, otherwise 0."""
@@ -2075,16 +2152,37 @@ class TabularColumn:
         alignment_map = {"11": "left", "10": "left", "01": "right", "00": "center"}
         self._alignment = alignment_map.get(key, "left")
 
+    def get_texts(self) -> List[str]:
+        """Return the non-empty cell texts and extra data used for translation."""
+        texts = [cell.text for cell in self.cells if cell.text]
+        if self.extra_data:
+            texts.extend(self.extra_data)
+        return texts
+
+    @property
+    def translated_pattern(self) -> TranslatedPattern:
+        """Return the translated pattern of the column texts (reused while texts are unchanged)."""
+        texts = tuple(self.get_texts())
+        if texts != self._translated_texts:
+            node, = TranslatedPattern.classify_many([texts])
+            self._translated_texts, self._translated_pattern = texts, node
+        return self._translated_pattern
+
+    @classmethod
+    def do_translating_columns(cls, columns: List["TabularColumn"]) -> None:
+        """Translate the texts of many columns with a single batch classification."""
+        columns = [column for column in columns if column]
+        groups = [tuple(column.get_texts()) for column in columns]
+        nodes = TranslatedPattern.classify_many(groups)
+        for column, texts, node in zip(columns, groups, nodes):
+            column._translated_texts, column._translated_pattern = texts, node
+
     def to_regex(self) -> str:
         """Generate a regex pattern for the column based on its cells."""
         if not self:
             return STRING.EMPTY
 
-        texts = [cell.text for cell in self.cells if cell.text]
-        if self.extra_data:
-            texts.extend(self.extra_data)
-
-        node = TranslatedPattern.do_factory_create(*texts)
+        node = self.translated_pattern
         pattern = node.get_regex_pattern(var=self.name)
 
         if node.is_group() and not self.is_last:
@@ -2109,11 +2207,7 @@ class TabularColumn:
         if not self:
             return STRING.EMPTY
 
-        texts = [cell.text for cell in self.cells if cell.text]
-        if self.extra_data:
-            texts.extend(self.extra_data)
-
-        node = TranslatedPattern.do_factory_create(*texts)
+        node = self.translated_pattern
         kwargs = {} if to_bared_snippet else {"var": self.name}
         snippet = node.get_template_snippet(**kwargs)
 
@@ -34,6 +34,7 @@ from textfsmgen.deps import genericlib_file_module as file
 
 from textfsmgen.application import Application
 from textfsmgen import TemplateBuilder
+from textfsmgen.core import get_corpus_report_json
 
 
 def run_gui_application(options):
@@ -233,6 +234,31 @@ class Cli:
             help="Run validation: compare test data against the generated template"
         )
 
+        parser.add_argument(
+            '--profile', action='store_true',
+            help="Profile the per-state and per-rule regex cost of a test run"
+        )
+
+        parser.add_argument(
+            '--corpus', type=str, default='',
+            help="Verify the template against capture files (directory or glob)"
+        )
+
+        parser.add_argument(
+            '--workers', type=int, default=0,
+            help="Number of worker processes for corpus verification"
+        )
+
+        parser.add_argument(
+            '--max-failures', type=int, default=None, dest='max_failures',
+            help="Stop corpus verification after this many failed files"
+        )
+
+        parser.add_argument(
+            '--json', action='store_true',
+            help="Print the corpus verification report as JSON"
+        )
+
         parser.add_argument(
             '-p', '--platform', type=str,
             choices=['unittest', 'pytest', 'snippet'],
@@ -493,7 +519,8 @@ class Cli:
                     expected_rows_count=self.kwargs.get('expected_rows_count', None),
                     expected_result=self.kwargs.get('expected_result', None),
                     tabular=self.kwargs.get('tabular', False),
-                    debug=True
+                    debug=True,
+                    profile=self.options.profile
                 )
                 factory.verify(**kwargs)
                 sys_exit(success=True)
@@ -504,6 +531,48 @@ class Cli:
                         f"template test from\n{self.options.user_data}"
                 )
 
+    def run_corpus_test(self):
+        """
+        Verify the generated TextFSM template against a corpus of captures.
+
+        This method builds the template from user data and runs
+        `TemplateBuilder.verify_corpus` over the files selected by the
+        `--corpus` flag, with the `--workers` and `--max-failures` flags.
+        The summary report is printed as text, or as JSON with `--json`.
+
+        Returns
+        -------
+        None
+            This function performs side effects (corpus verification and
+            process termination) but does not return a value.
+
+        Notes
+        -----
+        - Exits with success only if every capture is verified.
+        - Errors while building the template are reported with the input
+          data, as in `run_test`.
+        """
+        try:
+            factory = TemplateBuilder(
+                user_data=self.options.user_data,
+                **self.kwargs
+            )
+            report = factory.verify_corpus(
+                self.options.corpus,
+                workers=self.options.workers or None,
+                max_failures=self.options.max_failures,
+            )
+        except Exception as ex:
+            sys_exit(
+                success=False,
+                msg=f"*** {type(ex).__name__}: {ex}\n*** Failed to run "
+                    f"corpus test from\n{self.options.user_data}"
+            )
+        else:
+            is_success = report["files_count"] > 0 and not report["failures_count"]
+            msg = get_corpus_report_json(report) if self.options.json else factory.verified_message
+            sys_exit(success=is_success, msg=msg)
+
     def run(self):
         """
         Execute the main CLI workflow for the TextFSM Generator application.
@@ -519,12 +588,13 @@ class Cli:
         1. Display version information if the `--version` flag is set.
         2. Display dependency information if the `--dependency` flag is set.
         3. Validate CLI flags and required arguments.
-        4. If no test data is provided:
+        4. If a corpus is provided, verify the template against it.
+        5. If no test data is provided:
            - Generate a TextFSM template.
-        5. If test data is provided:
+        6. If test data is provided:
            - Run template verification tests.
            - Generate a test script for the selected platform.
-        6. Launch the GUI application if the `--gui` flag is set.
+        7. Launch the GUI application if the `--gui` flag is set.
 
         Returns
         -------
@@ -543,7 +613,9 @@ class Cli:
         show_dependency(self.options)
         run_gui_application(self.options)
         self.validate_cli_flags()
-        if not self.options.test_data:
+        if self.options.corpus:
+            self.run_corpus_test()
+        elif not self.options.test_data:
             self.build_template()
         else:
             self.run_test()
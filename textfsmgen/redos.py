@@ -0,0 +1,848 @@
+"""
+textfsmgen.redos
+================
+
+Detection and removal of catastrophic backtracking in generated regexes.
+
+The patterns emitted by `gp`, `gptabular` and `gpdiff` are built from
+pattern constants such as ``MIXED_WORD_GROUP`` or ``NUMBER``. Some of
+them contain quantified items that can split the same characters in
+more than one way. When the rest of a line fails to match, the
+backtracking `re` engine tries every split, which takes quadratic or
+exponential time on long malformed lines.
+
+Purpose
+-------
+- Flag the super-linear constructs of a regex or of a template
+  (`analyze_pattern`, `analyze_template`).
+- Emit an equivalent pattern without them (`make_safe_pattern`,
+  `make_safe_template`), using unambiguous rewrites and, on Python
+  3.11+, possessive quantifiers.
+
+Notes
+-----
+- Both work on the `sre_parse` tree, so they see the pattern that `re`
+  compiles and not its spelling.
+- Character sets are modeled on the Latin-1 range, and one placeholder
+  stands for every character above it. The model can only over-report
+  overlaps, so the analyzer may flag a construct that the rest of the
+  pattern makes harmless.
+- A rewrite is applied only when the rewritten pattern gives the same
+  matches and captures as the original.
+"""
+
+import re
+import sys
+from io import StringIO
+
+from textfsm import TextFSM
+
+try:
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:     # Python < 3.11
+    import sre_constants
+    import sre_parse
+
+HAS_POSSESSIVE = sys.version_info >= (3, 11)
+
+MAXREPEAT = sre_constants.MAXREPEAT
+ATOMIC_GROUP = getattr(sre_constants, "ATOMIC_GROUP", None)
+POSSESSIVE_REPEAT = getattr(sre_constants, "POSSESSIVE_REPEAT", None)
+
+REPEAT_OPCODES = tuple(
+    op for op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT, POSSESSIVE_REPEAT)
+    if op is not None
+)
+SINGLE_CHAR_OPCODES = (
+    sre_constants.LITERAL, sre_constants.NOT_LITERAL,
+    sre_constants.ANY, sre_constants.IN,
+)
+
+UNICODE_CHAR = 256      # placeholder for every character above Latin-1
+UNIVERSE = frozenset(range(UNICODE_CHAR + 1))
+EMPTY = frozenset()
+NEWLINE = frozenset([10])
+
+CATEGORY_PATTERNS = {
+    sre_constants.CATEGORY_DIGIT: r"\d",
+    sre_constants.CATEGORY_NOT_DIGIT: r"\D",
+    sre_constants.CATEGORY_SPACE: r"\s",
+    sre_constants.CATEGORY_NOT_SPACE: r"\S",
+    sre_constants.CATEGORY_WORD: r"\w",
+    sre_constants.CATEGORY_NOT_WORD: r"\W",
+}
+CATEGORY_CHARSETS = {
+    category: frozenset(
+        code for code in range(UNICODE_CHAR) if re.match(pattern, chr(code))
+    ) | {UNICODE_CHAR}
+    for category, pattern in CATEGORY_PATTERNS.items()
+}
+
+AT_PATTERNS = {
+    sre_constants.AT_BEGINNING: "^",
+    sre_constants.AT_BEGINNING_STRING: r"\A",
+    sre_constants.AT_BOUNDARY: r"\b",
+    sre_constants.AT_NON_BOUNDARY: r"\B",
+    sre_constants.AT_END: "$",
+    sre_constants.AT_END_STRING: r"\Z",
+}
+
+FLAG_LETTERS = (
+    (sre_constants.SRE_FLAG_IGNORECASE, "i"),
+    (sre_constants.SRE_FLAG_LOCALE, "L"),
+    (sre_constants.SRE_FLAG_MULTILINE, "m"),
+    (sre_constants.SRE_FLAG_DOTALL, "s"),
+    (sre_constants.SRE_FLAG_ASCII, "a"),
+)
+
+SPECIAL_CHARS = frozenset(".^$*+?{}[]\\|()")
+CLASS_SPECIAL_CHARS = frozenset("[]\\^-&~|")
+SEVERITIES = ("polynomial", "exponential")
+
+
+def fold_case(chars):
+    """Return a character set extended with the other case of each character."""
+    folded = set(chars) | {UNICODE_CHAR}
+    for code in chars:
+        if code < UNICODE_CHAR:
+            for char in (chr(code).lower(), chr(code).upper()):
+                folded.add(ord(char) if len(char) == 1 and ord(char) < UNICODE_CHAR
+                           else UNICODE_CHAR)
+    return frozenset(folded)
+
+
+def get_charset(op, av, flags=0):
+    """Return the characters matched by a single-character item."""
+    if op == sre_constants.LITERAL:
+        chars = frozenset([min(av, UNICODE_CHAR)])
+    elif op == sre_constants.NOT_LITERAL:
+        chars = UNIVERSE - {av} if av < UNICODE_CHAR else UNIVERSE
+    elif op == sre_constants.ANY:
+        chars = UNIVERSE if flags & sre_constants.SRE_FLAG_DOTALL else UNIVERSE - NEWLINE
+    else:
+        positive, is_negated = set(), False
+        for sub_op, sub_av in av:
+            if sub_op == sre_constants.NEGATE:
+                is_negated = True
+            elif sub_op == sre_constants.LITERAL:
+                positive.add(min(sub_av, UNICODE_CHAR))
+            elif sub_op == sre_constants.RANGE:
+                low, high = sub_av
+                positive.update(range(min(low, UNICODE_CHAR), min(high, UNICODE_CHAR - 1) + 1))
+                if high >= UNICODE_CHAR:
+                    positive.add(UNICODE_CHAR)
+            else:
+                positive |= CATEGORY_CHARSETS.get(sub_av, UNIVERSE)
+        chars = (UNIVERSE - positive) | {UNICODE_CHAR} if is_negated else frozenset(positive)
+    if flags & sre_constants.SRE_FLAG_IGNORECASE:
+        chars = fold_case(chars)
+    return chars
+
+
+def is_exact_charset(op, av, flags=0):
+    """Return True if `get_charset` gives exactly the characters of an item."""
+    if flags & sre_constants.SRE_FLAG_IGNORECASE:
+        return False
+    return UNICODE_CHAR not in get_charset(op, av, flags)
+
+
+def get_charset_items(chars):
+    """Return the `IN` items of a character class matching a character set."""
+    items, codes = [], sorted(chars)
+    start = 0
+    while start < len(codes):
+        end = start
+        while end + 1 < len(codes) and codes[end + 1] == codes[end] + 1:
+            end += 1
+        if end - start >= 2:
+            items.append((sre_constants.RANGE, (codes[start], codes[end])))
+        else:
+            items.extend((sre_constants.LITERAL, code) for code in codes[start:end + 1])
+        start = end + 1
+    return items
+
+
+def get_flags(flags, sub_flags):
+    """Return the flags inside a group with local flags `(add, delete)`."""
+    add_flags, del_flags = sub_flags
+    return (flags | add_flags) & ~del_flags
+
+
+def get_single_char_body(item):
+    """Return the only item of a repeat body if it matches one character."""
+    body = item[1][2]
+    if len(body) == 1 and body[0][0] in SINGLE_CHAR_OPCODES:
+        return body[0]
+    return None
+
+
+def get_chars(items, flags=0):
+    """Return every character that a sequence of items can consume."""
+    chars = set()
+    for op, av in items:
+        if op in SINGLE_CHAR_OPCODES:
+            chars |= get_charset(op, av, flags)
+        elif op == sre_constants.SUBPATTERN:
+            chars |= get_chars(av[3], get_flags(flags, av[1:3]))
+        elif op == ATOMIC_GROUP:
+            chars |= get_chars(av, flags)
+        elif op in REPEAT_OPCODES:
+            chars |= get_chars(av[2], flags)
+        elif op == sre_constants.BRANCH:
+            for alternative in av[1]:
+                chars |= get_chars(alternative, flags)
+        elif op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            continue
+        else:
+            chars |= UNIVERSE
+    return frozenset(chars)
+
+
+def get_edge(items, flags=0, is_last=False, is_follow=False):
+    """
+    Return the characters that can start (or end) a sequence of items.
+
+    Parameters
+    ----------
+    items : list
+        The parsed items of a sequence.
+    flags : int, optional
+        The `re` flags in effect.
+    is_last : bool, optional
+        If True, return the characters that can end the sequence.
+    is_follow : bool, optional
+        If True, model the zero-width items as constraints on the next
+        character (``$`` needs a newline, other assertions any
+        character), as needed to tell what can follow a quantifier.
+
+    Returns
+    -------
+    tuple
+        The character set, and whether the sequence can match empty.
+    """
+    chars = set()
+    for item in (reversed(items) if is_last else items):
+        item_chars, is_nullable = get_item_edge(item, flags, is_last, is_follow)
+        chars |= item_chars
+        if not is_nullable:
+            return frozenset(chars), False
+    return frozenset(chars), True
+
+
+def get_item_edge(item, flags=0, is_last=False, is_follow=False):
+    """Return the edge characters of one item (see `get_edge`)."""
+    op, av = item
+    if op in SINGLE_CHAR_OPCODES:
+        return get_charset(op, av, flags), False
+    if op == sre_constants.SUBPATTERN:
+        return get_edge(av[3], get_flags(flags, av[1:3]), is_last, is_follow)
+    if op == ATOMIC_GROUP:
+        return get_edge(av, flags, is_last, is_follow)
+    if op in REPEAT_OPCODES:
+        low, high, body = av
+        if high == 0:
+            return EMPTY, True
+        chars, is_nullable = get_edge(body, flags, is_last, is_follow)
+        return chars, is_nullable or low == 0
+    if op == sre_constants.BRANCH:
+        chars, is_nullable = set(), False
+        for alternative in av[1]:
+            alternative_chars, alternative_nullable = get_edge(
+                alternative, flags, is_last, is_follow
+            )
+            chars |= alternative_chars
+            is_nullable = is_nullable or alternative_nullable
+        return frozenset(chars), is_nullable
+    if op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+        if not is_follow or av == sre_constants.AT_END_STRING:
+            return EMPTY, True
+        if av == sre_constants.AT_END:
+            return NEWLINE, True
+    return UNIVERSE, True
+
+
+def get_group_names(state):
+    """Return a mapping of group numbers to group names."""
+    return {number: name for name, number in state.groupdict.items()}
+
+
+def format_char(code, is_in_class=False):
+    """Return the regex spelling of one character."""
+    char = chr(code)
+    if char.isalnum() and code < 128:
+        return char
+    if is_in_class:
+        if char in CLASS_SPECIAL_CHARS:
+            return f"\\{char}"
+        if code < 128 and char.isprintable():
+            return char
+    elif char in SPECIAL_CHARS:
+        return f"\\{char}"
+    elif char.isprintable() and code < 128:
+        return char
+    if code <= 0xff:
+        return f"\\x{code:02x}"
+    return f"\\u{code:04x}" if code <= 0xffff else f"\\U{code:08x}"
+
+
+def format_class(av):
+    """Return the regex spelling of a character class."""
+    if len(av) == 1 and av[0][0] == sre_constants.CATEGORY:
+        return CATEGORY_PATTERNS[av[0][1]]
+    parts = []
+    for op, sub_av in av:
+        if op == sre_constants.NEGATE:
+            parts.append("^")
+        elif op == sre_constants.LITERAL:
+            parts.append(format_char(sub_av, is_in_class=True))
+        elif op == sre_constants.RANGE:
+            low, high = sub_av
+            parts.append("-".join(
+                f"\\x{code:02x}" if code <= 0xff and not (chr(code).isalnum() and code < 128)
+                else format_char(code, is_in_class=True)
+                for code in (low, high)
+            ))
+        else:
+            parts.append(CATEGORY_PATTERNS[sub_av])
+    return f"[{''.join(parts)}]"
+
+
+def format_quantifier(op, low, high):
+    """Return the regex spelling of a quantifier."""
+    if (low, high) == (0, MAXREPEAT):
+        text = "*"
+    elif (low, high) == (1, MAXREPEAT):
+        text = "+"
+    elif (low, high) == (0, 1):
+        text = "?"
+    elif high == MAXREPEAT:
+        text = f"{{{low},}}"
+    elif low == high:
+        text = f"{{{low}}}"
+    else:
+        text = f"{{{low},{high}}}"
+    if op == sre_constants.MIN_REPEAT:
+        return f"{text}?"
+    if op == POSSESSIVE_REPEAT:
+        return f"{text}+"
+    return text
+
+
+def format_group_flags(add_flags, del_flags):
+    """Return the ``i-s`` flags spelling of a group."""
+    added = "".join(letter for flag, letter in FLAG_LETTERS if add_flags & flag)
+    deleted = "".join(letter for flag, letter in FLAG_LETTERS if del_flags & flag)
+    return f"{added}-{deleted}" if deleted else added
+
+
+def format_items(items, names=None):
+    """
+    Return the regex spelling of a sequence of parsed items.
+
+    Parameters
+    ----------
+    items : list
+        Parsed items, as found in `sre_parse.SubPattern.data`.
+    names : dict, optional
+        A mapping of group numbers to group names (`get_group_names`).
+
+    Returns
+    -------
+    str
+        A pattern that `re` parses to the same items.
+    """
+    names = names or {}
+    items = list(items)
+    return "".join(format_item(item, names, is_alone=len(items) == 1) for item in items)
+
+
+def format_item(item, names, is_alone=False):
+    """Return the regex spelling of one parsed item."""
+    op, av = item
+    if op == sre_constants.LITERAL:
+        return format_char(av)
+    if op == sre_constants.NOT_LITERAL:
+        return f"[^{format_char(av, is_in_class=True)}]"
+    if op == sre_constants.ANY:
+        return "."
+    if op == sre_constants.IN:
+        return format_class(av)
+    if op == sre_constants.AT:
+        return AT_PATTERNS[av]
+    if op == sre_constants.SUBPATTERN:
+        group, add_flags, del_flags, body = av
+        text = format_items(body, names)
+        if group is None:
+            return f"(?{format_group_flags(add_flags, del_flags)}:{text})"
+        name = names.get(group)
+        return f"(?P<{name}>{text})" if name else f"({text})"
+    if op == ATOMIC_GROUP:
+        return f"(?>{format_items(av, names)})"
+    if op in REPEAT_OPCODES:
+        low, high, body = av
+        body = list(body)
+        text = format_items(body, names)
+        if not (len(body) == 1 and body[0][0] in SINGLE_CHAR_OPCODES + (
+                sre_constants.SUBPATTERN, ATOMIC_GROUP, sre_constants.GROUPREF)):
+            text = f"(?:{text})"
+        return f"{text}{format_quantifier(op, low, high)}"
+    if op == sre_constants.BRANCH:
+        text = "|".join(format_items(alternative, names) for alternative in av[1])
+        return text if is_alone else f"(?:{text})"
+    if op == sre_constants.GROUPREF:
+        name = names.get(av)
+        return f"(?P={name})" if name else f"\\{av}"
+    if op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+        direction, body = av
+        prefix = "(?" + ("<" if direction < 0 else "")
+        prefix += "=" if op == sre_constants.ASSERT else "!"
+        return f"{prefix}{format_items(body, names)})"
+    if op == sre_constants.GROUPREF_EXISTS:
+        group, yes, no = av
+        condition = names.get(group, group)
+        text = format_items(yes, names)
+        if no is not None:
+            text = f"{text}|{format_items(no, names)}"
+        return f"(?({condition}){text})"
+    raise ValueError(f"unsupported regex item: {op}")
+
+
+def format_pattern(items, names=None, flags=0):
+    """Return the regex spelling of parsed items with global flags."""
+    letters = format_group_flags(flags, 0)
+    prefix = f"(?{letters})" if letters else ""
+    return f"{prefix}{format_items(items, names)}"
+
+
+class BacktrackingAnalyzer:
+    """
+    Find the constructs of a regex pattern that backtrack super-linearly.
+
+    Two quantified items are ambiguous when the characters between them
+    can be split between them in more than one way: the last characters
+    of the first one can also start the second one, and every item in
+    between can match those characters or nothing. The engine tries
+    each split when the rest of the pattern fails, so such a pair costs
+    polynomial time, and exponential time when it is repeated by an
+    unbounded quantifier.
+
+    Parameters
+    ----------
+    pattern : str
+        A regular expression.
+
+    Attributes
+    ----------
+    pattern : str
+        The analyzed pattern.
+    parsed : sre_parse.SubPattern
+        The parsed pattern.
+    findings : list of dict
+        The flagged constructs, each with `kind` (``overlapping_quantifiers``
+        or ``nested_quantifier``), `severity` (``polynomial`` or
+        ``exponential``), `fragment` and `message`.
+
+    Raises
+    ------
+    re.error
+        If the pattern is invalid.
+    """
+
+    def __init__(self, pattern: str) -> None:
+        self.pattern = pattern
+        self.parsed = sre_parse.parse(pattern)
+        self.names = get_group_names(self.parsed.state)
+        self.findings = []
+        self.analyze_sequence(self.parsed.data, self.parsed.state.flags)
+
+    @property
+    def severity(self) -> str:
+        """str: The worst severity of the findings, or an empty string."""
+        severities = [SEVERITIES.index(finding["severity"]) for finding in self.findings]
+        return SEVERITIES[max(severities)] if severities else ""
+
+    def is_elastic(self, item):
+        """Return True if an item matches a variable length and can give it back."""
+        op = item[0]
+        if op in (POSSESSIVE_REPEAT, ATOMIC_GROUP, sre_constants.AT,
+                  sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            return False
+        low, high = sre_parse.SubPattern(self.parsed.state, [item]).getwidth()
+        return low != high
+
+    def get_trade_chars(self, item, flags):
+        """Return the characters an item can hand over to a following item."""
+        chars, _ = get_item_edge(item, flags, is_last=True)
+        op, av = item
+        if op in REPEAT_OPCODES and av[1] > 1:
+            first_chars, _ = get_edge(av[2], flags)
+            chars |= first_chars
+        return chars
+
+    def add_finding(self, kind, severity, items):
+        """Record a finding unless the same fragment was already flagged."""
+        fragment = format_items(items, self.names)
+        for finding in self.findings:
+            if finding["fragment"] == fragment and finding["kind"] == kind:
+                if SEVERITIES.index(severity) > SEVERITIES.index(finding["severity"]):
+                    finding.update(severity=severity)
+                return
+        if kind == "nested_quantifier":
+            message = "quantified group whose iterations can split the same characters"
+        else:
+            message = "adjacent quantifiers can split the same characters"
+        self.findings.append(
+            dict(kind=kind, severity=severity, fragment=fragment,
+                 message=f"{message} in more than one way")
+        )
+
+    def iter_pairs(self, flat, junction=None):
+        """Yield the index pairs of ambiguous items of a flattened sequence."""
+        for index, (item, flags) in enumerate(flat):
+            if not self.is_elastic(item):
+                continue
+            trade_chars = self.get_trade_chars(item, flags)
+            for other_index in range(index + 1, len(flat)):
+                other, other_flags = flat[other_index]
+                between = flat[index + 1:other_index]
+                if between:
+                    last, last_flags = between[-1]
+                    if not (get_item_edge(last, last_flags)[1]
+                            or get_chars([last], last_flags) <= trade_chars):
+                        break
+                if junction is not None and not index < junction <= other_index:
+                    continue
+                if not self.is_elastic(other):
+                    continue
+                shared = trade_chars & get_item_edge(other, other_flags)[0]
+                if shared and all(
+                    get_item_edge(middle, middle_flags)[1]
+                    or get_chars([middle], middle_flags) <= shared
+                    for middle, middle_flags in between
+                ):
+                    yield index, other_index
+
+    def analyze_sequence(self, items, flags, severity=""):
+        """Analyze a sequence of items, then the sequences nested in it."""
+        flat = list(iter_flat_items(items, flags))
+        for index, other_index in self.iter_pairs(flat):
+            fragment = [item for item, _ in flat[index:other_index + 1]]
+            self.add_finding("overlapping_quantifiers", severity or "polynomial", fragment)
+
+        for item, item_flags in flat:
+            op, av = item
+            if op in REPEAT_OPCODES:
+                low, high, body = av
+                inner_severity = severity
+                if high > 1 and op != POSSESSIVE_REPEAT:
+                    is_unbounded = high == MAXREPEAT or severity == "exponential"
+                    inner_severity = "exponential" if is_unbounded else "polynomial"
+                    body_flat = list(iter_flat_items(body, item_flags))
+                    if any(self.iter_pairs(body_flat + body_flat, junction=len(body_flat))):
+                        self.add_finding("nested_quantifier", inner_severity, [item])
+                self.analyze_sequence(body, item_flags, inner_severity)
+            elif op == sre_constants.BRANCH:
+                for alternative in av[1]:
+                    self.analyze_sequence(alternative, item_flags, severity)
+            elif op == ATOMIC_GROUP:
+                self.analyze_sequence(av, item_flags, severity)
+            elif op in (sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+                self.analyze_sequence(av[1], item_flags, severity)
+
+
+def iter_flat_items(items, flags):
+    """Yield ``(item, flags)`` of a sequence with its groups inlined."""
+    for op, av in items:
+        if op == sre_constants.SUBPATTERN:
+            yield from iter_flat_items(av[3], get_flags(flags, av[1:3]))
+        else:
+            yield (op, av), flags
+
+
+class SafePatternEmitter:
+    """
+    Rewrite a regex pattern into an equivalent one that backtracks less.
+
+    Two unambiguous rewrites are applied on every Python version:
+
+    - ``X*LX*`` where the class ``L`` is a subset of ``X`` becomes
+      ``(X-L)*LX*`` (e.g. ``MIXED_WORD``), so the ``L`` character is the
+      first one of the word instead of any of them.
+    - ``X*O?X+`` where ``O`` and ``X`` are disjoint becomes
+      ``(?:X+(?:OX+)?|OX+)`` (e.g. ``NUMBER``), so the digits before and
+      after the optional separator cannot trade places.
+
+    On Python 3.11+, a greedy quantifier of a single character class
+    becomes possessive when no character of the class can start what
+    follows it, because giving characters back could never let the rest
+    of the pattern match.
+
+    Parameters
+    ----------
+    pattern : str
+        A regular expression.
+    is_complete : bool, optional
+        True if the pattern is matched on its own (``re.match``,
+        ``re.search`` or ``re.fullmatch``), so nothing follows its end.
+        False (default) if it is a fragment embedded in a larger pattern,
+        such as a Value regex or a named group of a line pattern.
+
+    Attributes
+    ----------
+    pattern : str
+        The original pattern.
+    safe_pattern : str
+        The rewritten pattern, or the original pattern if nothing was
+        rewritten.
+    rewrites : list of dict
+        The applied rewrites, each with `kind` (``unambiguous_prefix``,
+        ``optional_separator`` or ``possessive_quantifier``), `fragment`
+        and `replacement`.
+
+    Raises
+    ------
+    re.error
+        If the pattern is invalid.
+    """
+
+    def __init__(self, pattern: str, is_complete: bool = False) -> None:
+        self.pattern = pattern
+        self.is_complete = is_complete
+        self.parsed = sre_parse.parse(pattern)
+        self.names = get_group_names(self.parsed.state)
+        self.rewrites = []
+
+        flags = self.parsed.state.flags
+        follow = EMPTY if is_complete else UNIVERSE
+        items = self.rewrite_sequence(self.parsed.data, flags, follow)
+        self.safe_pattern = format_pattern(items, self.names, flags) if self.rewrites else pattern
+
+    def add_rewrite(self, kind, items, new_items):
+        """Record one rewrite."""
+        self.rewrites.append(
+            dict(kind=kind, fragment=format_items(items, self.names),
+                 replacement=format_items(new_items, self.names))
+        )
+
+    def get_unambiguous_prefix(self, items, flags):
+        """Return the ``(X-L)*`` item replacing ``X*`` in ``X*LX*``, or None."""
+        first, middle, last = items
+        if not all(op == sre_constants.MAX_REPEAT and av[:2] == (0, MAXREPEAT)
+                   for op, av in (first, last)):
+            return None
+        if middle[0] not in SINGLE_CHAR_OPCODES:
+            return None
+        body = get_single_char_body(first)
+        if not body or list(last[1][2]) != [body]:
+            return None
+        if not (is_exact_charset(*body, flags) and is_exact_charset(*middle, flags)):
+            return None
+        chars, middle_chars = get_charset(*body, flags), get_charset(*middle, flags)
+        if not middle_chars < chars:
+            return None
+        prefix_class = (sre_constants.IN, get_charset_items(chars - middle_chars))
+        return sre_constants.MAX_REPEAT, (0, MAXREPEAT, [prefix_class])
+
+    def get_separated_digits(self, items, flags):
+        """Return the item replacing ``X*O?X+``, or None."""
+        first, middle, last = items
+        shapes = [(0, MAXREPEAT), (0, 1), (1, MAXREPEAT)]
+        if not all(op == sre_constants.MAX_REPEAT and av[:2] == shape
+                   for (op, av), shape in zip(items, shapes)):
+            return None
+        body, separator = get_single_char_body(first), get_single_char_body(middle)
+        if not body or not separator or list(last[1][2]) != [body]:
+            return None
+        if get_charset(*body, flags) & get_charset(*separator, flags):
+            return None
+        one_or_more = (sre_constants.MAX_REPEAT, (1, MAXREPEAT, [body]))
+        optional_tail = (sre_constants.MAX_REPEAT, (0, 1, [separator, one_or_more]))
+        branch = (sre_constants.BRANCH, (None, [[one_or_more, optional_tail],
+                                                [separator, one_or_more]]))
+        return sre_constants.SUBPATTERN, (None, 0, 0, [branch])
+
+    def rewrite_ambiguous_runs(self, items, flags):
+        """Apply the unambiguous rewrites to a sequence of items."""
+        items, index = list(items), 0
+        while index + 3 <= len(items):
+            window = items[index:index + 3]
+            prefix = self.get_unambiguous_prefix(window, flags)
+            if prefix:
+                self.add_rewrite("unambiguous_prefix", window[:1], [prefix])
+                items[index] = prefix
+            else:
+                grouped = self.get_separated_digits(window, flags)
+                if grouped:
+                    self.add_rewrite("optional_separator", window, [grouped])
+                    items[index:index + 3] = [grouped]
+            index += 1
+        return items
+
+    def rewrite_sequence(self, items, flags, follow):
+        """
+        Rewrite a sequence of items followed by characters `follow`.
+
+        Parameters
+        ----------
+        items : list
+            Parsed items of a sequence.
+        flags : int
+            The `re` flags in effect.
+        follow : frozenset
+            The characters that can come right after the sequence, where
+            the pattern may still backtrack into it.
+
+        Returns
+        -------
+        list
+            The rewritten items.
+        """
+        items = self.rewrite_ambiguous_runs(items, flags)
+        follows, next_chars = [], follow
+        for item in reversed(items):
+            follows.append(next_chars)
+            chars, is_nullable = get_item_edge(item, flags, is_follow=True)
+            next_chars = chars | next_chars if is_nullable else chars
+        follows.reverse()
+
+        return [self.rewrite_item(item, flags, item_follow)
+                for item, item_follow in zip(items, follows)]
+
+    def rewrite_item(self, item, flags, follow):
+        """Rewrite one item followed by characters `follow`."""
+        op, av = item
+        if op == sre_constants.SUBPATTERN:
+            group, add_flags, del_flags, body = av
+            body = self.rewrite_sequence(body, get_flags(flags, (add_flags, del_flags)), follow)
+            return op, (group, add_flags, del_flags, body)
+        if op == ATOMIC_GROUP:
+            return op, self.rewrite_sequence(av, flags, EMPTY)
+        if op == sre_constants.BRANCH:
+            return op, (av[0], [self.rewrite_sequence(alternative, flags, follow)
+                                for alternative in av[1]])
+        if op not in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+            return item
+
+        low, high, body = av
+        single = get_single_char_body(item)
+        if single:
+            if (HAS_POSSESSIVE and op == sre_constants.MAX_REPEAT and low < high
+                    and not get_charset(*single, flags) & follow):
+                new_item = POSSESSIVE_REPEAT, av
+                self.add_rewrite("possessive_quantifier", [item], [new_item])
+                return new_item
+            return item
+
+        if high > 1:
+            first_chars, _ = get_edge(body, flags, is_follow=True)
+            follow = follow | first_chars
+        return op, (low, high, self.rewrite_sequence(body, flags, follow))
+
+
+def analyze_pattern(pattern: str) -> list:
+    """
+    Return the super-linear backtracking constructs of a regex pattern.
+
+    Parameters
+    ----------
+    pattern : str
+        A regular expression, such as the output of
+        `TranslatedPattern.get_regex_pattern`, `TabularTextPattern.to_regex`
+        or `DiffLinePattern.pattern`.
+
+    Returns
+    -------
+    list of dict
+        The findings of `BacktrackingAnalyzer`, empty if the pattern
+        matches in linear time.
+    """
+    return BacktrackingAnalyzer(pattern).findings
+
+
+def make_safe_pattern(pattern: str, is_complete: bool = False) -> str:
+    """
+    Return an equivalent regex pattern that backtracks less.
+
+    Parameters
+    ----------
+    pattern : str
+        A regular expression.
+    is_complete : bool, optional
+        True if nothing follows the pattern when it is matched
+        (see `SafePatternEmitter`). Default is False.
+
+    Returns
+    -------
+    str
+        The rewritten pattern, or `pattern` if nothing was rewritten.
+    """
+    return SafePatternEmitter(pattern, is_complete=is_complete).safe_pattern
+
+
+def analyze_template(template: str) -> list:
+    """
+    Return the super-linear backtracking constructs of a TextFSM template.
+
+    Every rule is analyzed with its Value regexes substituted, as TextFSM
+    matches it against a line.
+
+    Parameters
+    ----------
+    template : str
+        A TextFSM template.
+
+    Returns
+    -------
+    list of dict
+        The findings of `analyze_pattern`, each with the `state`, the
+        template `line_num` and the `rule` text it was found in.
+
+    Raises
+    ------
+    textfsm.TextFSMTemplateError
+        If the template is invalid.
+    """
+    parser = TextFSM(StringIO(template))
+    findings = []
+    for state_name, rules in parser.states.items():
+        for rule in rules:
+            for finding in analyze_pattern(rule.regex):
+                findings.append(dict(finding, state=state_name,
+                                     line_num=rule.line_num, rule=rule.match))
+    return findings
+
+
+def make_safe_template(template: str) -> str:
+    """
+    Return a TextFSM template with its Value regexes made safe.
+
+    The Value regexes are rewritten with `make_safe_pattern` as fragments,
+    since the rules decide what follows them. Rule lines are unchanged.
+
+    Parameters
+    ----------
+    template : str
+        A TextFSM template.
+
+    Returns
+    -------
+    str
+        The template with its Value regexes rewritten.
+
+    Raises
+    ------
+    textfsm.TextFSMTemplateError
+        If the template is invalid.
+    """
+    values = iter(TextFSM(StringIO(template)).values)
+    lines = []
+    for line in template.splitlines(keepends=True):
+        content = line.rstrip("\r\n")
+        if content.startswith("Value "):
+            regex = next(values).regex
+            safe_regex = make_safe_pattern(regex)
+            if content.endswith(regex) and safe_regex != regex:
+                line = f"{content[:-len(regex)]}{safe_regex}{line[len(content):]}"
+        lines.append(line)
+    return "".join(lines)
@@ -12,6 +12,7 @@ to expected formats, improving reliability and maintainability.
 
 
 from textfsmgen import TemplateBuilder
+from textfsmgen.core import run_in_executor
 
 
 def verify(
@@ -63,3 +64,61 @@ def verify(
         ignore_space=ignore_space,
     )
     return is_verified
+
+
+async def averify(
+    template_snippet: str,
+    test_data: str,
+    expected_rows_count: int | None = None,
+    expected_result: list[dict] | None = None,
+    ignore_space: bool = True,
+    executor=None,
+    semaphore=None,
+) -> bool:
+    """
+    Asynchronous counterpart of `verify`.
+
+    The template is built and verified by `run_in_executor`, so the event
+    loop stays responsive while the test data is parsed.
+
+    Parameters
+    ----------
+    template_snippet : str
+        Raw user data snippet to be converted into a TextFSM template.
+    test_data : str
+        Input text data to be parsed by the template.
+    expected_rows_count : int, optional
+        Expected number of parsed rows.
+    expected_result : list of dict, optional
+        Expected parsed result.
+    ignore_space : bool, default=True
+        If True, strip leading and trailing spaces from parsed data before
+        comparison.
+    executor : concurrent.futures.Executor, optional
+        Executor running the verification. Defaults to the loop's default
+        executor.
+    semaphore : asyncio.Semaphore, optional
+        Semaphore limiting the number of concurrent verifications.
+
+    Returns
+    -------
+    bool
+        True if verification succeeds, False otherwise.
+
+    Raises
+    ------
+    TemplateBuilderError
+        Raised if an exception occurs during parsing or verification.
+    TemplateBuilderInvalidFormat
+        Raised if the provided snippet has an invalid format.
+    """
+    return await run_in_executor(
+        verify,
+        template_snippet,
+        test_data,
+        expected_rows_count=expected_rows_count,
+        expected_result=expected_result,
+        ignore_space=ignore_space,
+        executor=executor,
+        semaphore=semaphore,
+    )